@@ -0,0 +1,54 @@
+"""
+🎧 PPE Compliance Monitor - Raspberry Pi 5 + Hailo AI headphones detection
+
+Importable components of the monitoring system. Importing the package is
+cheap: OpenCV, NumPy, requests and the Hailo/PiCamera2 SDKs are only loaded
+when the submodule that needs them is first used, and nothing (logging,
+network, camera, device) is initialized until explicitly asked for.
+
+    from ppe_monitor import HailoInference          # loads inference + NumPy/OpenCV
+    from ppe_monitor.postprocess import apply_nms   # NMS only
+"""
+
+import importlib
+
+__version__ = "2.2.0"
+
+# Public name -> submodule that defines it (resolved lazily on first access)
+_LAZY_EXPORTS = {
+    "Config": "config",
+    "ConnectivityProber": "network",
+    "LinkMonitor": "network",
+    "NetworkStateCache": "network",
+    "WiFiManager": "network",
+    "get_wifi_manager": "network",
+    "DiscordNotifier": "notifications",
+    "HailoInference": "inference",
+    "CameraSystem": "camera",
+    "SafetyMonitoringSystem": "system",
+    "StartupOrchestrator": "startup",
+    "Instrumentation": "instrumentation",
+    "FrameTimeline": "instrumentation",
+    "get_instrumentation": "instrumentation",
+    "MetricsExporter": "metrics",
+    "setup_logging": "logging_setup",
+    "preflight_dependencies": "deps",
+    "install_packages": "deps",
+    "main": "app",
+    "run": "cli",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
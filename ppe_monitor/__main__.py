@@ -0,0 +1,7 @@
+"""Allow `python -m ppe_monitor`"""
+
+import sys
+
+from .cli import run
+
+sys.exit(run())
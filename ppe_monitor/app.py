@@ -0,0 +1,212 @@
+"""🚀 Application entry point: preflight, logging, startup banner and main loop"""
+
+import sys
+import signal
+import logging
+import traceback
+from pathlib import Path
+
+from .config import Config
+from . import hardware
+from .network import get_wifi_manager
+from .instrumentation import get_instrumentation
+from .metrics import MetricsExporter
+from .startup import StartupOrchestrator, register_network_startup_tasks
+from .system import SafetyMonitoringSystem
+
+logger = logging.getLogger('HailoAI')
+
+
+def check_system_requirements():
+    """Check system requirements and show warnings if needed"""
+    logger.info("🔍 Checking system requirements...")
+    
+    warnings = []
+    
+    # Check HEF file
+    if not Path(Config.HEF_PATH).exists() and not Config.MOCK_HAILO:
+        warnings.append(f"HEF file not found: {Config.HEF_PATH} (will use CPU fallback)")
+    
+    # Check available memory
+    try:
+        import psutil
+        available_mem = psutil.virtual_memory().available // (1024**2)  # MB
+        if available_mem < 1000:  # Less than 1GB
+            warnings.append(f"Low memory detected: {available_mem}MB available")
+    except ImportError:
+        pass
+    
+    # Check disk space
+    try:
+        import shutil
+        free_space = shutil.disk_usage('.').free // (1024**3)  # GB
+        if free_space < 2:
+            warnings.append(f"Low disk space: {free_space}GB free")
+    except:
+        pass
+    
+    if warnings:
+        logger.warning("⚠️  System warnings:")
+        for warning in warnings:
+            logger.warning(f"   • {warning}")
+    else:
+        logger.info("✅ System requirements check passed")
+    
+    return len(warnings) == 0
+
+def show_startup_banner():
+    """Show enhanced startup banner with Wi-Fi info"""
+    banner = f"""
+┌{'─' * 58}┐
+│{' ' * 58}│
+│  🎧 HAILO AI PPE COMPLIANCE MONITOR v2.2   │
+│{' ' * 58}│
+│  💻 Raspberry Pi 5 + Hailo AI TOP13 + Camera   │
+│  🛡️ Headphone PPE Compliance Detection         │
+│  📶 5GHz Wi-Fi Support + IP Notifications      │
+│{' ' * 58}│
+└{'─' * 58}┘
+"""
+    print(banner)
+    
+    # Show Network Configuration
+    print("📶 Network Configuration:")
+    if Config.PREFER_ETHERNET:
+        print("   🔗 Priority: Ethernet -> Wi-Fi -> Auto-scan")
+    else:
+        print("   🔗 Priority: Wi-Fi -> Auto-scan")
+    print(f"   📡 Wi-Fi Target: {Config.WIFI_SSID}")
+    print(f"   🌍 Country Code: {Config.WIFI_COUNTRY}")
+    print(f"   ⚡ 5GHz Support: {'✅ Enabled' if Config.ENABLE_WIFI_5GHZ else '❌ Disabled'}")
+    print(f"   🔄 Auto-scan: Every {Config.NETWORK_SCAN_INTERVAL} seconds")
+    
+    # Connection is established in the background by the startup orchestrator
+    print("   ⏳ Connection: checking in background (see log for status)")
+    print()
+    
+    # Show compatibility info
+    print("🔧 System Compatibility:")
+    print(f"   🐍 Python: {sys.version.split()[0]}")
+    print(f"   💻 Platform: {sys.platform}")
+    if hardware.picamera_available():
+        print("   📷 PiCamera2: ✅ Available")
+    else:
+        print("   📷 PiCamera2: ❌ Not Available (will use USB/Simulation)")
+    
+    if hardware.hailo_available():
+        print("   🤖 Hailo AI: ✅ Available") 
+    else:
+        print("   🤖 Hailo AI: ❌ Not Available (will use CPU Fallback)")
+    
+    if Config.HEADLESS_MODE:
+        print("   🖥️  Display Mode: 🚫 Headless (no GUI)")
+    else:
+        print("   🖥️  Display Mode: ✅ GUI Enabled")
+    
+    print()
+    
+    if not hardware.picamera_available():
+        print("💡 PiCamera2 Troubleshooting:")
+        print("   1. sudo apt update && sudo apt install -y python3-picamera2")
+        print("   2. sudo raspi-config -> Interface Options -> Camera -> Enable")
+        print("   3. Reboot: sudo reboot")
+        print("   4. Check camera: libcamera-still -o test.jpg")
+        print()
+
+def main():
+    """Enhanced main function with comprehensive startup flow"""
+    try:
+        # Show startup banner
+        show_startup_banner()
+        
+        # Check system requirements
+        requirements_ok = check_system_requirements()
+        
+        logger.info("🎆 System Configuration:")
+        logger.info(f"   📏 Resolution: {Config.CAMERA_WIDTH}x{Config.CAMERA_HEIGHT}")
+        logger.info(f"   ⚡ Confidence: {Config.CONFIDENCE_THRESHOLD:.1%}")
+        logger.info(f"   🔔 Discord: {'Enabled' if Config.DISCORD_WEBHOOK else 'Disabled'}")
+        logger.info(f"   💾 Model: {Config.HEF_PATH}")
+        logger.info(f"   🔄 Cooldown: {Config.NOTIFICATION_COOLDOWN}s")
+        
+        # Bring up camera, model, network and Tailscale concurrently
+        logger.info("\n🚀 Initializing safety monitoring system...")
+        detection_system = SafetyMonitoringSystem()
+        orchestrator = StartupOrchestrator()
+        detection_system.register_startup_tasks(orchestrator)
+        register_network_startup_tasks(orchestrator)
+        orchestrator.start()
+        
+        # Detection only needs camera + model (critical phases); network phases keep running in the background
+        if not orchestrator.wait_for_critical():
+            logger.error("❌ Failed to initialize detection system")
+            logger.error("Please check the logs above for specific error details")
+            orchestrator.log_timings()
+            return 1
+        
+        detection_system.log_initialization_summary()
+        logger.info(f"⚠️ Safety monitoring system ready after {orchestrator.elapsed():.2f}s! Starting PPE compliance monitoring...")
+        if Config.HEADLESS_MODE:
+            logger.info("🛡️ Running safety monitoring - evidence images will be saved")
+            logger.info("⚡ Use Ctrl+C to stop monitoring")
+        else:
+            logger.info("📹 Monitoring live feed - 'q' to quit, 's' for statistics")
+        
+        # Log the full phase breakdown once the background phases finish
+        orchestrator.log_timings_when_complete()
+        
+        # Expose counters and latency histograms for Prometheus
+        metrics_exporter = None
+        if Config.ENABLE_METRICS:
+            metrics_exporter = MetricsExporter(detection_system)
+            if not metrics_exporter.start():
+                metrics_exporter = None
+        
+        # Run the detection system
+        try:
+            detection_system.run()
+        finally:
+            if metrics_exporter:
+                metrics_exporter.stop()
+        
+        return 0
+        
+    except KeyboardInterrupt:
+        logger.info("⚡ Startup interrupted by user")
+        # Clean up network monitoring
+        wifi_manager = get_wifi_manager()
+        if wifi_manager.monitoring_active:
+            wifi_manager.stop_network_monitoring()
+        return 130
+    except Exception as e:
+        logger.error(f"💥 Fatal error during startup: {e}")
+        logger.error(f"📋 Full traceback: {traceback.format_exc()}")
+        return 1
+
+
+def signal_handler(sig, frame):
+    """Graceful shutdown on SIGINT/SIGTERM"""
+    if Config.HEADLESS_MODE:
+        logger.info(f"\n⚡ Received signal {sig} in headless mode, initiating graceful shutdown...")
+    else:
+        logger.info(f"\n⚡ Received signal {sig}, initiating graceful shutdown...")
+    
+    # Clean up network monitoring
+    try:
+        wifi_manager = get_wifi_manager()
+        if wifi_manager.monitoring_active:
+            logger.info("🔌 Stopping network monitoring...")
+            wifi_manager.stop_network_monitoring()
+    except:
+        pass
+    
+    sys.exit(0)
+
+
+def trace_signal_handler(sig, frame):
+    """Start a Chrome trace of the next frames on SIGUSR1
+    
+    Only flags the request: the handler runs on the main thread between bytecodes,
+    possibly while the frame loop holds the instrumentation lock.
+    """
+    get_instrumentation().request_trace()
@@ -0,0 +1,74 @@
+"""🧑‍🤝‍🧑 Per-person PPE association: ears and headphones assigned to person boxes in one vectorized pass"""
+
+import logging
+from typing import Dict, List, Any
+
+import numpy as np
+
+from .config import Config
+
+logger = logging.getLogger('HailoAI')
+
+EAR_CLASSES = ("left_ear", "right_ear")
+
+
+def boxes_of(detections: List[Dict]) -> np.ndarray:
+    """(N, 4) float32 x1, y1, x2, y2 array of detection boxes"""
+    return np.array([d['bbox'] for d in detections], dtype=np.float32).reshape(-1, 4)
+
+
+def head_regions(people: np.ndarray) -> np.ndarray:
+    """Head band of each person box: the top ASSOCIATION_HEAD_FRACTION, widened by ASSOCIATION_HEAD_MARGIN per side"""
+    width = people[:, 2] - people[:, 0]
+    height = people[:, 3] - people[:, 1]
+    margin = width * Config.ASSOCIATION_HEAD_MARGIN
+    return np.stack([people[:, 0] - margin,
+                     people[:, 1] - height * Config.ASSOCIATION_HEAD_MARGIN / 2,
+                     people[:, 2] + margin,
+                     people[:, 1] + height * Config.ASSOCIATION_HEAD_FRACTION], axis=1)
+
+
+def containment_matrix(parts: np.ndarray, regions: np.ndarray) -> np.ndarray:
+    """Fraction of each part box inside each region: (M, 4) x (N, 4) -> (M, N)"""
+    top_left = np.maximum(parts[:, None, :2], regions[None, :, :2])
+    bottom_right = np.minimum(parts[:, None, 2:], regions[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area = np.prod(parts[:, 2:] - parts[:, :2], axis=1)[:, None]
+    return np.divide(intersection, area, out=np.zeros_like(intersection), where=area > 0)
+
+
+def assign(parts: List[Dict], regions: np.ndarray) -> np.ndarray:
+    """Index of the region holding most of each part, or -1 below ASSOCIATION_MIN_CONTAINMENT"""
+    if not parts or len(regions) == 0:
+        return np.full(len(parts), -1, dtype=np.int64)
+    containment = containment_matrix(boxes_of(parts), regions)
+    owner = containment.argmax(axis=1)
+    owner[containment[np.arange(len(parts)), owner] < Config.ASSOCIATION_MIN_CONTAINMENT] = -1
+    return owner
+
+
+def associate(people: List[Dict], headphones: List[Dict], ears: List[Dict]) -> Dict[str, Any]:
+    """Per-person headphones/ears and compliance, plus the parts no person claimed"""
+    regions = head_regions(boxes_of(people))
+    headphone_owner = assign(headphones, regions)
+    ear_owner = assign(ears, regions)
+    
+    persons = [{"person": person, "headphones": [], "ears": []} for person in people]
+    for detection, owner in zip(headphones, headphone_owner):
+        if owner >= 0:
+            persons[owner]["headphones"].append(detection)
+    for detection, owner in zip(ears, ear_owner):
+        if owner >= 0:
+            persons[owner]["ears"].append(detection)
+    for entry in persons:
+        entry["compliant"] = bool(entry["headphones"])
+    
+    # Ears without a person still count unless a (personless) headphone box covers them
+    loose_headphones = [d for d, owner in zip(headphones, headphone_owner) if owner < 0]
+    loose_ears = [d for d, owner in zip(ears, ear_owner) if owner < 0]
+    covered = assign(loose_ears, boxes_of(loose_headphones)) >= 0
+    return {
+        "persons": persons,
+        "unassigned_headphones": loose_headphones,
+        "unassigned_ears": [d for d, is_covered in zip(loose_ears, covered) if not is_covered]
+    }
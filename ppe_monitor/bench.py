@@ -0,0 +1,361 @@
+"""🏁 Offline end-to-end benchmark: the full SafetyMonitoringSystem pipeline over dataset images"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Any
+
+import cv2
+import numpy as np
+
+from . import __version__
+from .config import Config
+from .camera import CameraSystem
+from .dataset import split_image_paths
+from .dataset_cache import DatasetCache
+from .inference import HailoInference, CpuModelInference
+from .instrumentation import get_instrumentation
+from .notifications import DiscordNotifier
+from .system import SafetyMonitoringSystem
+
+logger = logging.getLogger('HailoAI')
+
+BACKENDS = ("hailo", "cpu", "haar")
+
+# Result fields compared against the baseline: (path, higher_is_better)
+COMPARED_FIELDS = [
+    (("fps",), True),
+    (("stages", "frame", "p50_ms"), False),
+    (("stages", "frame", "p95_ms"), False),
+    (("stages", "frame", "p99_ms"), False),
+    (("peak_rss_mb",), False),
+    (("cpu_percent",), False),
+]
+
+
+class DatasetCamera(CameraSystem):
+    """Camera source that replays dataset images (decoded up front unless preload is off)"""
+    
+    def __init__(self, image_paths: List[Path], preload: bool = True, frames: Optional[Sequence[np.ndarray]] = None):
+        super().__init__()
+        self.image_paths = image_paths
+        self.preload = preload or frames is not None
+        self.frames = frames if frames is not None else []
+        self.position = 0
+    
+    def initialize(self) -> bool:
+        """Decode the images once so capture cost is not dominated by JPEG decoding"""
+        self.camera_type = "dataset"
+        if self.frames:
+            return True  # memory-mapped cache views, nothing to decode
+        if self.preload:
+            self.frames = [frame for frame in (cv2.imread(str(p)) for p in self.image_paths) if frame is not None]
+            logger.info(f"🗂️ Preloaded {len(self.frames)} dataset images")
+            return len(self.frames) > 0
+        return len(self.image_paths) > 0
+    
+    def capture_frame(self) -> Optional[np.ndarray]:
+        """Next dataset image (wraps around)"""
+        if self.preload:
+            # Fresh buffer per frame like a real camera - the pipeline draws on frames in place
+            frame = np.array(self.frames[self.position % len(self.frames)])
+        else:
+            frame = cv2.imread(str(self.image_paths[self.position % len(self.image_paths)]))
+        self.last_capture_ns = time.perf_counter_ns()
+        self.position += 1
+        self.frame_count += 1
+        return frame
+    
+    def cleanup(self):
+        self.frames = []
+
+
+class StubNotifier(DiscordNotifier):
+    """DiscordNotifier with the cooldown bookkeeping but no HTTP requests"""
+    
+    def __init__(self, cooldown: Optional[float] = None):
+        super().__init__("stub://benchmark")
+        if cooldown is not None:
+            self.cooldown_period = cooldown
+            self.image_cooldown = min(self.image_cooldown, cooldown)
+        self.image_bytes_sent = 0
+    
+    def send_notification(self, message: str, detection_count: int,
+                          additional_info: Optional[Dict] = None, image_bytes: Optional[bytes] = None,
+                          image_name: Optional[str] = None, evidence=None) -> bool:
+        current_time = time.time()
+        if not self.admits(current_time):
+            if evidence is not None:
+                self.evidence_skipped += 1
+            elif image_bytes:
+                self.evidence_wasted += 1
+            return False
+        self.last_notification = current_time
+        if self.admits_image(current_time):
+            if evidence is not None:
+                image_bytes = evidence()
+                self.evidence_built += image_bytes is not None
+            elif image_bytes:
+                self.evidence_built += 1
+            if image_bytes:
+                self.last_image_sent = current_time
+                self.image_bytes_sent += len(image_bytes)
+        elif evidence is not None:
+            self.evidence_skipped += 1
+        elif image_bytes:
+            self.evidence_wasted += 1
+        self.notification_count += 1
+        return True
+    
+    def send_startup_notification(self) -> bool:
+        return True
+    
+    def send_network_notification(self, connection_info: Dict[str, Any]) -> bool:
+        return True
+
+
+def create_backend(backend: str) -> Optional[HailoInference]:
+    """Inference engine for a benchmark backend name"""
+    if backend == "hailo":
+        inference = HailoInference(Config.HEF_PATH)
+        inference.initialize()
+        if inference.use_fallback:
+            logger.error("❌ Hailo backend requested but the Hailo device/HEF is not available")
+            return None
+    elif backend == "cpu":
+        inference = CpuModelInference()
+        if not inference.initialize():
+            return None
+    elif backend == "haar":
+        inference = HailoInference(Config.HEF_PATH)
+        inference.use_fallback = True
+    else:
+        raise ValueError(f"Unknown backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+    
+    # Real images only - never inject simulated detections into a benchmark
+    Config.SIMULATION_MODE = False
+    return inference
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB on Linux
+    except ImportError:
+        return None
+
+
+def run_benchmark(backend: str, splits: List[str], frames: Optional[int] = None, warmup: int = 10,
+                  preload: bool = True, cooldown: Optional[float] = None,
+                  use_cache: bool = False) -> Optional[Dict[str, Any]]:
+    """Drive SafetyMonitoringSystem.process_frame over the dataset and collect a JSON-ready result"""
+    image_paths = [p for split in splits for p in split_image_paths(split)]
+    if not image_paths:
+        logger.error(f"❌ No images found for splits: {', '.join(splits)}")
+        return None
+    frames = frames or len(image_paths)
+    
+    cached_frames = None
+    if use_cache:
+        cached_frames = []
+        for split in splits:
+            cache = DatasetCache(split)
+            if not cache.ensure():
+                logger.error(f"❌ Could not build the dataset cache for '{split}'")
+                return None
+            cached_frames.extend(cache.images[i] for i in range(len(cache)))
+    
+    Config.HEADLESS_MODE = True  # no display window
+    system = SafetyMonitoringSystem()
+    system.camera_system = DatasetCamera(image_paths, preload, cached_frames)
+    if not system.camera_system.initialize():
+        logger.error("❌ Failed to load dataset images")
+        return None
+    system.hailo_inference = create_backend(backend)
+    if system.hailo_inference is None:
+        return None
+    system.discord_notifier = StubNotifier(cooldown)
+    system.last_stats_log = float("inf")  # periodic statistics would pull in the network stack
+    
+    logger.info(f"🏁 Timing {frames} frames ({warmup} warmup) over {len(image_paths)} images")
+    for _ in range(warmup):
+        system.process_frame()
+    
+    # Only the timed frames count
+    instrumentation = get_instrumentation()
+    instrumentation.reset()
+    detections_start = system.total_detections
+    alerts_start = system.discord_notifier.notification_count
+    evidence_start = system.discord_notifier.evidence_built
+    wasted_start = system.discord_notifier.evidence_wasted
+    failed = 0
+    
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(frames):
+        if not system.process_frame():
+            failed += 1
+    wall_seconds = time.perf_counter() - wall_start
+    cpu_seconds = time.process_time() - cpu_start
+    
+    stages = {}
+    for stage, stats in instrumentation.get_stats().items():
+        stages[stage] = {
+            "count": stats["count"],
+            "mean_ms": stats["mean"] * 1000,
+            "p50_ms": stats["p50"] * 1000,
+            "p95_ms": stats["p95"] * 1000,
+            "p99_ms": stats["p99"] * 1000,
+            "max_ms": stats["max"] * 1000
+        }
+    
+    result = {
+        "benchmark": "end_to_end",
+        "version": __version__,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "backend": backend,
+        "engine": system.hailo_inference.get_inference_stats()["engine"],
+        "splits": splits,
+        "images": len(image_paths),
+        "frame_source": "cache" if use_cache else "preloaded" if preload else "decode",
+        "warmup_frames": warmup,
+        "frames": frames,
+        "failed_frames": failed,
+        "wall_seconds": wall_seconds,
+        "fps": frames / wall_seconds if wall_seconds > 0 else 0.0,
+        "cpu_seconds": cpu_seconds,
+        "cpu_percent": cpu_seconds / wall_seconds * 100 if wall_seconds > 0 else 0.0,  # 100 = one full core
+        "peak_rss_mb": peak_rss_mb(),
+        "violation_detections": system.total_detections - detections_start,
+        "alerts": system.discord_notifier.notification_count - alerts_start,
+        "evidence_encodes": system.discord_notifier.evidence_built - evidence_start,
+        "wasted_encodes": system.discord_notifier.evidence_wasted - wasted_start,
+        "stages": stages,
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__
+        }
+    }
+    
+    system.hailo_inference.cleanup()
+    system.camera_system.cleanup()
+    return result
+
+
+def _lookup(result: Dict[str, Any], path: tuple) -> Optional[float]:
+    value = result
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare_results(result: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Relative change of the headline numbers against a baseline run"""
+    comparison = []
+    for path, higher_is_better in COMPARED_FIELDS:
+        current, previous = _lookup(result, path), _lookup(baseline, path)
+        if current is None or not previous:
+            continue
+        change = (current - previous) / previous * 100
+        comparison.append({
+            "metric": ".".join(path),
+            "baseline": previous,
+            "current": current,
+            "change_percent": change,
+            "improved": change > 0 if higher_is_better else change < 0
+        })
+    return comparison
+
+
+def baseline_path(backend: str) -> Path:
+    return Path(Config.BENCHMARK_DIR) / f"baseline_e2e_{backend}.json"
+
+
+def log_result(result: Dict[str, Any], comparison: List[Dict[str, Any]]):
+    """Human-readable summary (the JSON file is the machine-readable result)"""
+    logger.info(f"🏁 {result['engine']}: {result['fps']:.1f} FPS over {result['frames']} frames, "
+                   f"CPU {result['cpu_percent']:.0f}%, peak RSS {result['peak_rss_mb'] or 0:.0f} MB")
+    logger.info("   stage                        p50 ms   p95 ms   p99 ms")
+    for stage, stats in result["stages"].items():
+        logger.info(f"   {stage:<26} {stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} {stats['p99_ms']:8.2f}")
+    if comparison:
+        logger.info("   vs baseline:")
+        for row in comparison:
+            mark = "✅" if row["improved"] else "⚠️"
+            logger.info(f"   {mark} {row['metric']:<24} {row['baseline']:10.2f} -> {row['current']:10.2f} ({row['change_percent']:+.1f}%)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """`python -m ppe_monitor bench [--backend haar] [--splits valid test] ...`"""
+    parser = argparse.ArgumentParser(prog="ppe_monitor bench", description="Offline end-to-end pipeline benchmark")
+    parser.add_argument("--backend", choices=BACKENDS, default="haar", help="inference backend (default: haar)")
+    parser.add_argument("--splits", nargs="+", default=["valid", "test"], help="dataset splits to replay")
+    parser.add_argument("--frames", type=int, help="timed frames (default: one pass over the images)")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed warmup frames")
+    parser.add_argument("--no-preload", action="store_true", help="decode JPEGs inside the timed capture stage")
+    parser.add_argument("--cache", action="store_true", help="replay letterboxed frames from the memory-mapped dataset cache")
+    parser.add_argument("--cooldown", type=float, help="notification cooldown override (seconds)")
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/e2e_<backend>_<time>.json)")
+    parser.add_argument("--baseline", help="baseline JSON to compare against (default: benchmarks/baseline_e2e_<backend>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--verbose", action="store_true", help="keep per-frame INFO logging (adds logging cost)")
+    args = parser.parse_args(argv)
+    
+    logger.info(f"🏁 End-to-end benchmark: {args.backend} backend, splits {', '.join(args.splits)}")
+    
+    # Per-frame INFO logging is part of production cost but drowns the benchmark output
+    previous_level = logger.level
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+    try:
+        result = run_benchmark(args.backend, args.splits, args.frames, args.warmup, not args.no_preload, args.cooldown,
+                               args.cache)
+    finally:
+        logger.setLevel(previous_level)
+    if result is None:
+        return 1
+    
+    baseline_file = Path(args.baseline) if args.baseline else baseline_path(args.backend)
+    comparison = []
+    if baseline_file.exists():
+        try:
+            with open(baseline_file, encoding="utf-8") as f:
+                baseline = json.load(f)
+            comparison = compare_results(result, baseline)
+            result["baseline"] = {"path": str(baseline_file), "timestamp": baseline.get("timestamp"), "comparison": comparison}
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ Could not read baseline {baseline_file}: {e}")
+    
+    output = Path(args.output) if args.output else Path(Config.BENCHMARK_DIR) / f"e2e_{args.backend}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    
+    log_result(result, comparison)
+    logger.info(f"💾 Result: {output}")
+    
+    if args.save_baseline:
+        baseline_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_file, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in result.items() if k != "baseline"}, f, indent=2)
+        logger.info(f"📌 Baseline saved: {baseline_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import run
+    sys.exit(run(["bench"] + sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""🎯 Two-stage cascade: full-frame person boxes, then batched ear/headphone detection on upscaled head crops"""
+
+import logging
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from .config import Config
+from .instrumentation import get_instrumentation
+
+logger = logging.getLogger('HailoAI')
+
+PERSON_CLASSES = ("people", "person")
+HEAD_CLASSES = ("headphones", "left_ear", "right_ear")
+
+
+def person_detections(detections: List[Dict]) -> List[Dict]:
+    """Person boxes from either model, relabelled as the PPE model's 'people' class"""
+    people_id = Config.CLASS_NAMES.index("people")
+    people = [d for d in detections if d['class_name'] in PERSON_CLASSES]
+    people.sort(key=lambda d: d['confidence'], reverse=True)
+    return [{**d, 'class_id': people_id, 'class_name': 'people'} for d in people]
+
+
+def head_region(bbox: List[int], frame_shape: Tuple[int, int]) -> Optional[Tuple[int, int, int, int]]:
+    """Top of a person box widened on both sides so the ears stay inside; None if too small"""
+    h, w = frame_shape
+    x1, y1, x2, y2 = bbox
+    box_w, box_h = x2 - x1, y2 - y1
+    margin = int(box_w * Config.CASCADE_HEAD_MARGIN)
+    head_x1, head_x2 = max(0, x1 - margin), min(w, x2 + margin)
+    head_y1 = max(0, y1 - int(box_h * Config.CASCADE_HEAD_MARGIN / 2))
+    head_y2 = min(h, y1 + int(box_h * Config.CASCADE_HEAD_FRACTION))
+    if head_x2 - head_x1 < Config.CASCADE_MIN_CROP or head_y2 - head_y1 < Config.CASCADE_MIN_CROP:
+        return None
+    return head_x1, head_y1, head_x2, head_y2
+
+
+def detect_on_heads(frame: np.ndarray, people: List[Dict], stage2: Any) -> Tuple[List[Dict], int]:
+    """People plus stage-2 ear/headphone detections mapped back to frame coordinates; also returns crops run"""
+    regions = []
+    for person in people[:Config.CASCADE_MAX_CROPS]:
+        region = head_region(person['bbox'], frame.shape[:2])
+        if region is not None:
+            regions.append(region)
+    if not regions:
+        return list(people), 0
+    
+    crops = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in regions]
+    results = stage2.inference_batch(crops)
+    
+    with get_instrumentation().span("cascade_merge"):
+        detections = list(people)
+        for (x1, y1, _, _), crop_detections in zip(regions, results):
+            for d in crop_detections:
+                if d['class_name'] not in HEAD_CLASSES:
+                    continue
+                bx1, by1, bx2, by2 = d['bbox']
+                detections.append({**d, 'bbox': [bx1 + x1, by1 + y1, bx2 + x1, by2 + y1]})
+    return detections, len(crops)
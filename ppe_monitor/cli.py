@@ -0,0 +1,71 @@
+"""⌨️ Command-line entry point (dependency preflight runs before any heavy import)"""
+
+import sys
+import signal
+from typing import List, Optional
+
+from . import deps
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """Dependency preflight, logging setup, signal handlers, then the monitoring app"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    if "--install-deps" in argv:
+        if not deps.install_packages():
+            print("❌ Failed to install critical packages")
+            return 1
+        argv = [arg for arg in argv if arg != "--install-deps"]
+    
+    if not deps.preflight_dependencies():
+        print("💡 Run with --install-deps to install missing packages")
+        return 1
+    
+    # --mock-hailo works with every command (app, bench, eval, ...)
+    if "--mock-hailo" in argv:
+        from .config import Config
+        Config.MOCK_HAILO = True
+        argv = [arg for arg in argv if arg != "--mock-hailo"]
+    
+    # Heavy modules (OpenCV, NumPy, requests) are only imported after the preflight
+    from .logging_setup import setup_logging
+    
+    if argv and argv[0] == "bench":
+        from .bench import main as bench_main
+        setup_logging()
+        return bench_main(argv[1:])
+    
+    if argv and argv[0] == "microbench":
+        from .microbench import main as microbench_main
+        setup_logging()
+        return microbench_main(argv[1:])
+    
+    if argv and argv[0] == "cache":
+        from .dataset_cache import main as cache_main
+        setup_logging()
+        return cache_main(argv[1:])
+    
+    if argv and argv[0] == "events":
+        from .events import main as events_main
+        setup_logging()
+        return events_main(argv[1:])
+    
+    if argv and argv[0] == "eval":
+        from .evaluation import main as evaluation_main
+        setup_logging()
+        return evaluation_main(argv[1:])
+    
+    from .app import main, signal_handler, trace_signal_handler
+    
+    setup_logging()
+    
+    # Set up signal handlers for graceful shutdown
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    
+    # SIGUSR1 records a latency trace (not available on Windows)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, trace_signal_handler)
+    
+    # Run main function and return the exit code
+    return main()
@@ -0,0 +1,242 @@
+"""🎞️ Pre/post-event clips: JPEG-compressed in-memory frame ring, written to disk off the frame loop"""
+
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+import cv2
+import numpy as np
+
+from .config import Config
+from .metrics import register_queue, unregister_queue
+
+logger = logging.getLogger('HailoAI')
+
+_STOP = object()
+
+
+class ClipJob:
+    """One clip: the pre-event frames plus post-event frames until `until`"""
+    
+    def __init__(self, path: Path, frames: List[Tuple[float, bytes]], until: float):
+        self.path = path
+        self.frames = frames
+        self.until = until
+        self.bytes = sum(len(data) for _, data in frames)
+        self.truncated = False
+    
+    def append(self, timestamp: float, data: bytes):
+        self.frames.append((timestamp, data))
+        self.bytes += len(data)
+
+
+class ClipRecorder:
+    """Keeps the last CLIP_PRE_SECONDS as JPEG bytes; a trigger adds CLIP_POST_SECONDS and writes an MJPG clip
+    
+    The frame loop only downscales and enqueues (dropping when the queue is full);
+    compression runs on the "clip-compress" thread and file output on "clip-writer".
+    The ring, the clip still collecting frames and the clips waiting for the writer
+    stay under CLIP_MEMORY_MB (clips get at most half; a clip that does not fit is
+    truncated), and the oldest clips are deleted to keep CLIP_DIR under CLIP_DISK_QUOTA_MB.
+    
+    `self.lock` guards the ring and the clip jobs: trigger() creates or extends the
+    job on the frame thread, so the path it returns is the file that gets written.
+    """
+    
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or Config.CLIP_DIR)
+        self.ring: deque = deque()  # (timestamp, jpeg bytes), oldest first
+        self.ring_bytes = 0
+        self.job: Optional[ClipJob] = None
+        self.last_clip: Optional[Path] = None
+        self.lock = threading.Lock()
+        self.frames: queue.Queue = queue.Queue(maxsize=Config.CLIP_QUEUE_SIZE)
+        self.writes: queue.Queue = queue.Queue()
+        self.pending_bytes = 0  # finished clips not yet written by the writer thread
+        self.last_sample = 0.0
+        self.compress_thread: Optional[threading.Thread] = None
+        self.writer_thread: Optional[threading.Thread] = None
+        self.memory_limit = Config.CLIP_MEMORY_MB * 1024 * 1024
+        self.frames_dropped = 0
+        self.frames_evicted = 0
+        self.clips_written = 0
+        self.clips_deleted = 0
+        self.clips_truncated = 0
+    
+    def start(self) -> bool:
+        """Start the compression and writer threads"""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"❌ Clip directory unavailable ({self.directory}): {e}")
+            return False
+        self.compress_thread = threading.Thread(target=self._compress_loop, name="clip-compress", daemon=True)
+        self.compress_thread.start()
+        self.writer_thread = threading.Thread(target=self._writer_loop, name="clip-writer", daemon=True)
+        self.writer_thread.start()
+        register_queue("clip_frames", self.frames.qsize)
+        register_queue("clip_writes", self.writes.qsize)
+        logger.info(f"🎞️ Clip recorder: {Config.CLIP_PRE_SECONDS}s before / {Config.CLIP_POST_SECONDS}s after violations "
+                    f"at {Config.CLIP_FPS} FPS, {Config.CLIP_MEMORY_MB} MB ring, {Config.CLIP_DISK_QUOTA_MB} MB on disk")
+        return True
+    
+    def add_frame(self, frame: np.ndarray, now: Optional[float] = None):
+        """Offer a captured frame (frame loop; never blocks)"""
+        now = time.time() if now is None else now
+        if now - self.last_sample < 1.0 / Config.CLIP_FPS:
+            return
+        self.last_sample = now
+        # resize allocates a new array, so later in-place drawing on `frame` cannot race the compressor
+        small = cv2.resize(frame, None, fx=Config.CLIP_SCALE, fy=Config.CLIP_SCALE, interpolation=cv2.INTER_AREA)
+        try:
+            self.frames.put_nowait((now, small))
+        except queue.Full:
+            self.frames_dropped += 1
+    
+    def clip_path(self, now: float) -> Path:
+        return self.directory / f"violation_{datetime.fromtimestamp(now).strftime('%Y%m%d_%H%M%S_%f')[:-3]}.avi"
+    
+    def trigger(self, now: Optional[float] = None) -> str:
+        """Start (or extend) a clip around now; returns the path the clip is written to (frame loop)"""
+        now = time.time() if now is None else now
+        with self.lock:
+            if self.job is not None:
+                self.job.until = max(self.job.until, now + Config.CLIP_POST_SECONDS)
+                return str(self.job.path)
+            path = self.clip_path(now)
+            if path == self.last_clip:
+                path = path.with_name(f"{path.stem}_1{path.suffix}")  # same millisecond as the previous clip
+            self.job = ClipJob(path, list(self.ring), now + Config.CLIP_POST_SECONDS)
+            return str(path)
+    
+    def _compress_loop(self):
+        params = [int(cv2.IMWRITE_JPEG_QUALITY), Config.CLIP_JPEG_QUALITY]
+        while True:
+            item = self.frames.get()
+            if item is _STOP:
+                break
+            try:
+                timestamp, frame = item
+                ok, encoded = cv2.imencode('.jpg', frame, params)
+                if ok:
+                    self.add_encoded(timestamp, encoded.tobytes())
+            except Exception as e:
+                logger.error(f"❌ Clip compression error: {e}")
+        with self.lock:
+            if self.job is not None:
+                self._finish_job()
+        self.writes.put(_STOP)
+    
+    def add_encoded(self, timestamp: float, data: bytes):
+        """Add a compressed frame to the ring and the clip being recorded (compressor thread)"""
+        with self.lock:
+            if self.job is not None:
+                self.job.append(timestamp, data)
+                if timestamp >= self.job.until:
+                    self._finish_job()
+            self._push_ring(timestamp, data)
+    
+    def _push_ring(self, timestamp: float, data: bytes):
+        self.ring.append((timestamp, data))
+        self.ring_bytes += len(data)
+        clip_bytes = self.pending_bytes + (self.job.bytes if self.job is not None else 0)
+        while self.ring and (timestamp - self.ring[0][0] > Config.CLIP_PRE_SECONDS
+                             or self.ring_bytes + clip_bytes > self.memory_limit):
+            _, old = self.ring.popleft()
+            self.ring_bytes -= len(old)
+            self.frames_evicted += 1
+        if self.job is not None and clip_bytes > self.memory_limit // 2:
+            # Memory ceiling: cut the post-event segment short rather than grow past it
+            self.job.truncated = True
+            self._finish_job()
+    
+    def _finish_job(self):
+        """Hand the current job to the writer, trimmed to the memory left for clips (lock held)"""
+        job, self.job = self.job, None
+        self.last_clip = job.path
+        room = self.memory_limit // 2 - self.pending_bytes
+        if job.bytes > room:
+            # The writer is behind: keep only the start of the clip that still fits in memory
+            kept, size = 0, 0
+            while kept < len(job.frames) and size + len(job.frames[kept][1]) <= room:
+                size += len(job.frames[kept][1])
+                kept += 1
+            job.frames, job.bytes = job.frames[:kept], size
+            job.truncated = True
+        if job.truncated:
+            self.clips_truncated += 1
+            logger.warning(f"⚠️ Clip {job.path.name} truncated to {len(job.frames)} frames (clip memory ceiling)")
+        self.pending_bytes += job.bytes
+        self.writes.put(job)
+    
+    def _writer_loop(self):
+        while True:
+            job = self.writes.get()
+            if job is _STOP:
+                break
+            try:
+                self._write_clip(job)
+            except Exception as e:
+                logger.error(f"❌ Failed to write clip {job.path}: {e}")
+            finally:
+                with self.lock:
+                    self.pending_bytes -= job.bytes
+    
+    def _write_clip(self, job: ClipJob):
+        if not job.frames:
+            return
+        self._enforce_quota(job.bytes)
+        first = cv2.imdecode(np.frombuffer(job.frames[0][1], dtype=np.uint8), cv2.IMREAD_COLOR)
+        h, w = first.shape[:2]
+        writer = cv2.VideoWriter(str(job.path), cv2.VideoWriter_fourcc(*"MJPG"), Config.CLIP_FPS, (w, h))
+        try:
+            for _, data in job.frames:
+                writer.write(cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR))
+        finally:
+            writer.release()
+        self.clips_written += 1
+        duration = job.frames[-1][0] - job.frames[0][0]
+        logger.info(f"🎞️ Clip saved: {job.path} ({len(job.frames)} frames, {duration:.1f}s, "
+                    f"{job.path.stat().st_size / 1024:.0f} KB)")
+    
+    def _enforce_quota(self, incoming: int):
+        """Delete the oldest clips until the new one fits in CLIP_DISK_QUOTA_MB"""
+        quota = Config.CLIP_DISK_QUOTA_MB * 1024 * 1024
+        clips = sorted(self.directory.glob("*.avi"), key=lambda p: p.stat().st_mtime)
+        used = sum(p.stat().st_size for p in clips)
+        while clips and used + incoming > quota:
+            oldest = clips.pop(0)
+            used -= oldest.stat().st_size
+            oldest.unlink(missing_ok=True)
+            self.clips_deleted += 1
+            logger.info(f"🗑️ Clip quota: deleted {oldest.name}")
+    
+    def stop(self, timeout: float = 10.0):
+        """Flush the clip being collected and stop both threads"""
+        if self.compress_thread is None:
+            return
+        self.frames.put(_STOP)
+        self.compress_thread.join(timeout)
+        self.writer_thread.join(timeout)
+        self.compress_thread = None
+        unregister_queue("clip_frames")
+        unregister_queue("clip_writes")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Ring occupancy and clip counters"""
+        return {
+            "ring_frames": len(self.ring),
+            "ring_mb": self.ring_bytes / 1024 ** 2,
+            "recording": self.job is not None,
+            "pending_mb": self.pending_bytes / 1024 ** 2,
+            "frames_dropped": self.frames_dropped,
+            "frames_evicted": self.frames_evicted,
+            "clips_written": self.clips_written,
+            "clips_deleted": self.clips_deleted,
+            "clips_truncated": self.clips_truncated
+        }
@@ -0,0 +1,193 @@
+"""⚙️ Configuration for the PPE compliance monitor"""
+
+import os
+import logging
+
+
+def _detect_headless() -> bool:
+    """No DISPLAY means no GUI window can be opened"""
+    return not os.environ.get('DISPLAY')
+
+
+class Config:
+    # Discord Webhook
+    DISCORD_WEBHOOK = "https://discord.com/api/webhooks/xxxxx"
+    
+    # Hailo Model
+    HEF_PATH = "headphones_final_8l.hef"
+    CPU_MODEL_PATH = "headphones_final_8l.onnx"  # ONNX export of the same model (CPU benchmark backend)
+    CPU_MODEL_INPUT_SIZE = 640
+    HAILO_QUANTIZED_OUTPUTS = False  # Read raw outputs as UINT8 and dequantize only above-threshold anchors
+    HAILO_RECORD_OUTPUTS = None  # .npz path: save the first HAILO_RECORD_FRAMES device outputs for mock replay
+    HAILO_RECORD_FRAMES = 200
+    
+    # Hailo model scheduler: several HEFs (and camera processes) time-share one device
+    HAILO_SCHEDULER = False  # Configure every network group on one shared, scheduler-enabled VDevice
+    HAILO_SCHEDULING_ALGORITHM = "ROUND_ROBIN"  # HailoSchedulingAlgorithm member
+    HAILO_MULTI_PROCESS = False  # Share the device with other processes (requires hailort_service)
+    HAILO_GROUP_ID = "SHARED"  # VDevice group id used by every cooperating process
+    HAILO_NETWORKS = {
+        # priority: 0-31, higher is served first; timeout_ms / threshold: how long / how many frames the
+        # scheduler waits to batch before switching; interval: run every N frames (secondary networks)
+        "ppe": {"priority": 16, "timeout_ms": 0, "threshold": 1},
+        "person": {"enabled": False, "hef": "person_detector.hef", "classes": ["person"],
+                   "priority": 8, "timeout_ms": 100, "threshold": 1, "interval": 5},
+    }
+    
+    # Two-stage cascade: person boxes (HAILO_NETWORKS["person"], else the PPE model's 'people') ->
+    # ear/headphone detection on upscaled head crops, run only when people are present
+    CASCADE_MODE = False
+    CASCADE_PERSON_NETWORK = "person"  # secondary network providing person boxes
+    CASCADE_HEAD_FRACTION = 0.35  # top part of the person box treated as the head
+    CASCADE_HEAD_MARGIN = 0.25  # crop widened by this fraction of the box width on each side (ears)
+    CASCADE_MIN_CROP = 16  # pixels; smaller head regions are skipped
+    CASCADE_MAX_CROPS = 8  # head crops per batched second-stage call
+    
+    # Mock Hailo device (--mock-hailo): replays recorded or synthetic output tensors, no hardware needed
+    MOCK_HAILO = False
+    MOCK_HAILO_RECORDING = None  # .npz from HAILO_RECORD_OUTPUTS (None = synthetic tensors)
+    MOCK_HAILO_INPUT_SHAPE = (640, 640, 3)  # HEF input vstream shape (h, w, c)
+    MOCK_HAILO_OUTPUT_SHAPES = [(8400, 9)]  # Synthetic output vstream shapes (N, 5 + classes)
+    MOCK_HAILO_OUTPUT_FORMAT = "raw"  # "raw" tensors or "nms" (HEF compiled with on-chip NMS)
+    MOCK_HAILO_NMS_MAX_BBOXES = 20  # Per-class capacity of the synthetic on-chip NMS output
+    MOCK_HAILO_LATENCY_MS = 25.0  # Simulated device time per infer() call
+    MOCK_HAILO_JITTER_MS = 5.0  # Standard deviation of the simulated latency
+    MOCK_HAILO_BATCH_COST = 0.3  # Extra latency per additional image in a batched call (fraction of one call)
+    MOCK_HAILO_FAILURE_RATE = 0.0  # Fraction of infer() calls that raise HailoRTException
+    MOCK_HAILO_SEED = 0
+    
+    # Camera Settings
+    CAMERA_WIDTH = 640
+    CAMERA_HEIGHT = 480
+    CAMERA_FPS = 30
+    
+    # Tiled high-resolution inference (small/distant ears): capture larger, infer overlapping model-sized tiles
+    TILED_MODE = False
+    TILE_CAPTURE_WIDTH = 1920
+    TILE_CAPTURE_HEIGHT = 1080
+    TILE_SIZE = 640  # tile edge in capture pixels (the model input size avoids resampling)
+    TILE_OVERLAP = 0.2  # fraction of TILE_SIZE shared by neighbouring tiles
+    TILE_BUDGET = 4  # images inferred per frame (batched), the overview included; the other tiles keep their recent results
+    TILE_CACHE_FRAMES = 5  # frames a tile's last detections stay valid while it waits for its turn
+    TILE_MOTION_THRESHOLD = 8.0  # mean absolute frame difference (0-255) that marks a tile as moving
+    TILE_INCLUDE_OVERVIEW = True  # also infer the whole frame, downscaled, every frame (takes one TILE_BUDGET slot)
+    
+    # Detection Settings
+    CONFIDENCE_THRESHOLD = 0.5
+    NMS_THRESHOLD = 0.4
+    
+    # Zones of interest for this camera: polygons in CAMERA_WIDTH x CAMERA_HEIGHT pixels (empty = whole frame)
+    # e.g. [{"name": "walkway", "points": [(40, 479), (250, 120), (420, 120), (639, 479)]}]
+    ZONES = []
+    ZONE_CROP_MARGIN = 16  # pixels of context kept around the zones' bounding box
+    ZONE_MIN_OVERLAP = 0.3  # fraction of a detection box that must lie inside a zone
+    
+    # Per-person compliance: ears/headphones are assigned to the person whose head band holds them
+    PER_PERSON_COMPLIANCE = True  # False = legacy frame-level rule (any headphones + any person = compliant)
+    ASSOCIATION_HEAD_FRACTION = 0.4  # top part of the person box searched for ears/headphones
+    ASSOCIATION_HEAD_MARGIN = 0.25  # head band widened by this fraction of the box width on each side
+    ASSOCIATION_MIN_CONTAINMENT = 0.5  # fraction of an ear/headphone box that must lie in the head band
+    
+    # Temporal confirmation: only violations that persist reach evidence encoding and Discord
+    CONFIRM_VIOLATIONS = True
+    CONFIRM_K = 3  # violation frames required ...
+    CONFIRM_N = 5  # ... within the last N frames
+    CONFIRM_SECONDS = 1.5  # or seen continuously this long (0 = frame count only)
+    CONFIRM_SCOPE = "person"  # "person": per location matched by IoU, "zone": per zone of interest
+    CONFIRM_IOU = 0.3  # IoU linking a violation box to the same location in the previous frames
+    
+    # Notification Settings
+    NOTIFICATION_COOLDOWN = 60  # seconds between notifications (increased to prevent spam)
+    MAX_DETECTIONS_PER_FRAME = 10
+    
+    # Network Configuration
+    # Priority: Ethernet -> Wi-Fi -> Scan for networks
+    WIFI_SSID = "aiwifi"
+    WIFI_PASSWORD = "00000000"
+    WIFI_COUNTRY = "TH"  # Thailand country code for proper 5GHz support
+    ENABLE_WIFI_5GHZ = True  # Enable 5GHz Wi-Fi support
+    NETWORK_SCAN_INTERVAL = 10  # seconds between network scans when disconnected
+    PREFER_ETHERNET = True  # Prefer Ethernet over Wi-Fi
+    
+    # Connectivity probes (host, port, protocol) - IP literals only, no DNS lookup on the hot path
+    CONNECTIVITY_PROBE_TARGETS = [
+        ("8.8.8.8", 53, "tcp"),
+        ("1.1.1.1", 443, "tcp"),
+        ("1.1.1.1", 53, "udp"),
+    ]
+    CONNECTIVITY_PROBE_TIMEOUT = 1.5  # overall deadline (seconds) for all probes together
+    
+    # Event-driven link monitoring (rtnetlink, falls back to sysfs polling)
+    LINK_MONITOR_PROBE_INTERVAL = 60  # seconds between internet re-checks on an idle, connected link
+    LINK_MONITOR_FALLBACK_POLL = 5  # seconds between sysfs reads when netlink is unavailable
+    
+    # Shared network state snapshot - refresh TTL (seconds) per field group
+    NETWORK_STATE_TTLS = {
+        "connection": 5,   # link/IP/internet (cheap when the link monitor is running)
+        "wireless": 30,    # signal strength / frequency (iwconfig, iwlist)
+        "tailscale": 120   # tailscale status (sudo tailscale status)
+    }
+    
+    # Remote Access Configuration
+    ENABLE_TAILSCALE = True  # Enable Tailscale for remote access
+    TAILSCALE_AUTO_INSTALL = True  # Auto-install Tailscale if not available
+    
+    # Class Names - Updated to match data.yaml configuration
+    CLASS_NAMES = ["headphones", "left_ear", "people", "right_ear"]
+    
+    # Colors for bounding boxes (BGR format)
+    COLORS = [(0, 255, 0), (0, 0, 255), (255, 0, 0), (0, 0, 255)]  # Green, Red, Blue, Red
+    
+    # Logging
+    LOG_LEVEL = logging.INFO
+    LOG_FILE = "hailo_detection.log"
+    
+    # Per-stage latency instrumentation (perf_counter_ns spans, p50/p95/p99 in statistics)
+    ENABLE_INSTRUMENTATION = True
+    LATENCY_WINDOW = 1024  # Recent samples kept per stage for percentiles
+    TRACE_WINDOW_FRAMES = 100  # Frames captured per Chrome trace (SIGUSR1 or 't' key)
+    TRACE_ON_START_FRAMES = 0  # Record a trace of the first N frames (0 = off)
+    TRACE_OUTPUT_DIR = "logs/traces"  # Open traces in chrome://tracing or ui.perfetto.dev
+    ALERT_LATENCY_SLO = 5.0  # seconds from frame capture to the Discord 204 response
+    
+    # Prometheus /metrics endpoint (served from its own thread, snapshots pre-serialized)
+    ENABLE_METRICS = True
+    METRICS_HOST = "0.0.0.0"
+    METRICS_PORT = 9108
+    METRICS_REFRESH_INTERVAL = 5  # seconds between snapshot rebuilds
+    
+    # Offline evaluation / benchmarking
+    DATASET_DIR = "headphones"  # YOLO dataset with train/valid/test splits
+    BENCHMARK_DIR = "benchmarks"  # benchmark results and stored baselines
+    DATASET_CACHE_DIR = os.path.expanduser("~/.cache/hailo_detection/dataset")  # memory-mapped letterboxed splits
+    MICROBENCH_REGRESSION_THRESHOLD = 0.10  # micro-benchmark median slowdown that fails the run
+    
+    # Simulation mode (if no camera/hailo available)
+    SIMULATION_MODE = False
+    DEMO_VIDEO_PATH = None  # Path to demo video file
+    
+    # Headless mode (no GUI display)
+    HEADLESS_MODE = _detect_headless()
+    SAVE_DETECTION_IMAGES = False  # Images sent to Discord only, not saved locally
+    
+    # Pre/post-event violation clips (compressed in-memory ring, written by background threads)
+    CLIP_RECORDING = False
+    CLIP_DIR = "clips"
+    CLIP_PRE_SECONDS = 5  # seconds kept before a confirmed violation
+    CLIP_POST_SECONDS = 5  # seconds recorded after the last confirmed violation frame
+    CLIP_FPS = 10  # frames per second sampled into the ring (capture frames in between are skipped)
+    CLIP_SCALE = 0.5  # frames are downscaled by this factor before compression
+    CLIP_JPEG_QUALITY = 70
+    CLIP_MEMORY_MB = 64  # ceiling for the ring plus clips being recorded or waiting to be written
+    CLIP_DISK_QUOTA_MB = 2048  # oldest clips in CLIP_DIR are deleted to stay under this
+    CLIP_QUEUE_SIZE = 8  # frames waiting for compression; further frames are dropped, never waited for
+    
+    # Local event store (SQLite WAL; one writer thread inserts queued rows in batches)
+    ENABLE_EVENT_STORE = True
+    EVENT_DB_PATH = "logs/events.db"  # with the logs and traces, not in the checkout root
+    EVENT_CAMERA_NAME = "camera1"  # camera column of every stored row
+    EVENT_BATCH_SIZE = 500  # rows per transaction at most
+    EVENT_FLUSH_INTERVAL = 1.0  # seconds a queued row may wait before it is written
+    EVENT_QUEUE_SIZE = 10000  # queued rows; beyond this new rows are dropped (counted), never waited for
+    EVENT_RETENTION_DAYS = 90
+    EVENT_PRUNE_INTERVAL = 3600  # seconds between retention prunes
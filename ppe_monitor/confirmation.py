@@ -0,0 +1,114 @@
+"""⏳ Temporal violation confirmation: K-of-N frames (or sustained seconds) before evidence and alerts"""
+
+import time
+import logging
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from .config import Config
+from .postprocess import box_iou_matrix
+
+logger = logging.getLogger('HailoAI')
+
+
+class ViolationTrack:
+    """Hit history of one violation location as an N-bit ring buffer (bit 0 = current frame)"""
+    
+    __slots__ = ("bbox", "history", "run_start", "confirmed", "reported")
+    
+    def __init__(self, bbox: List[int]):
+        self.bbox = bbox
+        self.history = 0
+        self.run_start: Optional[float] = None  # start of the current unbroken run of hit frames
+        self.confirmed = False
+        self.reported = False  # confirmed at least once (the violation event has been emitted)
+    
+    def push(self, hit: bool, window: int, now: float):
+        if not hit:
+            self.run_start = None
+        elif self.run_start is None:
+            self.run_start = now
+        self.history = ((self.history << 1) | int(hit)) & ((1 << window) - 1)
+    
+    def hits(self) -> int:
+        return bin(self.history).count("1")
+
+
+class ViolationConfirmer:
+    """Passes a violation on only once it persisted for CONFIRM_K of the last CONFIRM_N frames
+    or for CONFIRM_SECONDS, tracked per location (IoU matching) or per zone (CONFIRM_SCOPE)"""
+    
+    def __init__(self):
+        self.tracks: Dict[Any, ViolationTrack] = {}
+        self.next_id = 0
+        self.candidates = 0
+        self.confirmed = 0
+        self.newly_confirmed: List[Dict] = []  # violations of tracks confirmed for the first time this frame
+    
+    def _is_confirmed(self, track: ViolationTrack, now: float) -> bool:
+        if not track.history & 1:
+            return False
+        if track.hits() >= Config.CONFIRM_K:
+            return True
+        return Config.CONFIRM_SECONDS > 0 and now - track.run_start >= Config.CONFIRM_SECONDS
+    
+    def _match(self, violations: List[Dict]) -> List[Any]:
+        """Track key for each violation: greedy highest-IoU matching, new tracks for the rest"""
+        keys: List[Optional[Any]] = [None] * len(violations)
+        track_ids = list(self.tracks)
+        if track_ids and violations:
+            iou = box_iou_matrix([d['bbox'] for d in violations], [self.tracks[t].bbox for t in track_ids])
+            used = set()
+            for flat in np.argsort(-iou, axis=None):
+                i, j = divmod(int(flat), len(track_ids))
+                if iou[i, j] < Config.CONFIRM_IOU:
+                    break
+                if keys[i] is None and j not in used:
+                    keys[i] = track_ids[j]
+                    used.add(j)
+        for i, d in enumerate(violations):
+            if keys[i] is None:
+                keys[i] = self.next_id
+                self.tracks[self.next_id] = ViolationTrack(d['bbox'])
+                self.next_id += 1
+            else:
+                self.tracks[keys[i]].bbox = d['bbox']
+        return keys
+    
+    def update(self, violations: List[Dict], now: Optional[float] = None) -> List[Dict]:
+        """Record this frame's candidate violations; returns the confirmed ones"""
+        now = time.time() if now is None else now
+        if Config.CONFIRM_SCOPE == "zone":
+            keys = [d.get('zone', 'frame') for d in violations]
+            for key, d in zip(keys, violations):
+                if key not in self.tracks:
+                    self.tracks[key] = ViolationTrack(d['bbox'])
+        else:
+            keys = self._match(violations)
+        
+        hit = set(keys)
+        for key in list(self.tracks):
+            track = self.tracks[key]
+            track.push(key in hit, Config.CONFIRM_N, now)
+            track.confirmed = self._is_confirmed(track, now)
+            if not track.history:
+                del self.tracks[key]  # absent for the whole window
+        
+        confirmed = [d for key, d in zip(keys, violations) if self.tracks[key].confirmed]
+        self.newly_confirmed = [d for key, d in zip(keys, violations)
+                                if self.tracks[key].confirmed and not self.tracks[key].reported]
+        for key in keys:
+            self.tracks[key].reported |= self.tracks[key].confirmed
+        self.candidates += bool(violations)
+        self.confirmed += bool(confirmed)
+        return confirmed
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Candidate vs confirmed violation frames"""
+        return {
+            "tracks": len(self.tracks),
+            "candidate_frames": self.candidates,
+            "confirmed_frames": self.confirmed,
+            "suppressed_frames": self.candidates - self.confirmed
+        }
@@ -0,0 +1,75 @@
+"""🗂️ Access to the bundled YOLO dataset splits (headphones/{train,valid,test})"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .config import Config
+
+logger = logging.getLogger('HailoAI')
+
+DATASET_SPLITS = ("train", "valid", "test")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def split_dir(split: str, root: Optional[str] = None) -> Path:
+    """Directory of one split (e.g. headphones/valid)"""
+    if split not in DATASET_SPLITS:
+        raise ValueError(f"Unknown dataset split '{split}' (expected one of {', '.join(DATASET_SPLITS)})")
+    return Path(root or Config.DATASET_DIR) / split
+
+
+def split_image_paths(split: str, root: Optional[str] = None) -> List[Path]:
+    """Sorted image paths of one split"""
+    image_dir = split_dir(split, root) / "images"
+    if not image_dir.is_dir():
+        logger.warning(f"⚠️  Dataset split not found: {image_dir}")
+        return []
+    return sorted(p for p in image_dir.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+
+
+def label_path_for(image_path: Path) -> Path:
+    """YOLO label file belonging to an image (images/x.jpg -> labels/x.txt)"""
+    return image_path.parent.parent / "labels" / f"{image_path.stem}.txt"
+
+
+def load_label_polygons(label_path: Path) -> List[Tuple[int, np.ndarray]]:
+    """YOLO label rows as (class, (K, 2) normalized points)
+
+    Segmentation rows (class x1 y1 x2 y2 ...) keep their polygon; plain
+    detection rows (class xc yc w h) become the four box corners.
+    """
+    polygons = []
+    try:
+        lines = Path(label_path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return polygons
+    
+    for line in lines:
+        values = np.array(line.split(), dtype=np.float32)
+        if values.size < 5:
+            continue
+        coords = values[1:]
+        if coords.size == 4:
+            xc, yc, w, h = coords
+            points = np.array([[xc - w / 2, yc - h / 2], [xc + w / 2, yc - h / 2],
+                               [xc + w / 2, yc + h / 2], [xc - w / 2, yc + h / 2]], dtype=np.float32)
+        else:
+            points = coords[:coords.size // 2 * 2].reshape(-1, 2)
+        polygons.append((int(values[0]), points))
+    return polygons
+
+
+def polygons_to_boxes(polygons: List[Tuple[int, np.ndarray]]) -> np.ndarray:
+    """(N, 5) float32 rows of class, x1, y1, x2, y2 (normalized, clipped to the image)"""
+    if not polygons:
+        return np.zeros((0, 5), dtype=np.float32)
+    rows = [(class_id, *points.min(axis=0), *points.max(axis=0)) for class_id, points in polygons]
+    return np.clip(np.array(rows, dtype=np.float32), 0, [np.inf, 1, 1, 1, 1]).astype(np.float32)
+
+
+def load_labels(label_path: Path) -> np.ndarray:
+    """YOLO labels as (N, 5) float32 rows of class, x1, y1, x2, y2 (normalized); polygons become their bounding boxes"""
+    return polygons_to_boxes(load_label_polygons(label_path))
@@ -0,0 +1,269 @@
+"""💽 Memory-mapped, pre-letterboxed dataset cache for evaluation and benchmarking"""
+
+import os
+import time
+import hashlib
+import logging
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+
+import cv2
+import numpy as np
+
+from .config import Config
+from .dataset import split_image_paths, label_path_for, load_label_polygons, polygons_to_boxes
+
+logger = logging.getLogger('HailoAI')
+
+CACHE_VERSION = 1
+LETTERBOX_COLOR = (114, 114, 114)
+
+
+def letterbox(image: np.ndarray, size: int) -> Tuple[np.ndarray, float, int, int]:
+    """Resize keeping aspect ratio and pad to size x size; returns (image, scale, pad_x, pad_y)"""
+    h, w = image.shape[:2]
+    scale = min(size / w, size / h)
+    new_w, new_h = int(round(w * scale)), int(round(h * scale))
+    pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+    
+    canvas = np.full((size, size, 3), LETTERBOX_COLOR, dtype=np.uint8)
+    resized = image if (new_w, new_h) == (w, h) else cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = resized
+    return canvas, scale, pad_x, pad_y
+
+
+def file_hash(path: Path) -> str:
+    """Content hash of a file (BLAKE2b, 128-bit)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+class DatasetCache:
+    """One split decoded once into a memory-mapped (N, S, S, 3) uint8 BGR tensor plus a compact label index"""
+    
+    def __init__(self, split: str, input_size: Optional[int] = None, root: Optional[str] = None,
+                 cache_dir: Optional[str] = None):
+        self.split = split
+        self.input_size = input_size or Config.CPU_MODEL_INPUT_SIZE
+        self.root = root or Config.DATASET_DIR
+        self.directory = Path(cache_dir or Config.DATASET_CACHE_DIR) / f"{Path(self.root).resolve().name}_{split}_{self.input_size}"
+        self.images_file = self.directory / "images.npy"
+        self.index_file = self.directory / "index.npz"
+        self.images: Optional[np.ndarray] = None
+        self.index: Dict[str, np.ndarray] = {}
+        self.paths: List[Path] = []
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def ensure(self, force: bool = False) -> bool:
+        """Open the cache, (re)building whatever is missing or stale"""
+        image_paths = split_image_paths(self.split, self.root)
+        if not image_paths:
+            return False
+        
+        if not force and self._open():
+            stale = self._stale_entries(image_paths)
+            if stale is None:
+                logger.info(f"💽 Dataset cache changed shape ({self.split}), rebuilding")
+            elif not stale:
+                return True
+            else:
+                logger.info(f"💽 Refreshing {len(stale)} stale dataset cache entries ({self.split})")
+                return self._refresh(image_paths, stale)
+        return self.build(image_paths)
+    
+    def _open(self) -> bool:
+        """Load the index and map the image tensor (no decoding)"""
+        if not self.images_file.exists() or not self.index_file.exists():
+            return False
+        try:
+            with np.load(self.index_file, allow_pickle=False) as data:
+                self.index = {key: data[key] for key in data.files}
+            if int(self.index["version"]) != CACHE_VERSION or int(self.index["input_size"]) != self.input_size:
+                return False
+            self.images = np.load(self.images_file, mmap_mode="r")
+            self.paths = [Path(self.root) / p for p in self.index["paths"]]
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️  Dataset cache unreadable, rebuilding: {e}")
+            return False
+    
+    def _stale_entries(self, image_paths: List[Path]) -> Optional[List[int]]:
+        """Indices whose image content or label mtime changed; None if images were added or removed"""
+        relative = [str(p.relative_to(self.root)) for p in image_paths]
+        if relative != list(self.index["paths"]):
+            return None
+        
+        stale = []
+        for i, path in enumerate(image_paths):
+            if _mtime_ns(label_path_for(path)) != self.index["label_mtime_ns"][i]:
+                stale.append(i)
+                continue
+            # Cheap stat check first; only re-hash images whose size or mtime moved
+            stat = path.stat()
+            if stat.st_size == self.index["image_size"][i] and stat.st_mtime_ns == self.index["image_mtime_ns"][i]:
+                continue
+            if file_hash(path) != self.index["image_hash"][i]:
+                stale.append(i)
+        return stale
+    
+    def build(self, image_paths: Optional[List[Path]] = None) -> bool:
+        """Decode, letterbox and index every image of the split"""
+        image_paths = image_paths or split_image_paths(self.split, self.root)
+        if not image_paths:
+            return False
+        start = time.perf_counter()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        
+        count, size = len(image_paths), self.input_size
+        tmp_images = self.directory / "images.tmp.npy"
+        images = np.lib.format.open_memmap(tmp_images, mode="w+", dtype=np.uint8, shape=(count, size, size, 3))
+        entries = []
+        for i, path in enumerate(image_paths):
+            entries.append(self._encode_entry(path, images, i))
+        images.flush()
+        del images
+        
+        self.index = self._pack_index(image_paths, entries)
+        os.replace(tmp_images, self.images_file)
+        self._write_index()
+        
+        self.images = np.load(self.images_file, mmap_mode="r")
+        self.paths = image_paths
+        logger.info(f"💽 Cached {count} {self.split} images at {size}x{size} in {time.perf_counter() - start:.1f}s "
+                    f"({self.images_file.stat().st_size / 1024 ** 2:.0f} MB)")
+        return True
+    
+    def _refresh(self, image_paths: List[Path], stale: List[int]) -> bool:
+        """Rewrite only the stale entries in place"""
+        self.images = None
+        images = np.load(self.images_file, mmap_mode="r+")
+        entries = self._unpack_entries()
+        for i in stale:
+            entries[i] = self._encode_entry(image_paths[i], images, i)
+        images.flush()
+        del images
+        
+        self.index = self._pack_index(image_paths, entries)
+        self._write_index()
+        self.images = np.load(self.images_file, mmap_mode="r")
+        self.paths = image_paths
+        return True
+    
+    def _encode_entry(self, path: Path, images: np.ndarray, i: int) -> Dict[str, Any]:
+        """Letterbox one image into slot i and collect its index fields"""
+        image = cv2.imread(str(path))
+        if image is None:
+            logger.warning(f"⚠️  Unreadable image cached as blank: {path}")
+            image = np.zeros((self.input_size, self.input_size, 3), dtype=np.uint8)
+        h, w = image.shape[:2]
+        images[i], scale, pad_x, pad_y = letterbox(image, self.input_size)
+        
+        label_path = label_path_for(path)
+        stat = path.stat()
+        return {
+            "image_hash": file_hash(path),
+            "image_size": stat.st_size,
+            "image_mtime_ns": stat.st_mtime_ns,
+            "label_mtime_ns": _mtime_ns(label_path),
+            "original_shape": (h, w),
+            "letterbox": (scale, pad_x, pad_y),
+            "polygons": load_label_polygons(label_path)
+        }
+    
+    def _pack_index(self, image_paths: List[Path], entries: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Flatten per-image labels into offset-indexed arrays"""
+        polygons = [polygon for entry in entries for polygon in entry["polygons"]]
+        label_counts = [len(entry["polygons"]) for entry in entries]
+        point_counts = [len(points) for _, points in polygons]
+        return {
+            "version": np.array(CACHE_VERSION),
+            "input_size": np.array(self.input_size),
+            "paths": np.array([str(p.relative_to(self.root)) for p in image_paths]),
+            "image_hash": np.array([e["image_hash"] for e in entries]),
+            "image_size": np.array([e["image_size"] for e in entries], dtype=np.int64),
+            "image_mtime_ns": np.array([e["image_mtime_ns"] for e in entries], dtype=np.int64),
+            "label_mtime_ns": np.array([e["label_mtime_ns"] for e in entries], dtype=np.int64),
+            "original_shape": np.array([e["original_shape"] for e in entries], dtype=np.int32).reshape(-1, 2),
+            "letterbox": np.array([e["letterbox"] for e in entries], dtype=np.float32).reshape(-1, 3),
+            "label_offsets": np.concatenate(([0], np.cumsum(label_counts))).astype(np.int32),
+            "boxes": polygons_to_boxes(polygons),
+            "point_offsets": np.concatenate(([0], np.cumsum(point_counts))).astype(np.int32),
+            "points": (np.concatenate([points for _, points in polygons]) if polygons
+                       else np.zeros((0, 2))).astype(np.float32)
+        }
+    
+    def _unpack_entries(self) -> List[Dict[str, Any]]:
+        """Inverse of _pack_index (used for partial refreshes)"""
+        entries = []
+        for i in range(len(self.index["paths"])):
+            entries.append({
+                "image_hash": str(self.index["image_hash"][i]),
+                "image_size": int(self.index["image_size"][i]),
+                "image_mtime_ns": int(self.index["image_mtime_ns"][i]),
+                "label_mtime_ns": int(self.index["label_mtime_ns"][i]),
+                "original_shape": tuple(self.index["original_shape"][i]),
+                "letterbox": tuple(self.index["letterbox"][i]),
+                "polygons": self.polygons(i)
+            })
+        return entries
+    
+    def _write_index(self):
+        tmp_index = self.directory / "index.tmp.npz"
+        with open(tmp_index, "wb") as f:
+            np.savez(f, **self.index)
+        os.replace(tmp_index, self.index_file)
+    
+    def boxes(self, i: int) -> np.ndarray:
+        """(k, 5) class, x1, y1, x2, y2 normalized to the original image"""
+        start, end = self.index["label_offsets"][i], self.index["label_offsets"][i + 1]
+        return self.index["boxes"][start:end]
+    
+    def boxes_letterboxed(self, i: int) -> np.ndarray:
+        """(k, 4) x1, y1, x2, y2 in pixels of the cached (letterboxed) image"""
+        h, w = self.index["original_shape"][i]
+        scale, pad_x, pad_y = self.index["letterbox"][i]
+        boxes = self.boxes(i)[:, 1:] * np.array([w, h, w, h], dtype=np.float32)
+        return boxes * scale + np.array([pad_x, pad_y, pad_x, pad_y], dtype=np.float32)
+    
+    def polygons(self, i: int) -> List[Tuple[int, np.ndarray]]:
+        """(class, (K, 2) normalized points) for every label of image i"""
+        start, end = self.index["label_offsets"][i], self.index["label_offsets"][i + 1]
+        offsets = self.index["point_offsets"]
+        return [(int(self.index["boxes"][j, 0]), self.index["points"][offsets[j]:offsets[j + 1]])
+                for j in range(start, end)]
+    
+    def samples(self) -> Iterator[Tuple[Path, np.ndarray, np.ndarray, np.ndarray]]:
+        """(path, image view, gt boxes in image pixels, gt classes) for every cached image"""
+        for i, path in enumerate(self.paths):
+            yield path, self.images[i], self.boxes_letterboxed(i), self.boxes(i)[:, 0].astype(int)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """`python -m ppe_monitor cache [--splits valid test] [--size 640] [--force]`"""
+    parser = argparse.ArgumentParser(prog="ppe_monitor cache", description="Build the memory-mapped dataset cache")
+    parser.add_argument("--splits", nargs="+", default=["valid", "test"], help="dataset splits to cache")
+    parser.add_argument("--size", type=int, default=Config.CPU_MODEL_INPUT_SIZE, help="letterbox size (model input)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the cache is current")
+    args = parser.parse_args(argv)
+    
+    for split in args.splits:
+        start = time.perf_counter()
+        cache = DatasetCache(split, args.size)
+        if not cache.ensure(force=args.force):
+            logger.error(f"❌ Could not cache split '{split}'")
+            return 1
+        logger.info(f"✅ {split}: {len(cache)} images ready in {(time.perf_counter() - start) * 1000:.0f} ms ({cache.directory})")
+    return 0
@@ -0,0 +1,205 @@
+"""🧾 Dependency preflight and explicit (--install-deps) package installation"""
+
+import os
+import sys
+import json
+import time
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+
+def install_packages():
+    """Install/upgrade required packages (only run in --install-deps mode)"""
+    print("🚀 Checking and installing required packages...")
+    
+    # Core packages (essential)
+    core_packages = [
+        "numpy",  # Install numpy first without version constraint
+        "opencv-python", 
+        "requests",
+        "pillow"
+    ]
+    
+    # Optional packages
+    optional_packages = [
+        "picamera2",  # May not work on all systems
+        "hailo-platform"  # May not be available
+    ]
+    
+    # Install core packages first
+    for package in core_packages:
+        try:
+            print(f"📦 Installing {package}...")
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install", package, 
+                "--upgrade", "--quiet"
+            ])
+            print(f"✅ {package} installed successfully")
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Failed to install {package}: {e}")
+            if package in ["numpy", "opencv-python"]:  # Critical packages
+                print(f"⚠️  {package} is required but failed to install!")
+                return False
+    
+    # Install optional packages
+    for package in optional_packages:
+        try:
+            print(f"📦 Installing {package}...")
+            # Use different strategies for different packages
+            if package == "picamera2":
+                # Try system package first for picamera2
+                try:
+                    subprocess.check_call(["sudo", "apt", "install", "-y", "python3-picamera2"], 
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    print(f"✅ {package} installed via apt")
+                    continue
+                except:
+                    pass
+            
+            subprocess.check_call([sys.executable, "-m", "pip", "install", package, "--quiet"])
+            print(f"✅ {package} installed successfully")
+        except subprocess.CalledProcessError:
+            print(f"⚠️  {package} not available, will use fallback mode")
+    
+    # Install from wheel if available
+    wheel_file = "hailo_dataflow_compiler-3.27.0-py3-none-linux_x86_64.whl"
+    if Path(wheel_file).exists():
+        try:
+            print(f"🎯 Installing {wheel_file}...")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", wheel_file, "--quiet"])
+            print(f"✅ Hailo compiler installed from wheel")
+        except subprocess.CalledProcessError:
+            print(f"⚠️  Failed to install wheel file")
+    
+    # Fix numpy/simplejpeg binary compatibility (previously forced on every start)
+    try:
+        print("🔧 Fixing numpy/simplejpeg compatibility...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "--force-reinstall", "numpy", "--quiet"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "simplejpeg", "--quiet"])
+        print("✅ NumPy/simplejpeg reinstalled")
+    except subprocess.CalledProcessError:
+        print("⚠️  NumPy/simplejpeg reinstall failed, continuing anyway...")
+    
+    print("📦 Package installation completed!")
+    return True
+
+# Distributions checked at startup (alternatives cover headless/system builds)
+DEPENDENCY_MANIFEST = [
+    {"name": "numpy", "import": "numpy", "distributions": ["numpy"], "min_version": "1.20", "required": True},
+    {"name": "opencv-python", "import": "cv2", "distributions": ["opencv-python", "opencv-python-headless", "opencv-contrib-python"],
+     "min_version": "4.5", "required": True},
+    {"name": "requests", "import": "requests", "distributions": ["requests"], "min_version": "2.20", "required": True},
+    {"name": "pillow", "import": "PIL", "distributions": ["pillow", "Pillow"], "min_version": None, "required": False},
+    {"name": "picamera2", "import": "picamera2", "distributions": ["picamera2"], "min_version": None, "required": False},
+    {"name": "hailo-platform", "import": "hailo_platform", "distributions": ["hailo-platform", "hailort"], "min_version": None, "required": False},
+]
+
+DEPENDENCY_CACHE_FILE = Path.home() / ".cache" / "hailo_detection" / "dependency_preflight.json"
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """Convert a version string to a comparable tuple of its leading numeric parts"""
+    parts = []
+    for part in version.split("."):
+        digits = ""
+        for ch in part:
+            if not ch.isdigit():
+                break
+            digits += ch
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+def dependency_fingerprint() -> str:
+    """Fingerprint of interpreter, manifest and site-packages mtimes"""
+    import hashlib
+    import site
+    
+    site_dirs = list(site.getsitepackages()) if hasattr(site, "getsitepackages") else []
+    user_site = site.getusersitepackages() if hasattr(site, "getusersitepackages") else None
+    if user_site:
+        site_dirs.append(user_site)
+    
+    mtimes = []
+    for site_dir in sorted(set(site_dirs)):
+        try:
+            mtimes.append((site_dir, os.stat(site_dir).st_mtime_ns))
+        except OSError:
+            mtimes.append((site_dir, None))
+    
+    payload = json.dumps({
+        "executable": sys.executable,
+        "version": sys.version,
+        "manifest": DEPENDENCY_MANIFEST,
+        "site_packages": mtimes
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def check_dependencies() -> Dict[str, Any]:
+    """Check installed versions against the manifest via importlib.metadata"""
+    import importlib.util
+    from importlib import metadata
+    
+    missing_required, missing_optional, installed = [], [], {}
+    for entry in DEPENDENCY_MANIFEST:
+        found = None
+        for dist in entry["distributions"]:
+            try:
+                found = (dist, metadata.version(dist))
+                break
+            except metadata.PackageNotFoundError:
+                continue
+        
+        if found is None and importlib.util.find_spec(entry["import"]) is not None:
+            # System (apt) builds may ship without dist-info; accept an importable module
+            found = (entry["import"], "system")
+        
+        satisfied = found is not None
+        if satisfied and entry["min_version"] and found[1] != "system":
+            satisfied = _version_tuple(found[1]) >= _version_tuple(entry["min_version"])
+        
+        if satisfied:
+            installed[entry["name"]] = f"{found[0]} {found[1]}"
+        elif entry["required"]:
+            missing_required.append(entry["name"] if not found else f"{entry['name']} ({found[1]} < {entry['min_version']})")
+        else:
+            missing_optional.append(entry["name"])
+    
+    return {"installed": installed, "missing_required": missing_required, "missing_optional": missing_optional}
+
+def preflight_dependencies() -> bool:
+    """Fast startup dependency check with a cached "satisfied" fingerprint"""
+    start = time.monotonic()
+    fingerprint = dependency_fingerprint()
+    
+    try:
+        cached = json.loads(DEPENDENCY_CACHE_FILE.read_text())
+        if cached.get("fingerprint") == fingerprint:
+            print(f"✅ Dependencies satisfied (cached, {(time.monotonic() - start) * 1000:.0f}ms)")
+            return True
+    except (OSError, ValueError):
+        pass
+    
+    report = check_dependencies()
+    for name in report["missing_optional"]:
+        print(f"⚠️  Optional package {name} not installed, will use fallback mode")
+    
+    if report["missing_required"]:
+        print(f"❌ Missing required packages: {', '.join(report['missing_required'])}")
+        return False
+    
+    try:
+        DEPENDENCY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DEPENDENCY_CACHE_FILE.write_text(json.dumps({
+            "fingerprint": fingerprint,
+            "checked_at": datetime.now().isoformat(),
+            "installed": report["installed"],
+            "missing_optional": report["missing_optional"]
+        }, indent=2))
+    except OSError as e:
+        print(f"⚠️  Could not write dependency cache: {e}")
+    
+    print(f"✅ Dependencies satisfied ({(time.monotonic() - start) * 1000:.0f}ms)")
+    return True
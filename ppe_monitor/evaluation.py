@@ -0,0 +1,256 @@
+"""🎯 Accuracy vs speed evaluation (precision / recall / mAP@0.5:0.95 alongside FPS)"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import itertools
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+import cv2
+import numpy as np
+
+from . import __version__
+from .config import Config
+from .dataset import split_image_paths, label_path_for, load_labels
+from .dataset_cache import DatasetCache
+from .postprocess import box_iou_matrix
+
+logger = logging.getLogger('HailoAI')
+
+IOU_THRESHOLDS = np.linspace(0.5, 0.95, 10)
+RECALL_POINTS = np.linspace(0, 1, 101)  # COCO 101-point interpolation
+
+
+def match_predictions(pred_boxes: np.ndarray, pred_classes: np.ndarray, gt_boxes: np.ndarray,
+                      gt_classes: np.ndarray, iou_thresholds: np.ndarray = IOU_THRESHOLDS) -> np.ndarray:
+    """(P, T) true-positive matrix: each ground truth matches at most one prediction per IoU threshold"""
+    correct = np.zeros((len(pred_boxes), len(iou_thresholds)), dtype=bool)
+    if len(pred_boxes) == 0 or len(gt_boxes) == 0:
+        return correct
+    
+    iou = box_iou_matrix(gt_boxes, pred_boxes)
+    iou[gt_classes[:, None] != pred_classes[None, :]] = 0.0
+    
+    for t, threshold in enumerate(iou_thresholds):
+        gt_idx, pred_idx = np.nonzero(iou >= threshold)
+        if gt_idx.size == 0:
+            continue
+        # Highest-IoU pairs first, then keep the first use of every prediction and ground truth
+        order = np.argsort(-iou[gt_idx, pred_idx], kind="stable")
+        gt_idx, pred_idx = gt_idx[order], pred_idx[order]
+        _, first = np.unique(pred_idx, return_index=True)
+        gt_idx, pred_idx = gt_idx[first], pred_idx[first]
+        _, first = np.unique(gt_idx, return_index=True)
+        correct[pred_idx[first], t] = True
+    return correct
+
+
+def average_precision(recall: np.ndarray, precision: np.ndarray) -> float:
+    """COCO-style AP: mean of the precision envelope at 101 recall points (0 beyond max recall)"""
+    envelope = np.flip(np.maximum.accumulate(np.flip(precision)))
+    index = np.searchsorted(recall, RECALL_POINTS, side="left")
+    sampled = np.zeros(len(RECALL_POINTS))
+    reached = index < len(recall)
+    sampled[reached] = envelope[index[reached]]
+    return float(np.mean(sampled))
+
+
+def ap_per_class(correct: np.ndarray, confidences: np.ndarray, pred_classes: np.ndarray,
+                 gt_classes: np.ndarray, num_classes: int) -> Dict[str, np.ndarray]:
+    """Per-class precision, recall (at IoU 0.5, all kept detections) and AP per IoU threshold"""
+    order = np.argsort(-confidences, kind="stable")
+    correct, pred_classes = correct[order], pred_classes[order]
+    
+    ap = np.full((num_classes, correct.shape[1]), np.nan)
+    precision = np.full(num_classes, np.nan)
+    recall = np.full(num_classes, np.nan)
+    ground_truths = np.bincount(gt_classes.astype(int), minlength=num_classes)
+    
+    for c in range(num_classes):
+        if ground_truths[c] == 0:
+            continue
+        hits = correct[pred_classes == c]
+        if len(hits) == 0:
+            ap[c], precision[c], recall[c] = 0.0, 0.0, 0.0
+            continue
+        tp = np.cumsum(hits, axis=0)
+        fp = np.cumsum(~hits, axis=0)
+        recall_curve = tp / ground_truths[c]
+        precision_curve = tp / (tp + fp)
+        ap[c] = [average_precision(recall_curve[:, t], precision_curve[:, t]) for t in range(correct.shape[1])]
+        precision[c], recall[c] = precision_curve[-1, 0], recall_curve[-1, 0]
+    
+    return {"ap": ap, "precision": precision, "recall": recall, "ground_truths": ground_truths}
+
+
+def iter_samples(image_paths: List[Path]) -> Iterator[Tuple[Path, np.ndarray, np.ndarray, np.ndarray]]:
+    """(path, image, gt boxes in image pixels, gt classes), decoding each JPEG"""
+    for path in image_paths:
+        image = cv2.imread(str(path))
+        if image is None:
+            logger.warning(f"⚠️  Unreadable image skipped: {path}")
+            continue
+        h, w = image.shape[:2]
+        labels = load_labels(label_path_for(path))
+        yield path, image, labels[:, 1:] * np.array([w, h, w, h], dtype=np.float32), labels[:, 0].astype(int)
+
+
+def evaluate_split(inference, samples: Iterable[Tuple[Path, np.ndarray, np.ndarray, np.ndarray]],
+                   skip: int = 1) -> Dict[str, Any]:
+    """Run a backend over samples and score its detections; skip > 1 reuses the last result in between"""
+    num_classes = len(Config.CLASS_NAMES)
+    correct, confidences, pred_classes, gt_classes = [], [], [], []
+    inference_seconds = 0.0
+    inferences = 0
+    last_detections: List[Dict] = []
+    
+    for index, (path, image, gt_boxes, gt_cls) in enumerate(samples):
+        # Images are treated as consecutive frames: skipped frames reuse the previous detections
+        if index % skip == 0:
+            start = time.perf_counter()
+            last_detections = inference.inference(image)
+            inference_seconds += time.perf_counter() - start
+            inferences += 1
+        detections = last_detections
+        
+        pred_boxes = np.array([d['bbox'] for d in detections], dtype=np.float32).reshape(-1, 4)
+        pred_cls = np.array([d['class_id'] for d in detections], dtype=int)
+        
+        correct.append(match_predictions(pred_boxes, pred_cls, gt_boxes, gt_cls))
+        confidences.append(np.array([d['confidence'] for d in detections], dtype=np.float32))
+        pred_classes.append(pred_cls)
+        gt_classes.append(gt_cls)
+    
+    frames = len(gt_classes)
+    stats = ap_per_class(np.concatenate(correct) if correct else np.zeros((0, len(IOU_THRESHOLDS)), dtype=bool),
+                         np.concatenate(confidences) if confidences else np.zeros(0),
+                         np.concatenate(pred_classes) if pred_classes else np.zeros(0, dtype=int),
+                         np.concatenate(gt_classes) if gt_classes else np.zeros(0, dtype=int),
+                         num_classes)
+    
+    per_class = {}
+    for c, name in enumerate(Config.CLASS_NAMES):
+        per_class[name] = {
+            "instances": int(stats["ground_truths"][c]),
+            "precision": _nan_to_none(stats["precision"][c]),
+            "recall": _nan_to_none(stats["recall"][c]),
+            "ap50": _nan_to_none(stats["ap"][c, 0]),
+            "ap50_95": _nan_to_none(np.mean(stats["ap"][c]) if not np.isnan(stats["ap"][c, 0]) else np.nan)
+        }
+    
+    evaluated = ~np.isnan(stats["ap"][:, 0])
+    return {
+        "frames": frames,
+        "inferences": inferences,
+        "inference_seconds": inference_seconds,
+        "fps": frames / inference_seconds if inference_seconds > 0 else 0.0,
+        "precision": _nan_to_none(np.mean(stats["precision"][evaluated])) if evaluated.any() else None,
+        "recall": _nan_to_none(np.mean(stats["recall"][evaluated])) if evaluated.any() else None,
+        "map50": _nan_to_none(np.mean(stats["ap"][evaluated, 0])) if evaluated.any() else None,
+        "map50_95": _nan_to_none(np.mean(stats["ap"][evaluated])) if evaluated.any() else None,
+        "classes": per_class
+    }
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if value is None or np.isnan(value) else float(value)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "   -  " if value is None else f"{value:6.3f}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """`python -m ppe_monitor eval --backend cpu --split valid --conf 0.25 0.5 --skip 1 2`"""
+    from .bench import BACKENDS, create_backend
+    
+    parser = argparse.ArgumentParser(prog="ppe_monitor eval", description="Accuracy (mAP) vs speed (FPS) evaluation")
+    parser.add_argument("--backend", choices=BACKENDS, default="haar", help="inference backend (default: haar)")
+    parser.add_argument("--split", default="valid", help="dataset split to evaluate (default: valid)")
+    parser.add_argument("--conf", nargs="+", type=float, default=[Config.CONFIDENCE_THRESHOLD], help="confidence thresholds to sweep")
+    parser.add_argument("--nms", nargs="+", type=float, default=[Config.NMS_THRESHOLD], help="NMS IoU thresholds to sweep")
+    parser.add_argument("--skip", nargs="+", type=int, default=[1], help="run inference every Nth frame (1 = every frame)")
+    parser.add_argument("--input-sizes", nargs="+", type=int, help="model input sizes to sweep (cpu backend only)")
+    parser.add_argument("--cache", action="store_true", help="read letterboxed images from the memory-mapped dataset cache")
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/eval_<backend>_<time>.json)")
+    args = parser.parse_args(argv)
+    
+    image_paths = split_image_paths(args.split)
+    if not image_paths:
+        logger.error(f"❌ No images found for split '{args.split}'")
+        return 1
+    
+    cache = None
+    if args.cache:
+        cache = DatasetCache(args.split)
+        if not cache.ensure():
+            logger.error(f"❌ Could not build the dataset cache for '{args.split}'")
+            return 1
+    
+    inference = create_backend(args.backend)
+    if inference is None:
+        return 1
+    input_sizes = args.input_sizes or [None]
+    if args.input_sizes and args.backend != "cpu":
+        logger.warning("⚠️  --input-sizes only applies to the cpu backend (Hailo HEF input size is fixed at compile time)")
+        input_sizes = [None]
+    
+    logger.info(f"🎯 Evaluating {args.backend} on {args.split} ({len(image_paths)} images)")
+    saved = (Config.CONFIDENCE_THRESHOLD, Config.NMS_THRESHOLD)
+    runs = []
+    previous_level = logger.level
+    try:
+        for input_size, conf, nms, skip in itertools.product(input_sizes, args.conf, args.nms, args.skip):
+            Config.CONFIDENCE_THRESHOLD, Config.NMS_THRESHOLD = conf, nms
+            if input_size:
+                inference.input_size = input_size
+                inference.input_shape = (input_size, input_size, 3)
+                inference.network_group.input_size = input_size
+            
+            logger.setLevel(logging.WARNING)  # per-inference INFO logs would distort FPS
+            samples = cache.samples() if cache else iter_samples(image_paths)
+            result = evaluate_split(inference, samples, max(1, skip))
+            logger.setLevel(previous_level)
+            
+            result.update({"confidence": conf, "nms": nms, "skip": skip, "input_size": input_size})
+            runs.append(result)
+            logger.info(f"   conf {conf:.2f} nms {nms:.2f} skip {skip} size {input_size or '-'}: "
+                        f"{result['fps']:7.1f} FPS | P {_fmt(result['precision'])} R {_fmt(result['recall'])} "
+                        f"mAP50 {_fmt(result['map50'])} mAP50-95 {_fmt(result['map50_95'])}")
+    finally:
+        logger.setLevel(previous_level)
+        Config.CONFIDENCE_THRESHOLD, Config.NMS_THRESHOLD = saved
+        inference.cleanup()
+    
+    best = max(runs, key=lambda r: r["map50_95"] or 0.0)
+    logger.info(f"🏆 Best mAP50-95 {_fmt(best['map50_95'])} at conf {best['confidence']:.2f}, nms {best['nms']:.2f}, "
+                f"skip {best['skip']} ({best['fps']:.1f} FPS)")
+    logger.info("   class          instances     P        R      AP50   AP50-95")
+    for name, stats in best["classes"].items():
+        logger.info(f"   {name:<14} {stats['instances']:9d}  {_fmt(stats['precision'])}  {_fmt(stats['recall'])}  "
+                    f"{_fmt(stats['ap50'])}  {_fmt(stats['ap50_95'])}")
+    
+    result = {
+        "benchmark": "evaluation",
+        "version": __version__,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "backend": args.backend,
+        "split": args.split,
+        "images": len(image_paths),
+        "runs": runs
+    }
+    output = Path(args.output) if args.output else Path(Config.BENCHMARK_DIR) / f"eval_{args.backend}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    logger.info(f"💾 Result: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import run
+    sys.exit(run(["eval"] + sys.argv[1:]))
@@ -0,0 +1,255 @@
+"""🗄️ Local event store: SQLite (WAL) violations and stats snapshots, written in batches by one thread"""
+
+import json
+import time
+import queue
+import sqlite3
+import logging
+import argparse
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from .config import Config
+from .metrics import register_queue, unregister_queue
+
+logger = logging.getLogger('HailoAI')
+
+_STOP = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS violations (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    camera TEXT NOT NULL,
+    frame INTEGER,
+    class_name TEXT NOT NULL,
+    confidence REAL,
+    x1 INTEGER, y1 INTEGER, x2 INTEGER, y2 INTEGER,
+    zone TEXT,
+    evidence TEXT
+);
+CREATE INDEX IF NOT EXISTS violations_ts ON violations (ts);
+CREATE INDEX IF NOT EXISTS violations_camera_ts ON violations (camera, ts);
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    camera TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stats_ts ON stats (ts);
+"""
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Connection in WAL mode (readers never block the writer)"""
+    connection = sqlite3.connect(path, timeout=10)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+class EventStore:
+    """Violation rows and periodic stats snapshots, queued from the frame loop and inserted in batches
+    
+    Only the "event-writer" thread writes: it drains up to EVENT_BATCH_SIZE queued
+    rows per transaction and prunes rows older than EVENT_RETENTION_DAYS. Queries open
+    their own read connection, so reports can run while the monitor is writing.
+    """
+    
+    def __init__(self, path: Optional[str] = None, camera: Optional[str] = None):
+        self.path = str(path or Config.EVENT_DB_PATH)
+        self.camera = camera or Config.EVENT_CAMERA_NAME
+        self.queue: queue.Queue = queue.Queue(maxsize=Config.EVENT_QUEUE_SIZE)
+        self.thread: Optional[threading.Thread] = None
+        self.last_prune = 0.0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.pruned = 0
+    
+    def start(self) -> bool:
+        """Create the schema and start the writer thread"""
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            with closing(connect(self.path)) as connection:
+                connection.executescript(SCHEMA)
+                connection.commit()
+        except Exception as e:
+            logger.error(f"❌ Event store unavailable ({self.path}): {e}")
+            return False
+        self.thread = threading.Thread(target=self._writer_loop, name="event-writer", daemon=True)
+        self.thread.start()
+        register_queue("events", self.queue.qsize)
+        logger.info(f"🗄️ Event store: {self.path} (camera {self.camera}, {Config.EVENT_RETENTION_DAYS} day retention)")
+        return True
+    
+    def _put(self, item: tuple):
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+    
+    def record_violations(self, detections: List[Dict], frame: Optional[int] = None,
+                          evidence: Optional[str] = None, timestamp: Optional[float] = None):
+        """Queue one row per violation detection (frame loop; never blocks)"""
+        ts = time.time() if timestamp is None else timestamp
+        for d in detections:
+            x1, y1, x2, y2 = (int(v) for v in d['bbox'])
+            self._put(("violation", (ts, self.camera, frame, d['class_name'], float(d['confidence']),
+                                     x1, y1, x2, y2, d.get('zone'), evidence)))
+    
+    def record_stats(self, stats: Dict[str, Any], timestamp: Optional[float] = None):
+        """Queue a statistics snapshot (stored as JSON)"""
+        ts = time.time() if timestamp is None else timestamp
+        self._put(("stats", (ts, self.camera, json.dumps(stats, default=str))))
+    
+    def _writer_loop(self):
+        connection = connect(self.path)
+        try:
+            running = True
+            while running:
+                try:
+                    batch = [self.queue.get(timeout=Config.EVENT_FLUSH_INTERVAL)]
+                except queue.Empty:
+                    batch = []
+                # Keep collecting for up to EVENT_FLUSH_INTERVAL so a trickle still shares one transaction
+                deadline = time.time() + Config.EVENT_FLUSH_INTERVAL
+                while batch and batch[-1] is not _STOP and len(batch) < Config.EVENT_BATCH_SIZE:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(self.queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                if _STOP in batch:
+                    running = False
+                    batch = [item for item in batch if item is not _STOP]
+                if batch:
+                    self._write_batch(connection, batch)
+                if time.time() - self.last_prune >= Config.EVENT_PRUNE_INTERVAL:
+                    self.prune(connection)
+        finally:
+            connection.close()
+    
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[tuple]):
+        violations = [row for kind, row in batch if kind == "violation"]
+        stats = [row for kind, row in batch if kind == "stats"]
+        try:
+            with connection:
+                if violations:
+                    connection.executemany(
+                        "INSERT INTO violations (ts, camera, frame, class_name, confidence, x1, y1, x2, y2, zone, evidence) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", violations)
+                if stats:
+                    connection.executemany("INSERT INTO stats (ts, camera, data) VALUES (?, ?, ?)", stats)
+            self.written += len(batch)
+            self.batches += 1
+        except sqlite3.Error as e:
+            self.dropped += len(batch)
+            logger.error(f"❌ Event store write failed ({len(batch)} rows lost): {e}")
+    
+    def prune(self, connection: Optional[sqlite3.Connection] = None):
+        """Delete rows older than EVENT_RETENTION_DAYS"""
+        self.last_prune = time.time()
+        cutoff = self.last_prune - Config.EVENT_RETENTION_DAYS * 86400
+        own = connection is None
+        connection = connection or connect(self.path)
+        try:
+            with connection:
+                deleted = connection.execute("DELETE FROM violations WHERE ts < ?", (cutoff,)).rowcount
+                deleted += connection.execute("DELETE FROM stats WHERE ts < ?", (cutoff,)).rowcount
+            if deleted:
+                self.pruned += deleted
+                logger.info(f"🗑️ Event store: pruned {deleted} rows older than {Config.EVENT_RETENTION_DAYS} days")
+        except sqlite3.Error as e:
+            logger.error(f"❌ Event store prune failed: {e}")
+        finally:
+            if own:
+                connection.close()
+    
+    def query_violations(self, start: float, end: float, camera: Optional[str] = None,
+                         limit: int = 1000) -> List[Dict[str, Any]]:
+        """Violation rows in [start, end) (uses the ts / camera+ts indexes)"""
+        sql = "SELECT * FROM violations WHERE ts >= ? AND ts < ?"
+        params: List[Any] = [start, end]
+        if camera:
+            sql += " AND camera = ?"
+            params.append(camera)
+        sql += " ORDER BY ts LIMIT ?"
+        params.append(limit)
+        with closing(connect(self.path)) as connection:
+            return [dict(row) for row in connection.execute(sql, params)]
+    
+    def query_stats(self, start: float, end: float) -> List[Dict[str, Any]]:
+        """Stats snapshots in [start, end)"""
+        with closing(connect(self.path)) as connection:
+            rows = connection.execute("SELECT ts, camera, data FROM stats WHERE ts >= ? AND ts < ? ORDER BY ts",
+                                      (start, end))
+            return [{"ts": row["ts"], "camera": row["camera"], **json.loads(row["data"])} for row in rows]
+    
+    def summary(self, start: float, end: float, camera: Optional[str] = None) -> Dict[str, Any]:
+        """Violation counts per camera/class and per hour in [start, end), optionally for one camera"""
+        params = (start, end, camera, camera)
+        with closing(connect(self.path)) as connection:
+            by_class = connection.execute(
+                "SELECT camera, class_name, COUNT(*) AS count, AVG(confidence) AS confidence FROM violations "
+                "WHERE ts >= ? AND ts < ? AND (? IS NULL OR camera = ?) "
+                "GROUP BY camera, class_name ORDER BY count DESC", params).fetchall()
+            by_hour = connection.execute(
+                "SELECT CAST(ts / 3600 AS INTEGER) * 3600 AS hour, COUNT(*) AS count FROM violations "
+                "WHERE ts >= ? AND ts < ? AND (? IS NULL OR camera = ?) GROUP BY hour ORDER BY hour", params).fetchall()
+        return {"by_class": [dict(row) for row in by_class], "by_hour": [dict(row) for row in by_hour]}
+    
+    def stop(self, timeout: float = 10.0):
+        """Flush queued rows and stop the writer thread"""
+        if self.thread is None:
+            return
+        self.queue.put(_STOP)
+        self.thread.join(timeout)
+        self.thread = None
+        unregister_queue("events")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer counters"""
+        return {
+            "queued": self.queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "pruned": self.pruned
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """`python -m ppe_monitor events [--hours 24] [--camera NAME] [--list]` compliance report"""
+    parser = argparse.ArgumentParser(prog="ppe_monitor events", description="Report stored violations")
+    parser.add_argument("--hours", type=float, default=24, help="report window ending now")
+    parser.add_argument("--camera", help="only this camera")
+    parser.add_argument("--list", action="store_true", help="also list individual violations")
+    parser.add_argument("--db", default=Config.EVENT_DB_PATH, help="event database path")
+    args = parser.parse_args(argv)
+    
+    if not Path(args.db).exists():
+        logger.error(f"❌ No event database at {args.db}")
+        return 1
+    store = EventStore(args.db)
+    end = time.time()
+    start = end - args.hours * 3600
+    
+    summary = store.summary(start, end, args.camera)
+    logger.info(f"🗄️ Violations in the last {args.hours:g}h ({args.db})")
+    for row in summary["by_class"]:
+        logger.info(f"   {row['camera']:<16} {row['class_name']:<12} {row['count']:6d}  (avg conf {row['confidence']:.2f})")
+    for row in summary["by_hour"]:
+        logger.info(f"   {datetime.fromtimestamp(row['hour']).strftime('%Y-%m-%d %H:00')}  {row['count']:6d}")
+    if args.list:
+        for row in store.query_violations(start, end, args.camera):
+            logger.info(f"   {datetime.fromtimestamp(row['ts']).isoformat(timespec='seconds')} {row['camera']} "
+                        f"{row['class_name']} {row['confidence']:.2f} [{row['x1']}, {row['y1']}, {row['x2']}, {row['y2']}]"
+                        f"{' ' + row['evidence'] if row['evidence'] else ''}")
+    return 0
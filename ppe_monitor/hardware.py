@@ -0,0 +1,81 @@
+"""🔌 Lazy loading of optional hardware SDKs (Hailo platform, PiCamera2)"""
+
+import logging
+import threading
+from typing import Any, Optional
+
+from .config import Config
+
+logger = logging.getLogger('HailoAI')
+
+_lock = threading.Lock()
+_hailo_module: Optional[Any] = None
+_hailo_checked = False
+_hailo_mock = False
+_picamera_class: Optional[Any] = None
+_picamera_checked = False
+
+
+def load_hailo() -> Optional[Any]:
+    """Import hailo_platform on first use; returns the module or None if unavailable"""
+    global _hailo_module, _hailo_checked, _hailo_mock
+    with _lock:
+        if not _hailo_checked:
+            _hailo_checked = True
+            if Config.MOCK_HAILO:
+                from .mock_hailo import create_mock_hailo
+                _hailo_module = create_mock_hailo()
+                _hailo_mock = True
+                logger.info("🧪 Using the mock Hailo device (replayed output tensors, simulated latency)")
+                return _hailo_module
+            try:
+                import hailo_platform
+                _hailo_module = hailo_platform
+                logger.info("✅ Hailo Platform imported successfully")
+            except ImportError:
+                logger.warning("⚠️  Hailo Platform not available - will use CPU inference fallback")
+        return _hailo_module
+
+
+def hailo_available() -> bool:
+    """True if the Hailo platform SDK can be imported"""
+    return load_hailo() is not None
+
+
+def hailo_is_mock() -> bool:
+    """True if the Hailo module is the mock device stand-in"""
+    return load_hailo() is not None and _hailo_mock
+
+
+def install_hailo(module: Any, mock: bool = True):
+    """Use the given module in place of hailo_platform (e.g. a preconfigured mock)"""
+    global _hailo_module, _hailo_checked, _hailo_mock
+    with _lock:
+        _hailo_module = module
+        _hailo_checked = True
+        _hailo_mock = mock
+
+
+def load_picamera2() -> Optional[Any]:
+    """Import the Picamera2 class on first use; returns None if unavailable"""
+    global _picamera_class, _picamera_checked
+    with _lock:
+        if not _picamera_checked:
+            _picamera_checked = True
+            try:
+                from picamera2 import Picamera2
+                _picamera_class = Picamera2
+                logger.info("✅ PiCamera2 imported successfully")
+            except ImportError as e:
+                logger.warning(f"⚠️  PiCamera2 not available: {e}")
+                logger.info("🔄 Will use USB camera or simulation mode")
+            except ValueError as e:
+                logger.warning(f"⚠️  PiCamera2 binary compatibility issue: {e}")
+                logger.info("💡 Run with --install-deps to rebuild numpy/simplejpeg")
+                logger.info("🔄 Will use USB camera or simulation mode")
+        return _picamera_class
+
+
+def picamera_available() -> bool:
+    """True if PiCamera2 can be imported"""
+    return load_picamera2() is not None
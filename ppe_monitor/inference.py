@@ -0,0 +1,674 @@
+"""🤖 AI inference engine (Hailo, ONNX on CPU, or the Haar/heuristic CPU fallback)"""
+
+import time
+import logging
+import threading
+import traceback
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Tuple, Any
+
+import cv2
+import numpy as np
+
+from .config import Config
+from . import hardware
+from . import postprocess
+from .instrumentation import get_instrumentation
+
+logger = logging.getLogger('HailoAI')
+
+THROUGHPUT_WINDOW = 10.0  # seconds of completed inferences behind throughput_fps
+
+_shared_device = None
+_shared_device_users = 0
+_shared_device_lock = threading.Lock()
+
+
+def _acquire_shared_vdevice(hailo):
+    """One scheduler-enabled VDevice per process, shared by every network group"""
+    global _shared_device, _shared_device_users
+    with _shared_device_lock:
+        if _shared_device is None:
+            params = hailo.VDevice.create_params()
+            params.scheduling_algorithm = getattr(hailo.HailoSchedulingAlgorithm, Config.HAILO_SCHEDULING_ALGORITHM)
+            if Config.HAILO_MULTI_PROCESS:
+                # Other camera processes join the same device through hailort_service
+                params.multi_process_service = True
+                params.group_id = Config.HAILO_GROUP_ID
+            _shared_device = hailo.VDevice(params)
+            logger.info(f"🗓️ Hailo scheduler enabled ({Config.HAILO_SCHEDULING_ALGORITHM}"
+                        f"{', multi-process group ' + Config.HAILO_GROUP_ID if Config.HAILO_MULTI_PROCESS else ''})")
+        _shared_device_users += 1
+        return _shared_device
+
+
+def _release_shared_vdevice():
+    """Drop one user of the shared VDevice; the last one releases it"""
+    global _shared_device, _shared_device_users
+    with _shared_device_lock:
+        _shared_device_users = max(0, _shared_device_users - 1)
+        if _shared_device_users == 0 and _shared_device is not None:
+            _shared_device.release()
+            _shared_device = None
+
+
+class HailoInference:
+    """Enhanced Hailo AI inference with CPU fallback support"""
+    
+    def __init__(self, hef_path: str, network_name: str = "ppe"):
+        self.hef_path = hef_path
+        self.network_name = network_name
+        self.network_settings = Config.HAILO_NETWORKS.get(network_name, {})
+        self.class_names = self.network_settings.get("classes")  # None = Config.CLASS_NAMES
+        self.shared_device = False
+        self.completed_times = deque(maxlen=1024)
+        self.completed_lock = threading.Lock()  # the metrics thread reads completed_times while frames append
+        self.device = None
+        self.network_group = None
+        self.input_vstreams = None
+        self.output_vstreams = None
+        self.input_shape = None
+        self.output_shapes = None
+        self.nms_shapes = []  # per output: (classes, max boxes per class) for on-chip NMS, None for raw tensors
+        self.output_quant = []  # per output: (scale, zero point) from the HEF
+        self.quantized_outputs = False  # UINT8 output vstreams, dequantized on the host per candidate
+        self.output_bytes = 0
+        self.inference_count = 0
+        self.successful_inferences = 0
+        self.failed_inferences = 0
+        self.use_fallback = not hardware.hailo_available()
+        self.engine_name = "Hailo AI"
+        
+        logger.info(f"🤖 Initializing AI inference engine...")
+        logger.info(f"📁 Model path: {hef_path}")
+        logger.info(f"⚡ Using {'Hailo AI' if not self.use_fallback else 'CPU Fallback'} mode")
+        
+    def initialize(self) -> bool:
+        """Initialize AI inference engine with fallback support"""
+        
+        # Check if model file exists (the mock device does not read it)
+        if not Path(self.hef_path).exists() and not hardware.hailo_is_mock():
+            logger.warning(f"📁 Model file not found: {self.hef_path}")
+            logger.warning("⚠️  Switching to simulation mode")
+            self.use_fallback = True
+            Config.SIMULATION_MODE = True
+            return True
+        
+        hailo = hardware.load_hailo()
+        if hailo is None:
+            logger.info("💻 Using CPU fallback mode (Hailo platform not available)")
+            self.use_fallback = True
+            return True
+        
+        try:
+            logger.info("🚀 Initializing Hailo AI hardware...")
+            
+            # Load HEF
+            logger.info("📂 Loading HEF model...")
+            hef = hailo.HEF(self.hef_path)
+            
+            # Create VDevice
+            logger.info("🔌 Connecting to Hailo device...")
+            if Config.HAILO_SCHEDULER:
+                self.device = _acquire_shared_vdevice(hailo)
+                self.shared_device = True
+            else:
+                try:
+                    # Try different VDevice initialization methods
+                    try:
+                        self.device = hailo.VDevice()
+                    except TypeError:
+                        # Try alternative initialization
+                        self.device = hailo.Device()
+                except Exception as device_err:
+                    logger.error(f"Failed to create Hailo device: {device_err}")
+                    raise device_err
+            
+            # Configure network group
+            logger.info("⚙️ Configuring network group...")
+            configure_params = hailo.ConfigureParams.create_from_hef(hef, interface=hailo.HailoStreamInterface.PCIe)
+            network_groups = self.device.configure(hef, configure_params)
+            self.network_group = network_groups[0]
+            if self.shared_device:
+                self._apply_scheduler_settings()
+            
+            # Get input/output information
+            self.input_vstream_info = hef.get_input_vstream_infos()[0]
+            self.output_vstream_infos = hef.get_output_vstream_infos()
+            
+            self.input_shape = self.input_vstream_info.shape
+            self.output_shapes = [info.shape for info in self.output_vstream_infos]
+            self.nms_shapes = [postprocess.nms_shape_of(info) for info in self.output_vstream_infos]
+            self.output_quant = [postprocess.quant_info_of(info) for info in self.output_vstream_infos]
+            # On-chip NMS results are already small; only raw tensors benefit from UINT8 transfer
+            self.quantized_outputs = bool(Config.HAILO_QUANTIZED_OUTPUTS) and not any(self.nms_shapes)
+            
+            # Create VStreams
+            logger.info("🌊 Setting up data streams...")
+            input_params = hailo.InputVStreamParams.make_from_network_group(
+                self.network_group, format_type=hailo.FormatType.UINT8)[0]
+            output_format = hailo.FormatType.UINT8 if self.quantized_outputs else hailo.FormatType.FLOAT32
+            output_params = hailo.OutputVStreamParams.make_from_network_group(
+                self.network_group, format_type=output_format)
+            
+            self.input_vstreams = hailo.InferVStreams(self.device, input_params, [])
+            self.output_vstreams = hailo.InferVStreams(self.device, [], output_params)
+            
+            if Config.HAILO_RECORD_OUTPUTS:
+                from .mock_hailo import OutputRecorder
+                self.network_group = OutputRecorder(self.network_group, Config.HAILO_RECORD_OUTPUTS,
+                                                    Config.HAILO_RECORD_FRAMES, self.input_shape, self.nms_shapes,
+                                                    self.output_quant)
+                logger.info(f"⏺️ Recording {Config.HAILO_RECORD_FRAMES} output frames to {Config.HAILO_RECORD_OUTPUTS}")
+            
+            if hardware.hailo_is_mock():
+                self.engine_name = "Hailo AI (mock)"
+            
+            logger.info("✅ Hailo AI initialized successfully!")
+            logger.info(f"📊 Input shape: {self.input_shape}")
+            logger.info(f"📊 Output shapes: {self.output_shapes}")
+            if any(self.nms_shapes):
+                logger.info("🧮 HEF emits on-chip NMS results - host-side decoding and NMS skipped")
+            elif self.quantized_outputs:
+                logger.info(f"🧮 UINT8 outputs, candidate-only dequantization (scale, zp): {self.output_quant}")
+            
+            self.use_fallback = False
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize Hailo AI: {e}")
+            logger.error(f"📋 Full traceback: {traceback.format_exc()}")
+            logger.warning("⚠️  Switching to CPU fallback mode")
+            self.use_fallback = True
+            return True
+    
+    def _apply_scheduler_settings(self):
+        """Priority / timeout / threshold of this network group on the shared device"""
+        settings = self.network_settings
+        try:
+            if "priority" in settings:
+                self.network_group.set_scheduler_priority(settings["priority"])
+            if "timeout_ms" in settings:
+                self.network_group.set_scheduler_timeout(settings["timeout_ms"])
+            if "threshold" in settings:
+                self.network_group.set_scheduler_threshold(settings["threshold"])
+            logger.info(f"🗓️ Network '{self.network_name}': priority {settings.get('priority', 'default')}, "
+                        f"timeout {settings.get('timeout_ms', 'default')} ms, threshold {settings.get('threshold', 'default')}")
+        except Exception as e:
+            logger.warning(f"⚠️  Scheduler settings for '{self.network_name}' not applied: {e}")
+    
+    def throughput_fps(self) -> float:
+        """Completed inferences per second over the last THROUGHPUT_WINDOW seconds"""
+        now = time.monotonic()
+        with self.completed_lock:
+            completed = list(self.completed_times)
+        recent = sum(1 for t in completed if now - t <= THROUGHPUT_WINDOW)
+        return recent / THROUGHPUT_WINDOW
+    
+    def _record_completed(self, count: int = 1):
+        now = time.monotonic()
+        with self.completed_lock:
+            self.completed_times.extend([now] * count)
+    
+    def preprocess_image(self, image: np.ndarray) -> np.ndarray:
+        """Preprocess image for inference"""
+        if self.use_fallback:
+            # Simple preprocessing for CPU fallback
+            target_size = (640, 480)  # Default size
+            resized = cv2.resize(image, target_size)
+            return resized
+        else:
+            # Hailo-specific preprocessing
+            h, w, c = self.input_shape
+            resized = cv2.resize(image, (w, h))
+            
+            # Convert BGR to RGB if needed
+            if c == 3:
+                resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+            
+            # Normalize to 0-255 (UINT8)
+            processed = np.asarray(resized, dtype=np.uint8)
+            return processed
+    
+    def cpu_fallback_inference(self, image: np.ndarray) -> List[Dict]:
+        """CPU fallback inference to detect exposed ears (left_ear, right_ear)"""
+        try:
+            logger.debug("💻 Running exposed ear detection fallback...")
+            
+            # Convert to different color spaces for analysis
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+            
+            # Use Haar cascade for person detection (if available)
+            detections = []
+            
+            try:
+                # Try to use OpenCV's built-in person detection
+                face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+                faces = face_cascade.detectMultiScale(gray, 1.3, 5)
+                
+                for (x, y, w, h) in faces:
+                    # First, add person detection
+                    person_x = max(0, x - int(w * 0.2))
+                    person_y = max(0, y - int(h * 0.1))
+                    person_w = int(w * 1.4)
+                    person_h = int(h * 2.0)  # Include body area
+                    
+                    detections.append({
+                        'bbox': [person_x, person_y, person_x + person_w, person_y + person_h],
+                        'confidence': 0.85,
+                        'class_id': 2,  # people class_id
+                        'class_name': 'people'
+                    })
+                    
+                    # Check for headphones around head area using color/edge analysis
+                    head_roi = gray[y:y+h, x:x+w]
+                    
+                    # Simple headphone detection - look for dark regions around ears
+                    # This is a simplified heuristic
+                    has_headphones = False
+                    
+                    # Check ear regions for dark objects (headphones)
+                    left_ear_roi = gray[y+int(h*0.2):y+int(h*0.6), max(0, x-int(w*0.2)):x]
+                    right_ear_roi = gray[y+int(h*0.2):y+int(h*0.6), x+w:min(gray.shape[1], x+w+int(w*0.2))]
+                    
+                    if left_ear_roi.size > 0 and right_ear_roi.size > 0:
+                        # Check for consistent dark regions (headphones)
+                        left_dark = np.mean(left_ear_roi) < 80  # Dark threshold
+                        right_dark = np.mean(right_ear_roi) < 80
+                        
+                        # Also check for edges that might indicate headphones structure
+                        left_edges = cv2.Canny(left_ear_roi, 50, 150)
+                        right_edges = cv2.Canny(right_ear_roi, 50, 150)
+                        
+                        left_has_structure = np.sum(left_edges) > 100
+                        right_has_structure = np.sum(right_edges) > 100
+                        
+                        # If both sides have dark regions or structural edges, likely headphones
+                        if (left_dark and right_dark) or (left_has_structure and right_has_structure):
+                            has_headphones = True
+                    
+                    if has_headphones:
+                        # Add headphones detection
+                        hp_x = max(0, x - int(w * 0.2))
+                        hp_y = y + int(h * 0.1)
+                        hp_w = int(w * 1.4)
+                        hp_h = int(h * 0.8)
+                        
+                        detections.append({
+                            'bbox': [hp_x, hp_y, hp_x + hp_w, hp_y + hp_h],
+                            'confidence': 0.75,
+                            'class_id': 0,  # headphones class_id
+                            'class_name': 'headphones'
+                        })
+                    else:
+                        # Only add exposed ears if NO headphones detected
+                        left_ear_x = max(0, x - int(w * 0.15))
+                        left_ear_y = y + int(h * 0.2)
+                        left_ear_w = int(w * 0.25)
+                        left_ear_h = int(h * 0.3)
+                        
+                        right_ear_x = x + int(w * 0.9)
+                        right_ear_y = y + int(h * 0.2)
+                        right_ear_w = int(w * 0.25)
+                        right_ear_h = int(h * 0.3)
+                        
+                        # Add exposed ears
+                        detections.append({
+                            'bbox': [left_ear_x, left_ear_y, left_ear_x + left_ear_w, left_ear_y + left_ear_h],
+                            'confidence': 0.8,
+                            'class_id': 1,
+                            'class_name': 'left_ear'
+                        })
+                        
+                        detections.append({
+                            'bbox': [right_ear_x, right_ear_y, right_ear_x + right_ear_w, right_ear_y + right_ear_h],
+                            'confidence': 0.8,
+                            'class_id': 3,
+                            'class_name': 'right_ear'
+                        })
+                    
+            except Exception as cascade_error:
+                logger.debug(f"Haar cascade detection failed: {cascade_error}")
+                
+                # Fallback to edge-based detection for people and objects
+                edges = cv2.Canny(gray, 50, 150)
+                contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+                
+                # Sort contours by area (largest first)
+                contours = sorted(contours, key=cv2.contourArea, reverse=True)
+                
+                for contour in contours:
+                    area = cv2.contourArea(contour)
+                    
+                    # Look for person-like shapes (large, vertical)
+                    if area > 10000:  # Large area for person
+                        x, y, w, h = cv2.boundingRect(contour)
+                        aspect_ratio = w / h if h > 0 else 0
+                        
+                        # Person-like aspect ratio (taller than wide)
+                        if 0.3 < aspect_ratio < 0.8:
+                            detections.append({
+                                'bbox': [x, y, x + w, y + h],
+                                'confidence': 0.7,
+                                'class_id': 2,
+                                'class_name': 'people'
+                            })
+                    
+                    # Look for ear-like shapes only if no people detected yet
+                    elif area > 200 and area < 5000 and not any(d['class_name'] == 'people' for d in detections):
+                        x, y, w, h = cv2.boundingRect(contour)
+                        aspect_ratio = w / h if h > 0 else 0
+                        
+                        # Ear-like aspect ratio (roughly square to slightly oval)
+                        if 0.6 < aspect_ratio < 1.4:
+                            confidence = min(0.6, area / 2000)
+                            
+                            if confidence > Config.CONFIDENCE_THRESHOLD:
+                                # Determine if it's likely left or right ear based on position
+                                img_center = image.shape[1] // 2
+                                if x < img_center:
+                                    # Left side of image = left ear
+                                    detections.append({
+                                        'bbox': [x, y, x + w, y + h],
+                                        'confidence': confidence,
+                                        'class_id': 1,
+                                        'class_name': 'left_ear'
+                                    })
+                                else:
+                                    # Right side of image = right ear
+                                    detections.append({
+                                        'bbox': [x, y, x + w, y + h],
+                                        'confidence': confidence,
+                                        'class_id': 3,
+                                        'class_name': 'right_ear'
+                                    })
+            
+            # Simulate realistic PPE scenarios for demo purposes
+            if Config.SIMULATION_MODE and len(detections) == 0:
+                import random
+                if random.random() < 0.15:  # 15% chance of simulation
+                    h, w = image.shape[:2]
+                    
+                    # Always add a person first
+                    person_w, person_h = int(w * 0.35), int(h * 0.7)
+                    person_x = random.randint(int(w * 0.1), w - person_w - int(w * 0.1))
+                    person_y = random.randint(int(h * 0.1), h - person_h - int(h * 0.1))
+                    
+                    detections.append({
+                        'bbox': [person_x, person_y, person_x + person_w, person_y + person_h],
+                        'confidence': random.uniform(0.85, 0.95),
+                        'class_id': 2,
+                        'class_name': 'people'
+                    })
+                    
+                    # 70% chance person has headphones (compliant)
+                    if random.random() < 0.7:
+                        # Compliant scenario - person with headphones
+                        hp_w, hp_h = int(person_w * 0.6), int(person_h * 0.25)
+                        hp_x = person_x + int(person_w * 0.2)
+                        hp_y = person_y + int(person_h * 0.05)
+                        
+                        detections.append({
+                            'bbox': [hp_x, hp_y, hp_x + hp_w, hp_y + hp_h],
+                            'confidence': random.uniform(0.75, 0.9),
+                            'class_id': 0,
+                            'class_name': 'headphones'
+                        })
+                        
+                        logger.info(f"✅ Simulation: Person with headphones (COMPLIANT)")
+                    else:
+                        # Violation scenario - exposed ears without headphones
+                        ear_w, ear_h = int(person_w * 0.15), int(person_h * 0.12)
+                        
+                        # Left ear
+                        left_ear_x = person_x - int(ear_w * 0.3)
+                        left_ear_y = person_y + int(person_h * 0.15)
+                        
+                        # Right ear  
+                        right_ear_x = person_x + person_w - int(ear_w * 0.7)
+                        right_ear_y = person_y + int(person_h * 0.15)
+                        
+                        detections.extend([
+                            {
+                                'bbox': [left_ear_x, left_ear_y, left_ear_x + ear_w, left_ear_y + ear_h],
+                                'confidence': random.uniform(0.8, 0.9),
+                                'class_id': 1,
+                                'class_name': 'left_ear'
+                            },
+                            {
+                                'bbox': [right_ear_x, right_ear_y, right_ear_x + ear_w, right_ear_y + ear_h],
+                                'confidence': random.uniform(0.8, 0.9),
+                                'class_id': 3,
+                                'class_name': 'right_ear'
+                            }
+                        ])
+                        
+                        logger.warning(f"⚠️ Simulation: Person with exposed ears (VIOLATION)")
+            
+            return detections
+            
+        except Exception as e:
+            logger.error(f"❌ CPU fallback inference error: {e}")
+            return []
+    
+    def postprocess_output(self, outputs: List[np.ndarray], 
+                          original_shape: Tuple[int, int]) -> List[Dict]:
+        """Post-process Hailo output to get detections"""
+        if any(self.nms_shapes):
+            return postprocess.postprocess_nms_outputs(outputs, original_shape, self.nms_shapes)
+        if self.quantized_outputs:
+            return postprocess.postprocess_quantized_outputs(outputs, original_shape, self.output_quant)
+        return postprocess.postprocess_output(outputs, original_shape)
+    
+    def _process_grid_output(self, output: np.ndarray, original_shape: Tuple[int, int]) -> List[Dict]:
+        """Process grid-format output"""
+        return postprocess.process_grid_output(output, original_shape)
+    
+    def _process_linear_output(self, output: np.ndarray, original_shape: Tuple[int, int]) -> List[Dict]:
+        """Process linear-format output"""
+        return postprocess.process_linear_output(output, original_shape)
+    
+    def apply_nms(self, detections: List[Dict], iou_threshold: float = None) -> List[Dict]:
+        """Apply Non-Maximum Suppression"""
+        return postprocess.apply_nms(detections, iou_threshold)
+    
+    def calculate_iou(self, box1: List[int], box2: List[int]) -> float:
+        """Calculate Intersection over Union"""
+        return postprocess.calculate_iou(box1, box2)
+    
+    def inference(self, image: np.ndarray) -> List[Dict]:
+        """Run inference on image with automatic fallback"""
+        self.inference_count += 1
+        instrumentation = get_instrumentation()
+        
+        try:
+            if self.use_fallback:
+                # Use CPU fallback
+                with instrumentation.span("cpu_infer"):
+                    detections = self.cpu_fallback_inference(image)
+            else:
+                # Use Hailo AI
+                # Preprocess
+                with instrumentation.span("preprocess"):
+                    processed_image = self.preprocess_image(image)
+                
+                # Run inference
+                input_data = [processed_image]
+                with instrumentation.span(self.infer_span):
+                    output_data = self.network_group.infer(input_data)
+                self.output_bytes += sum(getattr(output, "nbytes", 0) for output in output_data)
+                
+                # Postprocess
+                with instrumentation.span("postprocess"):
+                    detections = self.postprocess_output(output_data, image.shape[:2])
+            
+            self._apply_class_names(detections)
+            self.successful_inferences += 1
+            self._record_completed()
+            
+            if len(detections) > 0:
+                logger.info(f"🎯 Inference #{self.inference_count}: Found {len(detections)} detections")
+            
+            return detections
+            
+        except Exception as e:
+            self.failed_inferences += 1
+            logger.error(f"❌ Inference #{self.inference_count} failed: {e}")
+            
+            # Try fallback if Hailo fails
+            if not self.use_fallback:
+                logger.warning("⚠️  Hailo inference failed, trying CPU fallback...")
+                try:
+                    with instrumentation.span("cpu_infer"):
+                        return self.cpu_fallback_inference(image)
+                except Exception as fallback_error:
+                    logger.error(f"❌ CPU fallback also failed: {fallback_error}")
+            
+            return []
+    
+    @property
+    def infer_span(self) -> str:
+        """Instrumentation stage name of the device call"""
+        return "hailo_infer" if self.network_name == "ppe" else f"hailo_infer_{self.network_name}"
+    
+    def _apply_class_names(self, detections: List[Dict]):
+        """Relabel detections of networks with their own class list"""
+        if self.class_names:
+            for detection in detections:
+                class_id = detection['class_id']
+                detection['class_name'] = self.class_names[class_id] if class_id < len(self.class_names) else 'unknown'
+    
+    def inference_batch(self, images: List[np.ndarray]) -> List[List[Dict]]:
+        """Run several images (e.g. crops) through the model in one device call; one detection list per image"""
+        if not images:
+            return []
+        if self.use_fallback:
+            return [self.inference(image) for image in images]
+        
+        self.inference_count += len(images)
+        instrumentation = get_instrumentation()
+        try:
+            with instrumentation.span("preprocess"):
+                batch = np.stack([self.preprocess_image(image) for image in images])
+            with instrumentation.span(self.infer_span):
+                output_data = self.network_group.infer([batch])
+            self.output_bytes += sum(getattr(output, "nbytes", 0) for output in output_data)
+            
+            # Outputs carry a leading batch dimension; postprocess each image separately
+            with instrumentation.span("postprocess"):
+                results = [self.postprocess_output([output[i] for output in output_data], image.shape[:2])
+                           for i, image in enumerate(images)]
+            
+            for detections in results:
+                self._apply_class_names(detections)
+            self._record_completed(len(images))
+            self.successful_inferences += len(images)
+            return results
+            
+        except Exception as e:
+            self.failed_inferences += len(images)
+            logger.error(f"❌ Batched inference of {len(images)} images failed: {e}")
+            return [[] for _ in images]
+    
+    def get_inference_stats(self) -> Dict[str, Any]:
+        """Get inference statistics"""
+        total = self.inference_count
+        success_rate = (self.successful_inferences / total * 100) if total > 0 else 0
+        
+        return {
+            "total_inferences": total,
+            "successful": self.successful_inferences,
+            "failed": self.failed_inferences,
+            "success_rate": success_rate,
+            "output_bytes_per_frame": self.output_bytes / self.successful_inferences if self.successful_inferences else 0,
+            "network": self.network_name,
+            "priority": self.network_settings.get("priority"),
+            "throughput_fps": self.throughput_fps(),
+            "engine": "CPU Fallback" if self.use_fallback else self.engine_name
+        }
+    
+    def cleanup(self):
+        """Cleanup Hailo resources"""
+        try:
+            if self.network_group:
+                self.network_group.release()
+            if self.shared_device:
+                _release_shared_vdevice()
+                self.shared_device = False
+            elif self.device:
+                self.device.release()
+            logger.info("Hailo resources cleaned up")
+        except Exception as e:
+            logger.error(f"Cleanup error: {e}")
+
+
+class _DnnNetwork:
+    """OpenCV DNN network exposing the `infer()` / `release()` calls HailoInference uses"""
+    
+    def __init__(self, net, input_size: int):
+        self.net = net
+        self.input_size = input_size
+    
+    def infer(self, inputs: List[np.ndarray]) -> List[np.ndarray]:
+        """Run the ONNX model; outputs are converted to the (N, 5 + classes) normalized layout
+
+        A 4-D input is a batch of images; outputs then keep a leading batch dimension.
+        """
+        images = inputs[0]
+        batched = images.ndim == 4
+        blob = cv2.dnn.blobFromImages(list(images) if batched else [images], scalefactor=1 / 255.0)  # already RGB at input size
+        self.net.setInput(blob)
+        outputs = []
+        for output in self.net.forward(self.net.getUnconnectedOutLayersNames()):
+            converted = [self._convert(sample) for sample in output]
+            outputs.append(np.stack(converted) if batched else converted[0])
+        return outputs
+    
+    def _convert(self, output: np.ndarray) -> np.ndarray:
+        """One image's output in the (N, 5 + classes) normalized layout"""
+        num_classes = len(Config.CLASS_NAMES)
+        
+        # YOLOv8-style exports are (4 + classes, anchors); transpose to one row per anchor
+        if output.ndim == 2 and output.shape[0] in (4 + num_classes, 5 + num_classes) and output.shape[0] < output.shape[1]:
+            output = output.T
+        
+        if output.ndim == 2 and output.shape[1] in (4 + num_classes, 5 + num_classes):
+            boxes = output[:, :4] / self.input_size if output[:, :4].max() > 2 else output[:, :4]
+            if output.shape[1] == 4 + num_classes:
+                # No objectness column: use 1.0 so final confidence is the class score
+                objectness = np.ones((output.shape[0], 1), dtype=output.dtype)
+                output = np.hstack([boxes, objectness, output[:, 4:]])
+            else:
+                output = np.hstack([boxes, output[:, 4:]])
+        return np.ascontiguousarray(output, dtype=np.float32)
+    
+    def release(self):
+        self.net = None
+
+
+class CpuModelInference(HailoInference):
+    """The detection model as an ONNX export, run on the CPU with OpenCV DNN"""
+    
+    def __init__(self, model_path: str = None, input_size: int = None):
+        super().__init__(model_path or Config.CPU_MODEL_PATH)
+        self.input_size = input_size or Config.CPU_MODEL_INPUT_SIZE
+        self.engine_name = "CPU Model (ONNX)"
+    
+    def initialize(self) -> bool:
+        """Load the ONNX model; Hailo-style pre/post-processing is reused unchanged"""
+        if not Path(self.hef_path).exists():
+            logger.error(f"❌ ONNX model not found: {self.hef_path}")
+            return False
+        
+        try:
+            net = cv2.dnn.readNetFromONNX(self.hef_path)
+            self.network_group = _DnnNetwork(net, self.input_size)
+            self.input_shape = (self.input_size, self.input_size, 3)
+            self.use_fallback = False
+            logger.info(f"✅ CPU model loaded: {self.hef_path} ({self.input_size}x{self.input_size})")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to load ONNX model: {e}")
+            return False
@@ -0,0 +1,307 @@
+"""⏱️ Low-overhead per-stage latency instrumentation with Chrome/Perfetto trace export"""
+
+import os
+import json
+import time
+import bisect
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from .config import Config
+
+logger = logging.getLogger('HailoAI')
+
+# Histogram bucket upper bounds in seconds (Prometheus-style, cumulative on export)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram plus a rolling window of recent samples for percentiles"""
+    
+    def __init__(self, window: int = 1024, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=window)
+    
+    def add(self, seconds: float):
+        """Record one sample (seconds)"""
+        self.bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+    
+    def percentiles(self, points=(50, 95, 99)) -> Dict[str, float]:
+        """Nearest-rank percentiles (seconds) over the rolling window"""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {f"p{p}": 0.0 for p in points}
+        last = len(ordered) - 1
+        return {f"p{p}": ordered[min(last, int(round(p / 100 * last)))] for p in points}
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts, sum, max, mean and percentiles (seconds)"""
+        stats = {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": list(zip(self.buckets, self.bucket_counts[:-1])) + [(float("inf"), self.bucket_counts[-1])]
+        }
+        stats.update(self.percentiles())
+        return stats
+
+
+class _Span:
+    """Context manager timing one stage with the monotonic clock"""
+    __slots__ = ("instrumentation", "stage", "start_ns", "args")
+    
+    def __init__(self, instrumentation: "Instrumentation", stage: str, args: Optional[Dict] = None):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.args = args
+    
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.instrumentation.record_span(self.stage, self.start_ns, time.perf_counter_ns(), self.args)
+        return False
+
+
+class _NullSpan:
+    """No-op span used when instrumentation is disabled"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TraceRecorder:
+    """Collects Chrome trace events for a window of frames and dumps them as JSON"""
+    
+    def __init__(self, output_dir: str, frames: int):
+        self.output_dir = Path(output_dir)
+        self.frames_remaining = frames
+        self.frames_requested = frames
+        self.events: List[Dict[str, Any]] = []
+        self.thread_names: Dict[int, str] = {}
+        self.pid = os.getpid()
+        self.origin_ns = time.perf_counter_ns()
+    
+    def add_span(self, stage: str, start_ns: int, end_ns: int, args: Optional[Dict] = None):
+        """Append a complete ("X") event"""
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        event = {
+            "name": stage,
+            "cat": "pipeline",
+            "ph": "X",
+            "ts": (start_ns - self.origin_ns) / 1000.0,
+            "dur": (end_ns - start_ns) / 1000.0,
+            "pid": self.pid,
+            "tid": tid
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+    
+    def dump(self) -> Optional[Path]:
+        """Write the trace file (Chrome / Perfetto "JSON Object Format")"""
+        metadata = [{"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": "ppe_monitor"}}]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                     for tid, name in self.thread_names.items()]
+        
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"trace_{time.strftime('%Y%m%d_%H%M%S')}_{self.frames_requested}f.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, f)
+            logger.info(f"🧵 Trace saved: {path} ({len(self.events)} events, {self.frames_requested} frames)")
+            return path
+        except OSError as e:
+            logger.error(f"❌ Failed to write trace: {e}")
+            return None
+
+
+class FrameTimeline:
+    """Monotonic timestamps for one frame, carried from capture through to the alert"""
+    __slots__ = ("frame_number", "marks")
+    
+    def __init__(self, frame_number: int, capture_ns: Optional[int] = None):
+        self.frame_number = frame_number
+        self.marks: Dict[str, int] = {"capture": capture_ns or time.perf_counter_ns()}
+    
+    def mark(self, point: str):
+        """Stamp a pipeline point (inference, decision, encode, alert...)"""
+        self.marks[point] = time.perf_counter_ns()
+    
+    def since_capture(self, point: str) -> Optional[float]:
+        """Seconds from capture to a marked point"""
+        if point not in self.marks:
+            return None
+        return (self.marks[point] - self.marks["capture"]) / 1e9
+
+
+class Instrumentation:
+    """Per-stage latency histograms and an optional frame-window trace recorder"""
+    
+    def __init__(self, enabled: Optional[bool] = None, window: Optional[int] = None):
+        self.enabled = Config.ENABLE_INSTRUMENTATION if enabled is None else enabled
+        self.window = window or Config.LATENCY_WINDOW
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.trace: Optional[TraceRecorder] = None
+        self.current_frame: Optional[int] = None
+        self.alerts_timed = 0
+        self.alert_slo_breaches = 0
+        self.last_alert_latency: Optional[float] = None
+        self.lock = threading.Lock()
+        self.trace_requested = threading.Event()  # set from signal handlers, honoured at the next frame
+        self.requested_frames: Optional[int] = None
+    
+    def span(self, stage: str, **args):
+        """Time a pipeline stage: `with instrumentation.span("infer"): ...`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, args or None)
+    
+    def record_span(self, stage: str, start_ns: int, end_ns: int, args: Optional[Dict] = None):
+        """Record a finished span (monotonic nanosecond timestamps)"""
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram(self.window)
+            histogram.add((end_ns - start_ns) / 1e9)
+            
+            if self.trace is not None:
+                if self.current_frame is not None:
+                    args = dict(args or {}, frame=self.current_frame)
+                self.trace.add_span(stage, start_ns, end_ns, args)
+    
+    def record(self, stage: str, seconds: float):
+        """Record a duration measured elsewhere"""
+        end_ns = time.perf_counter_ns()
+        self.record_span(stage, end_ns - int(seconds * 1e9), end_ns)
+    
+    def record_alert(self, timeline: FrameTimeline) -> float:
+        """Record capture->point latencies for a delivered alert; returns glass-to-alert seconds"""
+        capture_ns = timeline.marks["capture"]
+        for point, point_ns in timeline.marks.items():
+            if point != "capture":
+                self.record_span(f"glass_to_{point}", capture_ns, point_ns)
+        
+        latency = timeline.since_capture("alert")
+        within_slo = latency <= Config.ALERT_LATENCY_SLO
+        with self.lock:
+            self.alerts_timed += 1
+            self.last_alert_latency = latency
+            if not within_slo:
+                self.alert_slo_breaches += 1
+        
+        breakdown = ", ".join(f"{point} {(point_ns - capture_ns) / 1e6:.0f}"
+                              for point, point_ns in timeline.marks.items() if point != "capture")
+        status = "✅" if within_slo else f"⚠️ over {Config.ALERT_LATENCY_SLO}s SLO"
+        logger.info(f"⏱️ Glass-to-alert {latency * 1000:.0f} ms for frame {timeline.frame_number} ({breakdown} ms) {status}")
+        return latency
+    
+    def get_alert_stats(self) -> Dict[str, Any]:
+        """Capture->alert latency distribution and SLO breaches"""
+        with self.lock:
+            histogram = self.histograms.get("glass_to_alert")
+            stats = histogram.snapshot() if histogram else {}
+            return {
+                "alerts": self.alerts_timed,
+                "slo_seconds": Config.ALERT_LATENCY_SLO,
+                "slo_breaches": self.alert_slo_breaches,
+                "last_latency": self.last_alert_latency,
+                "p50": stats.get("p50"),
+                "p95": stats.get("p95"),
+                "p99": stats.get("p99")
+            }
+    
+    def begin_frame(self, frame_number: int):
+        """Mark the start of a frame (used to tag trace events); starts a requested trace"""
+        if self.trace_requested.is_set():
+            self.trace_requested.clear()
+            self.start_trace(self.requested_frames)
+        self.current_frame = frame_number
+    
+    def end_frame(self):
+        """Mark the end of a frame; finishes the trace once its frame window is used up"""
+        finished = None
+        with self.lock:
+            self.current_frame = None
+            if self.trace is not None:
+                self.trace.frames_remaining -= 1
+                if self.trace.frames_remaining <= 0:
+                    finished, self.trace = self.trace, None
+        
+        if finished is not None:
+            # Serialize off the frame loop
+            threading.Thread(target=finished.dump, name="trace-writer", daemon=True).start()
+    
+    def request_trace(self, frames: Optional[int] = None):
+        """Ask for a trace from the next frame on (safe in signal handlers: takes no lock)"""
+        self.requested_frames = frames
+        self.trace_requested.set()
+    
+    def start_trace(self, frames: Optional[int] = None) -> bool:
+        """Start recording a Chrome trace for the next N frames"""
+        frames = frames or Config.TRACE_WINDOW_FRAMES
+        with self.lock:
+            if self.trace is not None:
+                logger.info("🧵 Trace already in progress")
+                return False
+            self.trace = TraceRecorder(Config.TRACE_OUTPUT_DIR, frames)
+        logger.info(f"🧵 Recording trace for the next {frames} frames...")
+        return True
+    
+    def reset(self):
+        """Drop all recorded samples (e.g. after a benchmark warmup)"""
+        with self.lock:
+            self.histograms = {}
+            self.alerts_timed = 0
+            self.alert_slo_breaches = 0
+            self.last_alert_latency = None
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of every stage histogram"""
+        with self.lock:
+            return {stage: histogram.snapshot() for stage, histogram in self.histograms.items()}
+    
+    def log_summary(self):
+        """Log per-stage p50/p95/p99 latency"""
+        stats = self.get_stats()
+        if not stats:
+            return
+        logger.info("⏱️ STAGE LATENCY (ms)           p50      p95      p99    count")
+        for stage, s in stats.items():
+            logger.info(f"   {stage:<24} {s['p50'] * 1000:8.2f} {s['p95'] * 1000:8.2f} {s['p99'] * 1000:8.2f} {s['count']:8d}")
+
+
+_instrumentation: Optional[Instrumentation] = None
+_instrumentation_lock = threading.Lock()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the shared Instrumentation, creating it on first use"""
+    global _instrumentation
+    with _instrumentation_lock:
+        if _instrumentation is None:
+            _instrumentation = Instrumentation()
+        return _instrumentation
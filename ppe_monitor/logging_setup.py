@@ -0,0 +1,51 @@
+"""📋 Logging system setup"""
+
+import sys
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from .config import Config
+from . import hardware
+
+
+def setup_logging():
+    """Setup comprehensive logging system (explicit; nothing is configured at import time)"""
+    import cv2
+    import numpy as np
+    
+    # Create logs directory
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    
+    # Configure logging with both file and console output
+    log_format = "%(asctime)s | %(levelname)-8s | %(name)-15s | %(message)s"
+    date_format = "%Y-%m-%d %H:%M:%S"
+    
+    # Setup root logger
+    logging.basicConfig(
+        level=Config.LOG_LEVEL,
+        format=log_format,
+        datefmt=date_format,
+        handlers=[
+            logging.FileHandler(log_dir / Config.LOG_FILE, encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    
+    # Create logger
+    logger = logging.getLogger('HailoAI')
+    
+    # Log system info
+    logger.info("=" * 60)
+    logger.info("🎧 HAILO AI DETECTION SYSTEM STARTED")
+    logger.info("=" * 60)
+    logger.info(f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"🐍 Python: {sys.version}")
+    logger.info(f"💻 Platform: {sys.platform}")
+    logger.info(f"📦 OpenCV: {cv2.__version__}")
+    logger.info(f"📦 NumPy: {np.__version__}")
+    logger.info(f"🤖 Hailo Available: {hardware.hailo_available()}")
+    logger.info(f"📷 PiCamera Available: {hardware.picamera_available()}")
+    
+    return logger
@@ -0,0 +1,239 @@
+"""📈 Prometheus text-format /metrics endpoint served from a background thread"""
+
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Any
+
+from .config import Config
+from .instrumentation import get_instrumentation
+from .network import get_wifi_manager
+
+logger = logging.getLogger('HailoAI')
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Queue depth sources: name -> callable returning the current depth
+_queue_sources: Dict[str, Callable[[], int]] = {}
+_queue_sources_lock = threading.Lock()
+
+
+def register_queue(name: str, depth: Callable[[], int]):
+    """Expose a queue's depth as ppe_queue_depth{queue="<name>"}"""
+    with _queue_sources_lock:
+        _queue_sources[name] = depth
+
+
+def unregister_queue(name: str):
+    """Stop exporting a queue's depth"""
+    with _queue_sources_lock:
+        _queue_sources.pop(name, None)
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value for the Prometheus text format"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsWriter:
+    """Accumulates metric families in Prometheus text exposition format"""
+    
+    def __init__(self):
+        self.lines: List[str] = []
+    
+    def family(self, name: str, metric_type: str, help_text: str):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+    
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None):
+        if labels:
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            self.lines.append(f"{name}{{{label_text}}} {_format_value(value)}")
+        else:
+            self.lines.append(f"{name} {_format_value(value)}")
+    
+    def metric(self, name: str, metric_type: str, help_text: str, value: float, labels: Optional[Dict[str, Any]] = None):
+        self.family(name, metric_type, help_text)
+        self.sample(name, value, labels)
+    
+    def render(self) -> bytes:
+        return ("\n".join(self.lines) + "\n").encode("utf-8")
+
+
+class MetricsExporter:
+    """Serves pre-serialized metric snapshots so scrapes never touch the detection loop"""
+    
+    def __init__(self, system, host: Optional[str] = None, port: Optional[int] = None,
+                 refresh_interval: Optional[float] = None):
+        self.system = system
+        self.host = host if host is not None else Config.METRICS_HOST
+        self.port = port if port is not None else Config.METRICS_PORT
+        self.refresh_interval = refresh_interval or Config.METRICS_REFRESH_INTERVAL
+        self.payload = b""
+        self.snapshot_time = 0.0
+        self.scrape_count = 0
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.server_thread: Optional[threading.Thread] = None
+        self.refresh_thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+    
+    def start(self) -> bool:
+        """Start the snapshot refresher and the HTTP server threads"""
+        try:
+            self.refresh()
+            self.server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+            self.server.daemon_threads = True
+        except Exception as e:
+            logger.error(f"❌ Failed to start metrics endpoint on {self.host}:{self.port}: {e}")
+            return False
+        
+        self.stop_event.clear()
+        self.refresh_thread = threading.Thread(target=self._refresh_loop, name="metrics-refresh", daemon=True)
+        self.refresh_thread.start()
+        self.server_thread = threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True)
+        self.server_thread.start()
+        logger.info(f"📈 Metrics endpoint: http://{self.host}:{self.server.server_address[1]}/metrics (refresh {self.refresh_interval}s)")
+        return True
+    
+    def stop(self):
+        """Stop serving metrics"""
+        self.stop_event.set()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        logger.info("📈 Metrics endpoint stopped")
+    
+    def _refresh_loop(self):
+        while not self.stop_event.wait(self.refresh_interval):
+            self.refresh()
+    
+    def refresh(self):
+        """Rebuild the serialized snapshot (runs on the refresh thread)"""
+        try:
+            payload = self.collect()
+            self.payload = payload  # single reference swap, readers never see a partial payload
+            self.snapshot_time = time.time()
+        except Exception as e:
+            logger.error(f"❌ Failed to collect metrics: {e}")
+    
+    def collect(self) -> bytes:
+        """Gather every component's stats into Prometheus text format"""
+        writer = MetricsWriter()
+        system = self.system
+        
+        # Detection loop
+        runtime = time.time() - system.start_time.timestamp()
+        writer.metric("ppe_uptime_seconds", "gauge", "Seconds since the monitoring system started", runtime)
+        writer.metric("ppe_frames_processed_total", "counter", "Frames processed by the detection loop", system.frame_count)
+        writer.metric("ppe_violation_detections_total", "counter", "Violation detections (people/ears without headphones)", system.total_detections)
+        writer.metric("ppe_fps", "gauge", "Detection loop frames per second", system.current_fps)
+        writer.metric("ppe_running", "gauge", "1 while the detection loop is running", int(system.running))
+        
+        # Inference engine
+        if system.hailo_inference:
+            inference = system.hailo_inference.get_inference_stats()
+            labels = {"engine": inference["engine"]}
+            writer.metric("ppe_inferences_total", "counter", "Inference calls", inference["total_inferences"], labels)
+            writer.metric("ppe_inferences_failed_total", "counter", "Failed inference calls", inference["failed"], labels)
+        
+        # Per-network throughput (models sharing the device through the Hailo scheduler)
+        networks = [network.get_inference_stats() for network in list(system.networks.values())]
+        if networks:
+            writer.family("ppe_model_inferences_total", "counter", "Successful inferences per model")
+            for stats in networks:
+                writer.sample("ppe_model_inferences_total", stats["successful"], {"model": stats["network"]})
+            writer.family("ppe_model_throughput", "gauge", "Inferences per second per model (recent window)")
+            for stats in networks:
+                writer.sample("ppe_model_throughput", stats["throughput_fps"], {"model": stats["network"]})
+        
+        # Discord notifications
+        if system.discord_notifier:
+            discord = system.discord_notifier.get_stats()
+            writer.metric("ppe_discord_sent_total", "counter", "Discord notifications delivered", discord["total_sent"])
+            writer.metric("ppe_discord_failed_total", "counter", "Discord notifications that failed", discord["total_failed"])
+            writer.metric("ppe_discord_cooldown_seconds", "gauge", "Seconds until the next notification may be sent", discord["next_notification_in"])
+            writer.metric("ppe_evidence_encoded_total", "counter", "Evidence images drawn and JPEG-encoded", discord["evidence_built"])
+            writer.metric("ppe_evidence_skipped_total", "counter", "Evidence images not built because of the cooldowns", discord["evidence_skipped"])
+            writer.metric("ppe_evidence_wasted_total", "counter", "Evidence images encoded but never uploaded", discord["evidence_wasted"])
+        
+        # Camera
+        if system.camera_system:
+            labels = {"camera": system.camera_system.camera_type}
+            writer.metric("ppe_camera_frames_total", "counter", "Frames captured by the camera", system.camera_system.frame_count, labels)
+        
+        # Network (shared snapshot, never blocks)
+        network = get_wifi_manager().state_cache.get_snapshot()
+        writer.metric("ppe_network_connected", "gauge", "1 when the node has a network connection", int(bool(network.get("connected"))))
+        if network.get("staleness") is not None:
+            writer.metric("ppe_network_state_age_seconds", "gauge", "Age of the cached network state", network["staleness"])
+        
+        # Capture -> alert latency (histogram is exported with the stages as glass_to_alert)
+        alerts = get_instrumentation().get_alert_stats()
+        writer.metric("ppe_alert_latency_slo_seconds", "gauge", "Capture-to-alert latency objective", alerts["slo_seconds"])
+        writer.metric("ppe_alerts_timed_total", "counter", "Delivered alerts with a measured capture-to-alert latency", alerts["alerts"])
+        writer.metric("ppe_alert_slo_breaches_total", "counter", "Alerts delivered later than the latency objective", alerts["slo_breaches"])
+        if alerts["last_latency"] is not None:
+            writer.metric("ppe_alert_latency_last_seconds", "gauge", "Capture-to-alert latency of the most recent alert", alerts["last_latency"])
+        
+        # Queue depths
+        with _queue_sources_lock:
+            queues = dict(_queue_sources)
+        if queues:
+            writer.family("ppe_queue_depth", "gauge", "Items waiting in internal queues")
+            for name, depth in queues.items():
+                try:
+                    writer.sample("ppe_queue_depth", depth(), {"queue": name})
+                except Exception as e:
+                    logger.debug(f"Queue depth for {name} unavailable: {e}")
+        
+        # Per-stage latency histograms
+        stages = get_instrumentation().get_stats()
+        if stages:
+            writer.family("ppe_stage_latency_seconds", "histogram", "Pipeline stage latency")
+            for stage, stats in stages.items():
+                cumulative = 0
+                for upper_bound, count in stats["buckets"]:
+                    cumulative += count
+                    writer.sample("ppe_stage_latency_seconds_bucket", cumulative, {"stage": stage, "le": _format_value(upper_bound)})
+                writer.sample("ppe_stage_latency_seconds_sum", stats["sum"], {"stage": stage})
+                writer.sample("ppe_stage_latency_seconds_count", stats["count"], {"stage": stage})
+        
+        writer.metric("ppe_metrics_scrapes_total", "counter", "Scrapes served by this endpoint", self.scrape_count)
+        return writer.render()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get exporter statistics"""
+        return {
+            "scrapes": self.scrape_count,
+            "snapshot_age": time.time() - self.snapshot_time if self.snapshot_time else None,
+            "payload_bytes": len(self.payload)
+        }
+    
+    def _make_handler(self):
+        exporter = self
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                payload = exporter.payload
+                exporter.scrape_count += 1
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def log_message(self, format, *args):
+                logger.debug(f"📈 metrics {self.address_string()} {format % args}")
+        
+        return MetricsHandler
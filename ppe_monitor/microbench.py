@@ -0,0 +1,312 @@
+"""🔬 Micro-benchmarks for the postprocess, NMS, IoU and rendering hot paths"""
+
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any
+
+import cv2
+import numpy as np
+
+from . import __version__
+from . import postprocess
+from .config import Config
+from .camera import CameraSystem
+from .dataset import split_image_paths
+from .inference import HailoInference
+from .system import SafetyMonitoringSystem
+
+logger = logging.getLogger('HailoAI')
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+MIN_BATCH_SECONDS = 0.02  # calls per timed batch are scaled up to at least this long
+SLOW_CALL_SECONDS = 1.0  # cases slower than this per call are timed with fewer repeats
+
+
+def random_grid_output(rng: np.random.Generator, candidates: int) -> np.ndarray:
+    """Grid tensor (g, g, 5 + classes) where every cell clears the confidence threshold"""
+    grid = max(1, int(math.ceil(math.sqrt(candidates))))
+    num_classes = len(Config.CLASS_NAMES)
+    output = rng.random((grid, grid, 5 + num_classes), dtype=np.float32)
+    output[..., 2:4] = rng.uniform(0.02, 0.2, (grid, grid, 2))
+    output[..., 4] = rng.uniform(0.8, 1.0, (grid, grid))
+    output[..., 5:] *= 0.3
+    output[..., 5 + rng.integers(0, num_classes)] = rng.uniform(0.8, 1.0, (grid, grid))
+    return output
+
+
+def random_linear_output(rng: np.random.Generator, candidates: int) -> np.ndarray:
+    """Linear tensor (N, 5 + classes) of normalized candidates above the confidence threshold"""
+    num_classes = len(Config.CLASS_NAMES)
+    output = rng.random((candidates, 5 + num_classes), dtype=np.float32)
+    output[:, 0:2] = rng.uniform(0.1, 0.9, (candidates, 2))
+    output[:, 2:4] = rng.uniform(0.02, 0.2, (candidates, 2))
+    output[:, 4] = rng.uniform(0.8, 1.0, candidates)
+    output[:, 5:] *= 0.3
+    output[np.arange(candidates), 5 + rng.integers(0, num_classes, candidates)] = rng.uniform(0.8, 1.0, candidates)
+    return output
+
+
+def random_nms_output(rng: np.random.Generator, candidates: int) -> List[np.ndarray]:
+    """On-chip NMS output: per-class (k, 5) y1, x1, y2, x2, score arrays above the confidence threshold"""
+    num_classes = len(Config.CLASS_NAMES)
+    counts = np.bincount(rng.integers(0, num_classes, candidates), minlength=num_classes)
+    per_class = []
+    for count in counts:
+        top_left = rng.uniform(0.0, 0.8, (count, 2))
+        per_class.append(np.hstack([top_left, top_left + rng.uniform(0.02, 0.2, (count, 2)),
+                                    rng.uniform(0.6, 1.0, (count, 1))]).astype(np.float32))
+    return per_class
+
+
+def random_detections(rng: np.random.Generator, candidates: int, width: int = 640, height: int = 480) -> List[Dict]:
+    """Detection dicts clustered around objects, like raw detector output before NMS"""
+    objects = max(1, candidates // 8)
+    centers = rng.uniform((40, 40), (width - 40, height - 40), (objects, 2))
+    sizes = rng.uniform(20, 120, (objects, 2))
+    owner = rng.integers(0, objects, candidates)
+    jitter = rng.normal(0, 6, (candidates, 4))
+    detections = []
+    for i in range(candidates):
+        cx, cy = centers[owner[i]]
+        bw, bh = sizes[owner[i]]
+        x1 = int(np.clip(cx - bw / 2 + jitter[i, 0], 0, width - 1))
+        y1 = int(np.clip(cy - bh / 2 + jitter[i, 1], 0, height - 1))
+        x2 = int(np.clip(cx + bw / 2 + jitter[i, 2], x1 + 1, width))
+        y2 = int(np.clip(cy + bh / 2 + jitter[i, 3], y1 + 1, height))
+        class_id = int(owner[i] % len(Config.CLASS_NAMES))
+        detections.append({
+            'bbox': [x1, y1, x2, y2],
+            'confidence': float(rng.uniform(0.5, 1.0)),
+            'class_id': class_id,
+            'class_name': Config.CLASS_NAMES[class_id]
+        })
+    return detections
+
+
+def load_recorded_frame() -> Optional[np.ndarray]:
+    """First validation image at camera resolution (real content matters for JPEG encoding)"""
+    for path in split_image_paths("valid"):
+        frame = cv2.imread(str(path))
+        if frame is not None:
+            return cv2.resize(frame, (Config.CAMERA_WIDTH, Config.CAMERA_HEIGHT))
+    return None
+
+
+def synthetic_frame(rng: np.random.Generator) -> np.ndarray:
+    """Noise frame at camera resolution (worst case for JPEG encoding)"""
+    return rng.integers(0, 255, (Config.CAMERA_HEIGHT, Config.CAMERA_WIDTH, 3), dtype=np.uint8)
+
+
+def make_render_system() -> SafetyMonitoringSystem:
+    """SafetyMonitoringSystem with just enough state for the draw_* methods"""
+    system = SafetyMonitoringSystem()
+    system.hailo_inference = HailoInference(Config.HEF_PATH)
+    system.hailo_inference.use_fallback = True
+    system.camera_system = CameraSystem()
+    system.camera_system.camera_type = "simulation"
+    return system
+
+
+def build_cases(seed: int, sizes: List[int], frames: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """(name, size, input) benchmark cases with their zero-argument callables"""
+    system = make_render_system()
+    shape = (Config.CAMERA_HEIGHT, Config.CAMERA_WIDTH)
+    cases = []
+    
+    def add(name: str, size: int, variant: str, func: Callable[[], Any]):
+        cases.append({"name": name, "size": size, "input": variant, "func": func})
+    
+    for size in sizes:
+        # Seeded per size so a case's input does not depend on which other sizes run
+        rng = np.random.default_rng([seed, size])
+        grid = random_grid_output(rng, size)
+        add("process_grid_output", grid.shape[0] * grid.shape[1], "synthetic",
+            lambda grid=grid: postprocess.process_grid_output(grid, shape))
+        
+        linear = random_linear_output(rng, size)
+        add("process_linear_output", size, "synthetic",
+            lambda linear=linear: postprocess.process_linear_output(linear, shape))
+        
+        quantized = np.clip(np.rint(linear * 255), 0, 255).astype(np.uint8)
+        add("process_quantized_output", size, "synthetic",
+            lambda quantized=quantized: postprocess.process_quantized_output(quantized, shape, (1 / 255, 0.0)))
+        
+        detections = random_detections(rng, size)
+        add("apply_nms", size, "synthetic", lambda detections=detections: postprocess.apply_nms(detections))
+        
+        boxes = [d['bbox'] for d in detections]
+        pairs = list(zip(boxes, boxes[1:] + boxes[:1]))
+        add("calculate_iou", size, "synthetic",
+            lambda pairs=pairs: [postprocess.calculate_iou(a, b) for a, b in pairs])
+        
+        for variant, frame in frames.items():
+            add("draw_detections", size, variant,
+                lambda frame=frame, detections=detections: system.draw_detections(frame.copy(), detections))
+        
+        # Drawn last so the inputs of the cases above stay identical to older baselines
+        nms_output = random_nms_output(rng, size)
+        nms_shape = (len(Config.CLASS_NAMES), size)
+        add("process_nms_output", size, "synthetic",
+            lambda nms_output=nms_output, nms_shape=nms_shape: postprocess.process_nms_output(nms_output, shape, nms_shape))
+    
+    for variant, frame in frames.items():
+        add("draw_enhanced_info", 1, variant, lambda frame=frame: system.draw_enhanced_info(frame.copy(), 3))
+        add("imencode", 1, variant, lambda frame=frame: cv2.imencode('.jpg', frame))
+    
+    return cases
+
+
+def time_callable(func: Callable[[], Any], repeat: int, warmup: int) -> Dict[str, Any]:
+    """Per-call timings (seconds) from `repeat` batches after `warmup` untimed calls"""
+    for _ in range(warmup):
+        func()
+    
+    # Calibrate calls per batch so timer resolution does not dominate fast functions
+    start = time.perf_counter()
+    func()
+    single = time.perf_counter() - start
+    number = max(1, int(MIN_BATCH_SECONDS / single)) if single > 0 else 1000
+    if single > SLOW_CALL_SECONDS:
+        repeat = min(repeat, 3)
+    
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [samples[0]] * 3
+    return {
+        "calls_per_batch": number,
+        "batches": repeat,
+        "median": statistics.median(samples),
+        "p25": quartiles[0],
+        "p75": quartiles[2],
+        "mean": statistics.fmean(samples),
+        "min": min(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0
+    }
+
+
+def case_key(case: Dict[str, Any]) -> str:
+    return f"{case['name']}[{case['size']}/{case['input']}]"
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                        threshold: float) -> List[Dict[str, Any]]:
+    """Flag cases whose median slowed down past the threshold with non-overlapping IQRs"""
+    comparison = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or not previous.get("median"):
+            continue
+        ratio = current["median"] / previous["median"]
+        regressed = ratio > 1 + threshold and current["p25"] > previous["p75"]
+        improved = ratio < 1 - threshold and current["p75"] < previous["p25"]
+        comparison.append({
+            "case": key,
+            "baseline_median": previous["median"],
+            "current_median": current["median"],
+            "ratio": ratio,
+            "status": "regressed" if regressed else "improved" if improved else "unchanged"
+        })
+    return comparison
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """`python -m ppe_monitor microbench [--sizes 10 100 1000] [--cases apply_nms ...]`"""
+    parser = argparse.ArgumentParser(prog="ppe_monitor microbench", description="Hot-path micro-benchmarks")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="candidate box counts")
+    parser.add_argument("--cases", nargs="+", help="only run these functions (e.g. apply_nms calculate_iou)")
+    parser.add_argument("--repeat", type=int, default=15, help="timed batches per case")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed calls per case")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for synthetic inputs")
+    parser.add_argument("--threshold", type=float, default=Config.MICROBENCH_REGRESSION_THRESHOLD,
+                        help="relative slowdown that counts as a regression (default: %(default)s)")
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/micro_<time>.json)")
+    parser.add_argument("--baseline", help="baseline JSON (default: benchmarks/baseline_micro.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--no-fail", action="store_true", help="exit 0 even if a case regressed")
+    args = parser.parse_args(argv)
+    
+    frames = {"synthetic": synthetic_frame(np.random.default_rng(args.seed))}
+    recorded = load_recorded_frame()
+    if recorded is not None:
+        frames["recorded"] = recorded
+    
+    cases = build_cases(args.seed, sorted(set(args.sizes)), frames)
+    if args.cases:
+        cases = [c for c in cases if c["name"] in args.cases]
+    
+    logger.info(f"🔬 Micro-benchmarks: {len(cases)} cases, {args.repeat} batches each")
+    results = {}
+    for case in cases:
+        timing = time_callable(case["func"], args.repeat, args.warmup)
+        timing.update({"name": case["name"], "size": case["size"], "input": case["input"]})
+        results[case_key(case)] = timing
+        logger.info(f"   {case_key(case):<42} {_format_seconds(timing['median']):>12}  "
+                    f"(IQR {_format_seconds(timing['p25'])} - {_format_seconds(timing['p75'])})")
+    
+    baseline_file = Path(args.baseline) if args.baseline else Path(Config.BENCHMARK_DIR) / "baseline_micro.json"
+    comparison = []
+    if baseline_file.exists():
+        try:
+            with open(baseline_file, encoding="utf-8") as f:
+                comparison = compare_to_baseline(results, json.load(f).get("cases", {}), args.threshold)
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ Could not read baseline {baseline_file}: {e}")
+    
+    regressions = [row for row in comparison if row["status"] == "regressed"]
+    for row in comparison:
+        if row["status"] != "unchanged":
+            mark = "⚠️" if row["status"] == "regressed" else "✅"
+            logger.info(f"   {mark} {row['case']:<40} {row['ratio']:.2f}x baseline ({row['status']})")
+    
+    result = {
+        "benchmark": "micro",
+        "version": __version__,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "seed": args.seed,
+        "threshold": args.threshold,
+        "opencv": cv2.__version__,
+        "numpy": np.__version__,
+        "cases": results,
+        "comparison": comparison
+    }
+    output = Path(args.output) if args.output else Path(Config.BENCHMARK_DIR) / f"micro_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    logger.info(f"💾 Result: {output}")
+    
+    if args.save_baseline:
+        baseline_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_file, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in result.items() if k != "comparison"}, f, indent=2)
+        logger.info(f"📌 Baseline saved: {baseline_file}")
+    
+    if regressions:
+        logger.error(f"❌ {len(regressions)} hot path(s) regressed more than {args.threshold:.0%}")
+        return 0 if args.no_fail else 1
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import run
+    sys.exit(run(["microbench"] + sys.argv[1:]))
@@ -0,0 +1,370 @@
+"""🧪 Stand-in for the hailo_platform subset HailoInference uses (no hardware required)
+
+The mock replays output tensors recorded on a real device (see OutputRecorder)
+or synthesizes tensors with the HEF's shapes, and simulates device latency and
+occasional HailoRT failures so the Hailo code path can be load-tested anywhere.
+"""
+
+import enum
+import time
+import types
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from .config import Config
+from .postprocess import nms_per_class
+
+logger = logging.getLogger('HailoAI')
+
+
+class HailoRTException(Exception):
+    """Raised by the mock device the way hailo_platform raises HailoRTException"""
+
+
+SYNTHETIC_QUANT = (1 / 255, 0.0)  # (scale, zero point) of synthetic outputs, whose values lie in [0, 1]
+
+
+class FormatOrder(enum.Enum):
+    NHWC = "NHWC"
+    NC = "NC"
+    HAILO_NMS = "HAILO_NMS"
+
+
+def synthetic_output(rng: np.random.Generator, shape: Tuple[int, ...]) -> np.ndarray:
+    """Low-confidence background plus a few confident objects in the (..., 5 + classes) layout"""
+    output = rng.random(shape, dtype=np.float32)
+    num_classes = len(Config.CLASS_NAMES)
+    if shape[-1] != 5 + num_classes:
+        return output * 0.05
+    
+    rows = output.reshape(-1, shape[-1])
+    rows[:, 2:4] = rng.uniform(0.02, 0.3, (len(rows), 2))
+    rows[:, 4] *= 0.05  # background objectness stays below CONFIDENCE_THRESHOLD
+    objects = rng.choice(len(rows), size=min(len(rows), rng.poisson(2)), replace=False)
+    rows[objects, 4] = rng.uniform(0.6, 0.95, len(objects))
+    rows[objects, 5:] *= 0.2
+    rows[objects, 5 + rng.integers(0, num_classes, len(objects))] = rng.uniform(0.7, 0.95, len(objects))
+    return output
+
+
+def synthetic_nms_output(rng: np.random.Generator, nms_shape: Tuple[int, int]) -> List[np.ndarray]:
+    """Per-class (k, 5) y1, x1, y2, x2, score arrays like a FLOAT32 on-chip NMS vstream"""
+    num_classes, max_bboxes = nms_shape
+    per_class = []
+    for _ in range(num_classes):
+        count = min(max_bboxes, rng.poisson(0.5))
+        top_left = rng.uniform(0.0, 0.7, (count, 2))
+        size = rng.uniform(0.05, 0.3, (count, 2))
+        score = rng.uniform(0.5, 0.95, (count, 1))
+        per_class.append(np.hstack([top_left, top_left + size, score]).astype(np.float32))
+    return per_class
+
+
+def nms_buffer(per_class: List[np.ndarray], max_bboxes: int) -> np.ndarray:
+    """Flat [count, k * 5 values] per class layout with fixed per-class capacity"""
+    stride = 1 + 5 * max_bboxes
+    buffer = np.zeros(len(per_class) * stride, dtype=np.float32)
+    for class_id, boxes in enumerate(per_class):
+        boxes = boxes[:max_bboxes]
+        buffer[class_id * stride] = len(boxes)
+        buffer[class_id * stride + 1:class_id * stride + 1 + boxes.size] = boxes.ravel()
+    return buffer
+
+
+class MockProfile:
+    """What the stand-in device returns and how it misbehaves"""
+    
+    def __init__(self, recording: Optional[str] = None, input_shape: Optional[Tuple[int, int, int]] = None,
+                 output_shapes: Optional[List[Tuple[int, ...]]] = None, latency_ms: Optional[float] = None,
+                 jitter_ms: Optional[float] = None, failure_rate: Optional[float] = None, seed: Optional[int] = None,
+                 output_format: Optional[str] = None):
+        self.latency_ms = Config.MOCK_HAILO_LATENCY_MS if latency_ms is None else latency_ms
+        self.jitter_ms = Config.MOCK_HAILO_JITTER_MS if jitter_ms is None else jitter_ms
+        self.failure_rate = Config.MOCK_HAILO_FAILURE_RATE if failure_rate is None else failure_rate
+        self.rng = np.random.default_rng(Config.MOCK_HAILO_SEED if seed is None else seed)
+        self.lock = threading.Lock()
+        self.device_lock = threading.Lock()  # one accelerator: network groups take turns
+        self.recorded: List[np.ndarray] = []  # one (frames, *shape) array per output vstream
+        self.calls = 0
+        self.failures = 0
+        
+        recording = recording or Config.MOCK_HAILO_RECORDING
+        if recording:
+            self._load_recording(recording)
+        elif (output_format or Config.MOCK_HAILO_OUTPUT_FORMAT) == "nms":
+            nms_shape = (len(Config.CLASS_NAMES), Config.MOCK_HAILO_NMS_MAX_BBOXES)
+            self.input_shape = tuple(input_shape or Config.MOCK_HAILO_INPUT_SHAPE)
+            self.output_shapes = [(nms_shape[0] * (1 + 5 * nms_shape[1]),)]
+            self.nms_shapes = [nms_shape]
+            self.quant = [SYNTHETIC_QUANT]
+        else:
+            self.input_shape = tuple(input_shape or Config.MOCK_HAILO_INPUT_SHAPE)
+            self.output_shapes = [tuple(shape) for shape in (output_shapes or Config.MOCK_HAILO_OUTPUT_SHAPES)]
+            self.nms_shapes = [None] * len(self.output_shapes)
+            self.quant = [SYNTHETIC_QUANT] * len(self.output_shapes)
+    
+    def _load_recording(self, path: str):
+        """Shapes and tensors from an OutputRecorder .npz"""
+        with np.load(path, allow_pickle=False) as data:
+            self.input_shape = tuple(int(v) for v in data["input_shape"])
+            keys = sorted((k for k in data.files if k.startswith("output_")), key=lambda k: int(k.split("_")[1]))
+            self.recorded = [data[key] for key in keys]
+            nms_shapes = data["nms_shapes"] if "nms_shapes" in data.files else np.full((len(keys), 2), -1)
+            quant = data["quant"] if "quant" in data.files else np.tile(SYNTHETIC_QUANT, (len(keys), 1))
+        self.output_shapes = [output.shape[1:] for output in self.recorded]
+        self.nms_shapes = [tuple(int(v) for v in shape) if shape[0] >= 0 else None for shape in nms_shapes]
+        self.quant = [(float(scale), float(zero_point)) for scale, zero_point in quant]
+        logger.info(f"🧪 Mock Hailo replaying {len(self.recorded[0]) if self.recorded else 0} recorded frames from {path}")
+    
+    def next_outputs(self) -> List[np.ndarray]:
+        """Outputs for one infer() call: recorded frames in order (wrapping), else synthetic"""
+        with self.lock:
+            index = self.calls
+            self.calls += 1
+            if not self.recorded:
+                return [synthetic_nms_output(self.rng, nms_shape) if nms_shape else synthetic_output(self.rng, shape)
+                        for shape, nms_shape in zip(self.output_shapes, self.nms_shapes)]
+            return [output[index % len(output)].copy() for output in self.recorded]
+    
+    def simulate_device(self, batch: int = 1):
+        """Sleep for the device latency and occasionally fail like a busy/timed-out device"""
+        with self.lock:
+            delay = max(0.0, self.rng.normal(self.latency_ms, self.jitter_ms)) / 1000 if self.jitter_ms else self.latency_ms / 1000
+            delay *= 1 + Config.MOCK_HAILO_BATCH_COST * (batch - 1)
+            failed = self.failure_rate > 0 and self.rng.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        if delay > 0:
+            with self.device_lock:
+                time.sleep(delay)
+        if failed:
+            raise HailoRTException("Simulated HAILO_TIMEOUT (mock device)")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Replay/failure counters"""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "source": "recorded" if self.recorded else "synthetic",
+            "latency_ms": self.latency_ms,
+            "failure_rate": self.failure_rate
+        }
+
+
+class MockVStreamInfo:
+    def __init__(self, name: str, shape: Tuple[int, ...], nms_shape: Optional[Tuple[int, int]] = None,
+                 quant: Tuple[float, float] = SYNTHETIC_QUANT):
+        self.name = name
+        self.shape = shape
+        self.quant_info = types.SimpleNamespace(qp_scale=quant[0], qp_zp=quant[1])
+        self.format = types.SimpleNamespace(order=FormatOrder.HAILO_NMS if nms_shape else FormatOrder.NHWC)
+        if nms_shape:
+            self.nms_shape = types.SimpleNamespace(number_of_classes=nms_shape[0], max_bboxes_per_class=nms_shape[1])
+
+
+class MockHEF:
+    """HEF with the profile's input/output vstream shapes (the file itself is not parsed)"""
+    
+    def __init__(self, hef_path: str, profile: MockProfile):
+        self.path = hef_path
+        self.profile = profile
+        name = Path(hef_path).stem
+        self.input_infos = [MockVStreamInfo(f"{name}/input_layer1", profile.input_shape)]
+        self.output_infos = [MockVStreamInfo(f"{name}/output{i}", shape, nms_shape, quant)
+                             for i, (shape, nms_shape, quant)
+                             in enumerate(zip(profile.output_shapes, profile.nms_shapes, profile.quant))]
+    
+    def get_input_vstream_infos(self) -> List[MockVStreamInfo]:
+        return self.input_infos
+    
+    def get_output_vstream_infos(self) -> List[MockVStreamInfo]:
+        return self.output_infos
+
+
+class MockNetworkGroup:
+    """Validates the input frame like the device would, then replays outputs after the simulated latency"""
+    
+    def __init__(self, hef: MockHEF):
+        self.hef = hef
+        self.profile = hef.profile
+        self.output_format = "FLOAT32"  # set by OutputVStreamParams.make_from_network_group
+        self.scheduler = {"priority": None, "timeout_ms": None, "threshold": None}
+        self.calls = 0
+        self.released = False
+    
+    def set_scheduler_priority(self, priority: int):
+        self.scheduler["priority"] = priority
+    
+    def set_scheduler_timeout(self, timeout_ms: int):
+        self.scheduler["timeout_ms"] = timeout_ms
+    
+    def set_scheduler_threshold(self, threshold: int):
+        self.scheduler["threshold"] = threshold
+    
+    def infer(self, inputs: List[np.ndarray]) -> List[np.ndarray]:
+        if self.released:
+            raise HailoRTException("Network group used after release")
+        frame = np.asarray(inputs[0])
+        batched = frame.ndim == len(self.profile.input_shape) + 1
+        if frame.shape[batched:] != self.profile.input_shape or frame.dtype != np.uint8:
+            raise HailoRTException(f"Invalid input: expected uint8 {self.profile.input_shape}, "
+                                   f"got {frame.dtype} {frame.shape}")
+        batch = len(frame) if batched else 1
+        self.profile.simulate_device(batch)
+        self.calls += 1
+        if not batched:
+            return self._sample_outputs()
+        
+        # Leading batch dimension on every output (lists of per-class arrays for on-chip NMS)
+        samples = [self._sample_outputs() for _ in range(batch)]
+        return [[sample[i] for sample in samples] if nms_shape else np.stack([sample[i] for sample in samples])
+                for i, nms_shape in enumerate(self.profile.nms_shapes)]
+    
+    def _sample_outputs(self) -> List[Any]:
+        """One image's outputs in the requested output format"""
+        outputs = self.profile.next_outputs()
+        for i, (nms_shape, (scale, zero_point)) in enumerate(zip(self.profile.nms_shapes, self.profile.quant)):
+            if nms_shape is not None:
+                continue  # on-chip NMS results are always FLOAT32
+            if self.output_format == "UINT8" and outputs[i].dtype != np.uint8:
+                outputs[i] = np.clip(np.rint(outputs[i] / scale + zero_point), 0, 255).astype(np.uint8)
+            elif self.output_format != "UINT8" and outputs[i].dtype == np.uint8:
+                outputs[i] = (outputs[i].astype(np.float32) - zero_point) * scale
+        return outputs
+    
+    def release(self):
+        self.released = True
+
+
+class MockVDevice:
+    def __init__(self, profile: MockProfile, params: Any = None):
+        self.profile = profile
+        self.params = params
+        self.network_groups: List[MockNetworkGroup] = []
+    
+    @staticmethod
+    def create_params() -> types.SimpleNamespace:
+        return types.SimpleNamespace(scheduling_algorithm=None, multi_process_service=False, group_id=None)
+    
+    def configure(self, hef: MockHEF, configure_params: Any = None) -> List[MockNetworkGroup]:
+        network_group = MockNetworkGroup(hef)
+        self.network_groups.append(network_group)
+        return [network_group]
+    
+    def release(self):
+        pass
+
+
+class _ConfigureParams:
+    @staticmethod
+    def create_from_hef(hef: MockHEF, interface: Any = None) -> Dict[str, Any]:
+        return {"interface": interface}
+
+
+class _InputVStreamParams:
+    @staticmethod
+    def make_from_network_group(network_group: MockNetworkGroup, format_type: Any = None) -> List[Dict[str, Any]]:
+        return [{info.name: format_type for info in network_group.hef.get_input_vstream_infos()}]
+
+
+class _OutputVStreamParams:
+    @staticmethod
+    def make_from_network_group(network_group: MockNetworkGroup, format_type: Any = None) -> Dict[str, Any]:
+        network_group.output_format = format_type
+        return {info.name: format_type for info in network_group.hef.get_output_vstream_infos()}
+
+
+class _InferVStreams:
+    def __init__(self, device: MockVDevice, input_params: Any, output_params: Any):
+        self.device = device
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+def create_mock_hailo(profile: Optional[MockProfile] = None) -> types.ModuleType:
+    """Module object exposing the hailo_platform names HailoInference.initialize touches"""
+    profile = profile or MockProfile()
+    module = types.ModuleType("hailo_platform_mock")
+    module.IS_MOCK = True
+    module.profile = profile
+    module.HailoRTException = HailoRTException
+    module.HEF = lambda hef_path: MockHEF(hef_path, profile)
+    
+    class VDevice(MockVDevice):
+        def __init__(self, params: Any = None):
+            super().__init__(profile, params)
+    
+    module.VDevice = VDevice
+    module.Device = VDevice
+    module.HailoSchedulingAlgorithm = types.SimpleNamespace(NONE="NONE", ROUND_ROBIN="ROUND_ROBIN")
+    module.ConfigureParams = _ConfigureParams
+    module.HailoStreamInterface = types.SimpleNamespace(PCIe="PCIe", ETH="ETH")
+    module.FormatType = types.SimpleNamespace(UINT8="UINT8", FLOAT32="FLOAT32")
+    module.FormatOrder = FormatOrder
+    module.InputVStreamParams = _InputVStreamParams
+    module.OutputVStreamParams = _OutputVStreamParams
+    module.InferVStreams = _InferVStreams
+    return module
+
+
+class OutputRecorder:
+    """Wraps a real network group and saves its first N output sets for replay by the mock device"""
+    
+    def __init__(self, network_group: Any, path: str, frames: int, input_shape: Tuple[int, ...],
+                 nms_shapes: Optional[List[Optional[Tuple[int, int]]]] = None,
+                 quant: Optional[List[Tuple[float, float]]] = None):
+        self.network_group = network_group
+        self.path = Path(path)
+        self.limit = frames
+        self.input_shape = tuple(input_shape)
+        self.nms_shapes = nms_shapes or []
+        self.quant = quant or []
+        self.frames: List[List[np.ndarray]] = []
+        self.saved = False
+    
+    def _snapshot(self, index: int, output: Any) -> np.ndarray:
+        """Copy of one output; on-chip NMS lists are packed into the fixed-size flat buffer"""
+        nms_shape = self.nms_shapes[index] if index < len(self.nms_shapes) else None
+        if nms_shape is None:
+            return np.array(output, copy=True)
+        return nms_buffer(nms_per_class(output, nms_shape), nms_shape[1] or Config.MOCK_HAILO_NMS_MAX_BBOXES)
+    
+    def infer(self, inputs: List[np.ndarray]) -> List[np.ndarray]:
+        outputs = self.network_group.infer(inputs)
+        if len(self.frames) < self.limit:
+            # Batched calls (tiles, cascade crops) carry a leading batch dimension: one recorded frame per image
+            batched = np.ndim(inputs[0]) == len(self.input_shape) + 1
+            per_image = [[output[b] for output in outputs] for b in range(len(inputs[0]))] if batched else [outputs]
+            for image_outputs in per_image[:self.limit - len(self.frames)]:
+                self.frames.append([self._snapshot(i, output) for i, output in enumerate(image_outputs)])
+            if len(self.frames) == self.limit:
+                self.save()
+        return outputs
+    
+    def save(self):
+        """Write input_shape and output_<i> (frames, *shape) arrays"""
+        if self.saved or not self.frames:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            arrays = {f"output_{i}": np.stack([frame[i] for frame in self.frames]) for i in range(len(self.frames[0]))}
+            nms_shapes = [shape or (-1, -1) for shape in self.nms_shapes] or [(-1, -1)] * len(arrays)
+            quant = self.quant or [SYNTHETIC_QUANT] * len(arrays)
+            np.savez_compressed(self.path, input_shape=np.array(self.input_shape), nms_shapes=np.array(nms_shapes),
+                                quant=np.array(quant, dtype=np.float64), **arrays)
+            self.saved = True
+            logger.info(f"💾 Recorded {len(self.frames)} Hailo output frames to {self.path}")
+        except Exception as e:
+            logger.error(f"❌ Failed to save Hailo output recording: {e}")
+    
+    def release(self):
+        self.save()
+        self.network_group.release()
@@ -0,0 +1,1079 @@
+"""📶 Network connectivity: socket probes, link monitoring, state cache and Wi-Fi/Tailscale management"""
+
+import os
+import json
+import time
+import errno
+import socket
+import struct
+import logging
+import selectors
+import threading
+import subprocess
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Any
+
+from .config import Config
+
+logger = logging.getLogger('HailoAI')
+
+
+class ConnectivityProber:
+    """Concurrent non-blocking TCP/UDP connectivity probes (no process spawns)"""
+    
+    # Minimal DNS query (root NS, recursion desired) used for UDP probes
+    DNS_PROBE_QUERY = struct.pack("!HHHHHH", 0x5050, 0x0100, 1, 0, 0, 0) + b"\x00" + struct.pack("!HH", 2, 1)
+    
+    def __init__(self, targets: Optional[List[Tuple[str, int, str]]] = None, timeout: Optional[float] = None):
+        self.targets = targets if targets is not None else Config.CONNECTIVITY_PROBE_TARGETS
+        self.timeout = timeout if timeout is not None else Config.CONNECTIVITY_PROBE_TIMEOUT
+        self.probe_count = 0
+        self.success_count = 0
+        self.last_success = False
+        self.last_target = None
+        self.last_rtt_ms = None
+        self.last_probe_duration_ms = None
+        self.rtt_history = deque(maxlen=50)
+        self.target_rtts: Dict[str, float] = {}
+        self.lock = threading.Lock()
+    
+    def _open_probe(self, selector: selectors.BaseSelector, host: str, port: int, proto: str) -> None:
+        """Open one non-blocking probe socket and register it with the selector"""
+        family = socket.AF_INET6 if ":" in host else socket.AF_INET
+        label = f"{proto}://{host}:{port}"
+        
+        sock = socket.socket(family, socket.SOCK_DGRAM if proto == "udp" else socket.SOCK_STREAM)
+        try:
+            sock.setblocking(False)
+            if proto == "udp":
+                sock.connect((host, port))
+                sock.send(self.DNS_PROBE_QUERY)
+                events = selectors.EVENT_READ
+            else:
+                err = sock.connect_ex((host, port))
+                if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                    raise OSError(err, os.strerror(err))
+                events = selectors.EVENT_WRITE
+        except OSError:
+            sock.close()
+            raise
+        
+        selector.register(sock, events, (label, proto, time.monotonic()))
+    
+    def probe(self) -> bool:
+        """Probe all targets concurrently and return True on the first success"""
+        selector = selectors.DefaultSelector()
+        start = time.monotonic()
+        deadline = start + self.timeout
+        winner = None
+        winner_rtt = None
+        
+        try:
+            for host, port, proto in self.targets:
+                try:
+                    self._open_probe(selector, host, port, proto)
+                except OSError as e:
+                    logger.debug(f"Probe {proto}://{host}:{port} failed to start: {e}")
+            
+            while winner is None and selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                for key, _ in selector.select(remaining):
+                    label, proto, sent_at = key.data
+                    sock = key.fileobj
+                    try:
+                        if proto == "udp":
+                            ok = len(sock.recv(512)) > 0
+                        else:
+                            ok = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                    except OSError:
+                        ok = False
+                    
+                    selector.unregister(sock)
+                    sock.close()
+                    
+                    if ok:
+                        winner = label
+                        winner_rtt = (time.monotonic() - sent_at) * 1000
+                        break
+        finally:
+            # Close any probes still in flight
+            for key in list(selector.get_map().values()):
+                try:
+                    key.fileobj.close()
+                except OSError:
+                    pass
+            selector.close()
+        
+        duration_ms = (time.monotonic() - start) * 1000
+        with self.lock:
+            self.probe_count += 1
+            self.last_success = winner is not None
+            self.last_target = winner
+            self.last_rtt_ms = winner_rtt
+            self.last_probe_duration_ms = duration_ms
+            if winner is not None:
+                self.success_count += 1
+                self.rtt_history.append(winner_rtt)
+                self.target_rtts[winner] = winner_rtt
+        
+        if winner is not None:
+            logger.debug(f"Connectivity probe OK via {winner} ({winner_rtt:.1f}ms)")
+        else:
+            logger.debug(f"Connectivity probe failed after {duration_ms:.0f}ms")
+        
+        return winner is not None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get probe statistics including RTTs"""
+        with self.lock:
+            history = list(self.rtt_history)
+            return {
+                "total_probes": self.probe_count,
+                "successful": self.success_count,
+                "success_rate": (self.success_count / self.probe_count * 100) if self.probe_count > 0 else 0,
+                "last_success": self.last_success,
+                "last_target": self.last_target,
+                "last_rtt_ms": self.last_rtt_ms,
+                "avg_rtt_ms": (sum(history) / len(history)) if history else None,
+                "last_probe_duration_ms": self.last_probe_duration_ms,
+                "target_rtts_ms": dict(self.target_rtts)
+            }
+
+class LinkMonitor:
+    """Event-driven network link monitor using rtnetlink with sysfs/procfs fallback"""
+    
+    # rtnetlink multicast groups and message types (linux/rtnetlink.h)
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    RTMGRP_IPV6_IFADDR = 0x100
+    RTM_NEWLINK, RTM_DELLINK, RTM_NEWADDR, RTM_DELADDR = 16, 17, 20, 21
+    
+    # ioctl requests for address / SSID lookups without spawning processes
+    SIOCGIFADDR = 0x8915
+    SIOCGIWESSID = 0x8B1B
+    
+    def __init__(self, prober: ConnectivityProber):
+        self.prober = prober
+        self.netlink_socket = None
+        self.thread = None
+        self.running = False
+        self.mode = None  # "netlink" or "sysfs"
+        self.event_count = 0
+        self.state_version = 0
+        self.state: Dict[str, Any] = {"connected": False, "interface": None, "ip_address": None,
+                                      "ssid": None, "interfaces": {}, "updated_at": 0.0}
+        self.last_probe_time = 0.0
+        self.condition = threading.Condition()
+        self.wake_reader, self.wake_writer = socket.socketpair()
+    
+    def start(self):
+        """Start the monitor thread (netlink if available, sysfs polling otherwise)"""
+        if self.running:
+            return
+        
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, self.RTMGRP_LINK | self.RTMGRP_IPV4_IFADDR | self.RTMGRP_IPV6_IFADDR))
+            self.netlink_socket = sock
+            self.mode = "netlink"
+        except (AttributeError, OSError) as e:
+            logger.debug(f"rtnetlink unavailable ({e}), using sysfs polling")
+            self.netlink_socket = None
+            self.mode = "sysfs"
+        
+        self.running = True
+        self._refresh_state(force_probe=True)
+        self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self.thread.start()
+        logger.info(f"📡 Link monitor started ({self.mode} mode)")
+    
+    def stop(self):
+        """Stop the monitor thread and wake any waiters"""
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()
+        try:
+            self.wake_writer.send(b"\x00")
+        except OSError:
+            pass
+        if self.thread:
+            self.thread.join(timeout=2)
+        if self.netlink_socket:
+            try:
+                self.netlink_socket.close()
+            except OSError:
+                pass
+            self.netlink_socket = None
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Return the cached connection state (never blocks on I/O)"""
+        with self.condition:
+            return dict(self.state, version=self.state_version)
+    
+    def wait_for_change(self, last_version: int, timeout: Optional[float] = None) -> int:
+        """Block until the state version differs from last_version, stop() or timeout"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.state_version != last_version or not self.running, timeout)
+            return self.state_version
+    
+    def _monitor_loop(self):
+        """Wait for link/address events and refresh the cached state only when something changes"""
+        while self.running:
+            try:
+                probe_due_in = max(0.0, Config.LINK_MONITOR_PROBE_INTERVAL - (time.monotonic() - self.last_probe_time))
+                
+                if self.mode == "netlink":
+                    events = self._wait_netlink_events(probe_due_in)
+                    if not self.running:
+                        break
+                    if events:
+                        self.event_count += events
+                        self._refresh_state(force_probe=True)
+                    else:
+                        # Idle link: periodic socket probe only
+                        self._refresh_state(force_probe=True, reread_links=False)
+                else:
+                    self._wait_wakeup(Config.LINK_MONITOR_FALLBACK_POLL)
+                    if not self.running:
+                        break
+                    self._refresh_state(force_probe=probe_due_in <= Config.LINK_MONITOR_FALLBACK_POLL)
+                    
+            except Exception as e:
+                logger.error(f"❌ Link monitor error: {e}")
+                time.sleep(Config.LINK_MONITOR_FALLBACK_POLL)
+    
+    def _wait_netlink_events(self, timeout: float) -> int:
+        """Block on the netlink socket and count link/address messages (coalescing bursts)"""
+        sock = self.netlink_socket
+        if sock is None:
+            return 0
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            selector.register(self.wake_reader, selectors.EVENT_READ)
+            ready = selector.select(timeout)
+            if not ready or not self.running:
+                return 0
+            selector.unregister(self.wake_reader)
+            
+            events = 0
+            while True:
+                try:
+                    data = sock.recv(65536, socket.MSG_DONTWAIT)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    return events
+                events += self._count_route_messages(data)
+                
+                # Give a burst (link up -> addr add -> route add) a moment to settle
+                if not selector.select(0.2):
+                    break
+            return events
+    
+    def _wait_wakeup(self, timeout: float):
+        """Sleep for timeout seconds unless stop() is called"""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.wake_reader, selectors.EVENT_READ)
+            selector.select(timeout)
+    
+    def _count_route_messages(self, data: bytes) -> int:
+        """Count RTM link/address messages in a netlink datagram"""
+        count = 0
+        offset = 0
+        while offset + 16 <= len(data):
+            msg_len, msg_type = struct.unpack_from("=LH", data, offset)
+            if msg_len < 16:
+                break
+            if msg_type in (self.RTM_NEWLINK, self.RTM_DELLINK, self.RTM_NEWADDR, self.RTM_DELADDR):
+                count += 1
+            offset += (msg_len + 3) & ~3
+        return count
+    
+    def _refresh_state(self, force_probe: bool = False, reread_links: bool = True):
+        """Re-read link state and publish it if anything changed"""
+        with self.condition:
+            previous = dict(self.state)
+        
+        link_state = self._read_link_state() if reread_links else {
+            key: previous.get(key) for key in ("interface", "ip_address", "ssid", "interfaces")}
+        
+        connected = previous.get("connected", False)
+        link_changed = (link_state["interface"], link_state["ip_address"]) != (previous.get("interface"), previous.get("ip_address"))
+        if not link_state["interface"]:
+            connected = False
+        elif force_probe or link_changed:
+            connected = self.prober.probe()
+            self.last_probe_time = time.monotonic()
+        
+        new_state = dict(link_state, connected=connected)
+        changed = any(new_state.get(k) != previous.get(k) for k in ("connected", "interface", "ip_address", "ssid"))
+        
+        with self.condition:
+            self.state = dict(new_state, updated_at=time.time() if changed else previous.get("updated_at", 0.0),
+                              event_count=self.event_count, mode=self.mode)
+            if changed:
+                self.state_version += 1
+                self.condition.notify_all()
+        
+        if changed:
+            if connected:
+                logger.info(f"📡 Link state: connected via {new_state['interface']} ({new_state['ssid']}) - {new_state['ip_address']}")
+            else:
+                logger.warning(f"📡 Link state: disconnected (interface: {new_state['interface'] or 'none'})")
+    
+    @staticmethod
+    def _read_sysfs(path: Path) -> Optional[str]:
+        """Read a single sysfs attribute, returning None if unavailable"""
+        try:
+            return path.read_text().strip()
+        except OSError:
+            return None
+    
+    def _read_ipv4(self, ifname: str) -> Optional[str]:
+        """Get the IPv4 address of an interface via ioctl"""
+        try:
+            import fcntl
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                packed = fcntl.ioctl(s.fileno(), self.SIOCGIFADDR, struct.pack("256s", ifname[:15].encode()))
+            return socket.inet_ntoa(packed[20:24])
+        except (ImportError, OSError):
+            return None
+    
+    def _read_ssid(self, ifname: str) -> Optional[str]:
+        """Get the associated SSID of a wireless interface via wireless-extensions ioctl"""
+        try:
+            import fcntl
+            import array
+            buf = array.array("B", bytes(33))
+            addr, length = buf.buffer_info()
+            request = struct.pack("16sPHH", ifname[:15].encode(), addr, length, 0).ljust(32, b"\x00")
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                result = fcntl.ioctl(s.fileno(), self.SIOCGIWESSID, request)
+            ssid_length = struct.unpack_from("16sPHH", result)[2]
+            ssid = buf.tobytes()[:ssid_length].decode("utf-8", errors="replace")
+            return ssid or None
+        except (ImportError, OSError):
+            return None
+    
+    @staticmethod
+    def _read_wireless_stats() -> Dict[str, Dict[str, float]]:
+        """Parse /proc/net/wireless link quality and signal level per interface"""
+        stats = {}
+        try:
+            with open("/proc/net/wireless") as f:
+                lines = f.readlines()[2:]
+        except OSError:
+            return stats
+        
+        for line in lines:
+            if ":" not in line:
+                continue
+            name, values = line.split(":", 1)
+            fields = values.split()
+            try:
+                stats[name.strip()] = {
+                    "link_quality": float(fields[1].rstrip(".")),
+                    "signal_level": float(fields[2].rstrip("."))
+                }
+            except (IndexError, ValueError):
+                continue
+        return stats
+    
+    def _read_link_state(self) -> Dict[str, Any]:
+        """Read interface state from sysfs/procfs (file reads and ioctls only)"""
+        interfaces = {}
+        wireless = self._read_wireless_stats()
+        net_root = Path("/sys/class/net")
+        
+        try:
+            names = sorted(entry.name for entry in net_root.iterdir())
+        except OSError:
+            names = []
+        
+        for name in names:
+            # Only physical interfaces (skip lo, tailscale0, docker bridges...)
+            if not (net_root / name / "device").exists():
+                continue
+            operstate = self._read_sysfs(net_root / name / "operstate")
+            carrier = self._read_sysfs(net_root / name / "carrier")
+            is_up = operstate == "up" or (operstate == "unknown" and carrier == "1")
+            info = {
+                "operstate": operstate,
+                "up": is_up,
+                "ip_address": self._read_ipv4(name) if is_up else None,
+                "wireless": name in wireless or (net_root / name / "wireless").exists()
+            }
+            if name in wireless:
+                info.update(wireless[name])
+            interfaces[name] = info
+        
+        # Pick the active interface with the configured priority
+        candidates = [n for n, i in interfaces.items() if i["up"] and i["ip_address"]]
+        wired = [n for n in candidates if not interfaces[n]["wireless"]]
+        wifi = [n for n in candidates if interfaces[n]["wireless"]]
+        ordered = (wired + wifi) if Config.PREFER_ETHERNET else (wifi + wired)
+        active = ordered[0] if ordered else None
+        
+        ssid = None
+        if active:
+            ssid = self._read_ssid(active) if interfaces[active]["wireless"] else "Ethernet"
+        
+        return {
+            "interface": active,
+            "ip_address": interfaces[active]["ip_address"] if active else None,
+            "ssid": ssid,
+            "interfaces": interfaces
+        }
+
+class NetworkStateCache:
+    """Background-refreshed network state snapshot with per-field TTLs (non-blocking reads)"""
+    
+    def __init__(self, manager: "WiFiManager", ttls: Optional[Dict[str, float]] = None):
+        self.manager = manager
+        self.ttls = dict(ttls if ttls is not None else Config.NETWORK_STATE_TTLS)
+        self.values: Dict[str, Dict[str, Any]] = {"connection": {"connected": False}, "wireless": {}, "tailscale": {}}
+        self.updated_at: Dict[str, float] = {field: 0.0 for field in self.ttls}
+        self.refresh_latency_ms: Dict[str, float] = {}
+        self.refresh_count = 0
+        self.refreshers = {
+            "connection": self._refresh_connection,
+            "wireless": self._refresh_wireless,
+            "tailscale": self._refresh_tailscale
+        }
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        """Start the background refresh thread"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop the background refresh thread"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=2)
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Return the latest network state without blocking on any I/O"""
+        now = time.time()
+        with self.lock:
+            snapshot = dict(self.values["connection"])
+            if snapshot.get("connected"):
+                snapshot.update(self.values["wireless"])
+                if Config.ENABLE_TAILSCALE and self.values["tailscale"]:
+                    snapshot["tailscale"] = dict(self.values["tailscale"])
+            refreshed = [ts for ts in self.updated_at.values() if ts > 0]
+            snapshot["updated_at"] = dict(self.updated_at)
+            snapshot["staleness"] = (now - min(refreshed)) if refreshed else None
+            snapshot["refresh_latency_ms"] = dict(self.refresh_latency_ms)
+        return snapshot
+    
+    def _refresh_connection(self) -> Dict[str, Any]:
+        """Connection state from the link monitor cache, or a full check if it is not running"""
+        monitor = self.manager.link_monitor
+        if monitor.running:
+            state = monitor.get_state()
+            return {
+                "connected": state.get("connected", False),
+                "ssid": state.get("ssid"),
+                "ip_address": state.get("ip_address"),
+                "interface": state.get("interface")
+            }
+        
+        connected = self.manager.check_connection()
+        return {
+            "connected": connected,
+            "ssid": self.manager.current_ssid,
+            "ip_address": self.manager.current_ip,
+            "interface": self.manager.current_interface
+        }
+    
+    def _refresh_wireless(self) -> Dict[str, Any]:
+        """Wi-Fi signal/frequency, only queried while wlan0 is the active interface"""
+        with self.lock:
+            interface = self.values["connection"].get("interface")
+        if interface != "wlan0":
+            return {}
+        return self.manager.get_wireless_info()
+    
+    def _refresh_tailscale(self) -> Dict[str, Any]:
+        """Tailscale status (skipped when remote access is disabled)"""
+        if not Config.ENABLE_TAILSCALE:
+            return {}
+        return self.manager.check_tailscale_status()
+    
+    def _refresh_field(self, field: str):
+        """Run one refresher and record its latency"""
+        start = time.monotonic()
+        try:
+            value = self.refreshers[field]()
+        except Exception as e:
+            logger.debug(f"Network state refresh '{field}' failed: {e}")
+            return
+        latency_ms = (time.monotonic() - start) * 1000
+        
+        with self.lock:
+            self.values[field] = value
+            self.updated_at[field] = time.time()
+            self.refresh_latency_ms[field] = latency_ms
+            self.refresh_count += 1
+    
+    def _refresh_loop(self):
+        """Refresh each field when its TTL expires, or early on link monitor changes"""
+        next_due = {field: 0.0 for field in self.ttls}
+        link_version = -1
+        
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+            for field in self.ttls:
+                if now >= next_due[field]:
+                    self._refresh_field(field)
+                    next_due[field] = time.monotonic() + self.ttls[field]
+            
+            timeout = max(0.0, min(next_due.values()) - time.monotonic())
+            monitor = self.manager.link_monitor
+            if monitor.running:
+                new_version = monitor.wait_for_change(link_version, timeout=timeout)
+                if new_version != link_version:
+                    if link_version != -1:
+                        # Link changed - connection and wireless info are stale now
+                        next_due["connection"] = 0.0
+                        next_due["wireless"] = 0.0
+                    link_version = new_version
+            else:
+                self.stop_event.wait(timeout)
+
+class WiFiManager:
+    """Enhanced Wi-Fi management with 5GHz support"""
+    
+    def __init__(self):
+        self.is_connected = False
+        self.current_ip = None
+        self.current_ssid = None
+        self.current_interface = None  # Track active interface (eth0/wlan0)
+        self.connection_attempts = 0
+        self.max_attempts = 3
+        self.monitoring_thread = None
+        self.monitoring_active = False
+        self.last_scan_time = 0
+        self.connectivity_prober = ConnectivityProber()
+        self.link_monitor = LinkMonitor(self.connectivity_prober)
+        self.state_cache = NetworkStateCache(self)
+        
+    def setup_wifi_country(self) -> bool:
+        """Setup Wi-Fi country code for proper 5GHz support"""
+        try:
+            logger.info(f"🌍 Setting Wi-Fi country code to {Config.WIFI_COUNTRY}")
+            
+            # Check if raspi-config is available
+            result = subprocess.run(["sudo", "raspi-config", "nonint", "do_wifi_country", Config.WIFI_COUNTRY], 
+                                  capture_output=True, text=True, timeout=30)
+            
+            if result.returncode == 0:
+                logger.info("✅ Wi-Fi country code set successfully")
+                return True
+            else:
+                logger.warning(f"⚠️  Failed to set country code: {result.stderr}")
+                # Try alternative method using wpa_cli
+                try:
+                    subprocess.run(["sudo", "wpa_cli", "set", "country", Config.WIFI_COUNTRY], 
+                                 capture_output=True, timeout=10)
+                    logger.info("✅ Wi-Fi country set via wpa_cli")
+                    return True
+                except:
+                    logger.warning("⚠️  Could not set Wi-Fi country, continuing anyway")
+                    return False
+                    
+        except Exception as e:
+            logger.error(f"❌ Error setting Wi-Fi country: {e}")
+            return False
+    
+    def check_ethernet_connection(self) -> bool:
+        """Check if Ethernet cable is connected and has internet"""
+        try:
+            # Check if eth0 interface is up
+            result = subprocess.run(["ip", "link", "show", "eth0"], 
+                                  capture_output=True, text=True, timeout=5)
+            
+            if result.returncode != 0:
+                return False
+            
+            # Check if eth0 has an IP address
+            ip_result = subprocess.run(["ip", "addr", "show", "eth0"], 
+                                     capture_output=True, text=True, timeout=5)
+            
+            if "inet " not in ip_result.stdout:
+                return False
+            
+            # Extract IP address from eth0
+            lines = ip_result.stdout.split('\n')
+            for line in lines:
+                if "inet " in line and "127.0.0.1" not in line:
+                    ip_info = line.strip().split()
+                    if ip_info:
+                        eth_ip = ip_info[1].split('/')[0]
+                        
+                        # Test internet connectivity
+                        if self.test_internet_connectivity():
+                            logger.info(f"✅ Ethernet connected with IP: {eth_ip}")
+                            self.current_ip = eth_ip
+                            self.current_interface = "eth0"
+                            self.current_ssid = "Ethernet"
+                            self.is_connected = True
+                            return True
+            
+            return False
+            
+        except Exception as e:
+            logger.debug(f"Ethernet check error: {e}")
+            return False
+    
+    def test_internet_connectivity(self) -> bool:
+        """Test actual internet connectivity with concurrent socket probes"""
+        try:
+            return self.connectivity_prober.probe()
+        except Exception as e:
+            logger.debug(f"Connectivity probe error: {e}")
+            return False
+    
+    def scan_wifi_networks(self) -> List[Dict]:
+        """Scan for available Wi-Fi networks with 5GHz detection"""
+        try:
+            logger.info("🔍 Scanning for Wi-Fi networks...")
+            
+            # Use iwlist to scan networks
+            result = subprocess.run(["sudo", "iwlist", "wlan0", "scan"], 
+                                  capture_output=True, text=True, timeout=15)
+            
+            if result.returncode != 0:
+                logger.warning("⚠️  Failed to scan networks")
+                return []
+            
+            networks = []
+            lines = result.stdout.split('\n')
+            current_network = {}
+            
+            for line in lines:
+                line = line.strip()
+                if "Cell " in line and "Address:" in line:
+                    if current_network:
+                        networks.append(current_network)
+                    current_network = {}
+                elif "ESSID:" in line:
+                    essid = line.split('ESSID:')[1].strip('"')
+                    current_network['ssid'] = essid
+                elif "Frequency:" in line:
+                    freq = line.split('Frequency:')[1].split()[0]
+                    current_network['frequency'] = freq
+                    # Detect 5GHz (5.0+ GHz)
+                    try:
+                        freq_float = float(freq)
+                        current_network['is_5ghz'] = freq_float >= 5.0
+                    except:
+                        current_network['is_5ghz'] = False
+                elif "Quality=" in line:
+                    quality = line.split('Quality=')[1].split()[0]
+                    current_network['quality'] = quality
+            
+            if current_network:
+                networks.append(current_network)
+            
+            # Filter and log networks
+            target_networks = [n for n in networks if n.get('ssid') == Config.WIFI_SSID]
+            
+            if target_networks:
+                for network in target_networks:
+                    freq_info = f"{network.get('frequency', 'Unknown')} {'(5GHz)' if network.get('is_5ghz', False) else '(2.4GHz)'}"
+                    logger.info(f"📶 Found target network: {network.get('ssid')} - {freq_info}")
+            
+            return networks
+            
+        except Exception as e:
+            logger.error(f"❌ Error scanning Wi-Fi networks: {e}")
+            return []
+    
+    def connect_to_wifi(self) -> bool:
+        """Connect to Wi-Fi with 5GHz preference"""
+        try:
+            self.connection_attempts += 1
+            logger.info(f"🔗 Attempting Wi-Fi connection (attempt {self.connection_attempts}/{self.max_attempts})")
+            
+            # Setup country code first
+            self.setup_wifi_country()
+            
+            # Scan networks to check availability
+            networks = self.scan_wifi_networks()
+            target_networks = [n for n in networks if n.get('ssid') == Config.WIFI_SSID]
+            
+            if not target_networks:
+                logger.warning(f"⚠️  Target network '{Config.WIFI_SSID}' not found")
+                if self.connection_attempts < self.max_attempts:
+                    logger.info("🔄 Retrying in 10 seconds...")
+                    time.sleep(10)
+                    return self.connect_to_wifi()
+                return False
+            
+            # Prefer 5GHz network if available
+            preferred_network = None
+            for network in target_networks:
+                if Config.ENABLE_WIFI_5GHZ and network.get('is_5ghz', False):
+                    preferred_network = network
+                    break
+            
+            if not preferred_network:
+                preferred_network = target_networks[0]
+            
+            freq_info = f"{preferred_network.get('frequency', 'Unknown')} {'(5GHz)' if preferred_network.get('is_5ghz', False) else '(2.4GHz)'}"
+            logger.info(f"🎯 Connecting to: {Config.WIFI_SSID} - {freq_info}")
+            
+            # Create wpa_supplicant configuration
+            wpa_config = f"""
+country={Config.WIFI_COUNTRY}
+ctrl_interface=DIR=/var/run/wpa_supplicant GROUP=netdev
+update_config=1
+
+network={{
+    ssid="{Config.WIFI_SSID}"
+    psk="{Config.WIFI_PASSWORD}"
+    key_mgmt=WPA-PSK
+}}
+"""
+            
+            # Write configuration
+            with open('/tmp/wpa_supplicant_temp.conf', 'w') as f:
+                f.write(wpa_config)
+            
+            # Copy to system location
+            subprocess.run(["sudo", "cp", "/tmp/wpa_supplicant_temp.conf", "/etc/wpa_supplicant/wpa_supplicant.conf"], 
+                         timeout=10)
+            
+            # Restart networking
+            logger.info("🔄 Restarting Wi-Fi interface...")
+            subprocess.run(["sudo", "ifconfig", "wlan0", "down"], timeout=10)
+            time.sleep(2)
+            subprocess.run(["sudo", "ifconfig", "wlan0", "up"], timeout=10)
+            time.sleep(5)
+            
+            # Restart wpa_supplicant
+            subprocess.run(["sudo", "systemctl", "restart", "wpa_supplicant"], timeout=15)
+            time.sleep(5)
+            
+            # Request DHCP
+            subprocess.run(["sudo", "dhclient", "wlan0"], timeout=15)
+            
+            # Wait for connection
+            logger.info("⏳ Waiting for connection...")
+            for i in range(30):  # Wait up to 30 seconds
+                if self.check_connection():
+                    logger.info(f"✅ Wi-Fi connected successfully to {self.current_ssid}")
+                    logger.info(f"📍 IP Address: {self.current_ip}")
+                    return True
+                time.sleep(1)
+            
+            logger.warning("⚠️  Wi-Fi connection timeout")
+            return False
+            
+        except Exception as e:
+            logger.error(f"❌ Error connecting to Wi-Fi: {e}")
+            return False
+    
+    def check_connection(self) -> bool:
+        """Check current network connection status with Ethernet priority"""
+        try:
+            # Priority 1: Check Ethernet first
+            if Config.PREFER_ETHERNET and self.check_ethernet_connection():
+                return True
+            
+            # Priority 2: Check Wi-Fi connection
+            result = subprocess.run(["iwgetid", "-r"], capture_output=True, text=True, timeout=5)
+            if result.returncode == 0 and result.stdout.strip():
+                self.current_ssid = result.stdout.strip()
+                self.current_interface = "wlan0"
+                
+                # Get IP address and test connectivity
+                ip_result = subprocess.run(["hostname", "-I"], capture_output=True, text=True, timeout=5)
+                if ip_result.returncode == 0 and ip_result.stdout.strip():
+                    self.current_ip = ip_result.stdout.strip().split()[0]  # First IP
+                    
+                    # Verify internet connectivity
+                    if self.test_internet_connectivity():
+                        self.is_connected = True
+                        return True
+            
+            # No connection found
+            self.is_connected = False
+            self.current_ip = None
+            self.current_ssid = None
+            self.current_interface = None
+            return False
+            
+        except Exception as e:
+            logger.error(f"❌ Error checking connection: {e}")
+            return False
+    
+    def get_connection_info(self) -> Dict[str, Any]:
+        """Get detailed connection information"""
+        if not self.check_connection():
+            return {"connected": False}
+        
+        try:
+            # Get additional network info
+            info = {
+                "connected": True,
+                "ssid": self.current_ssid,
+                "ip_address": self.current_ip
+            }
+            
+            # Get signal strength and frequency
+            info.update(self.get_wireless_info())
+            
+            # Add Tailscale information
+            if Config.ENABLE_TAILSCALE:
+                info["tailscale"] = self.check_tailscale_status()
+            
+            return info
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting connection info: {e}")
+            return {"connected": self.is_connected, "ip_address": self.current_ip}
+    
+    def get_wireless_info(self) -> Dict[str, Any]:
+        """Get Wi-Fi signal strength and frequency for wlan0"""
+        info = {}
+        
+        # Get signal strength
+        try:
+            signal_result = subprocess.run(["iwconfig", "wlan0"], capture_output=True, text=True, timeout=5)
+            if "Signal level" in signal_result.stdout:
+                signal_line = [line for line in signal_result.stdout.split('\n') if "Signal level" in line]
+                if signal_line:
+                    info["signal_strength"] = signal_line[0].split("Signal level=")[1].split()[0]
+        except:
+            pass
+        
+        # Get frequency
+        try:
+            freq_result = subprocess.run(["iwlist", "wlan0", "frequency"], capture_output=True, text=True, timeout=5)
+            if "Current Frequency" in freq_result.stdout:
+                freq_line = [line for line in freq_result.stdout.split('\n') if "Current Frequency" in line]
+                if freq_line:
+                    freq_info = freq_line[0]
+                    info["frequency"] = freq_info
+                    info["is_5ghz"] = "5." in freq_info
+        except:
+            pass
+        
+        return info
+    
+    def start_network_monitoring(self):
+        """Start event-driven network monitoring thread"""
+        if self.monitoring_active:
+            return
+        
+        self.monitoring_active = True
+        self.link_monitor.start()
+        self.state_cache.start()
+        self.monitoring_thread = threading.Thread(target=self._network_monitor_loop, daemon=True)
+        self.monitoring_thread.start()
+        logger.info(f"🔄 Network monitoring started (event-driven, reconnect every {Config.NETWORK_SCAN_INTERVAL}s while down)")
+    
+    def stop_network_monitoring(self):
+        """Stop network monitoring"""
+        self.monitoring_active = False
+        self.state_cache.stop()
+        self.link_monitor.stop()
+        if self.monitoring_thread:
+            self.monitoring_thread.join(timeout=2)
+        logger.info("⏹️ Network monitoring stopped")
+    
+    def _apply_link_state(self, state: Dict[str, Any]):
+        """Mirror the link monitor's cached state into the manager attributes"""
+        self.is_connected = state.get("connected", False)
+        if self.is_connected:
+            self.current_ip = state.get("ip_address")
+            self.current_ssid = state.get("ssid")
+            self.current_interface = state.get("interface")
+        else:
+            self.current_ip = None
+            self.current_ssid = None
+            self.current_interface = None
+    
+    def _network_monitor_loop(self):
+        """Background network monitoring loop driven by link monitor events"""
+        while self.monitoring_active:
+            try:
+                state = self.link_monitor.get_state()
+                self._apply_link_state(state)
+                
+                if state.get("connected"):
+                    # Connected - sleep until the link monitor publishes a change
+                    self.link_monitor.wait_for_change(state["version"])
+                    continue
+                
+                # No connection - attempt to reconnect at the scan interval
+                current_time = time.time()
+                time_since_scan = current_time - self.last_scan_time
+                
+                if time_since_scan >= Config.NETWORK_SCAN_INTERVAL:
+                    logger.info("🔍 No internet connection - attempting reconnection")
+                    self.last_scan_time = current_time
+                    
+                    if self.connect_to_wifi():
+                        logger.info("✅ Wi-Fi connection re-established")
+                    else:
+                        logger.warning(f"⚠️ Failed to reconnect - will retry in {Config.NETWORK_SCAN_INTERVAL} seconds")
+                
+                # Wake early if a link event (e.g. Ethernet plugged in) arrives
+                self.link_monitor.wait_for_change(state["version"], timeout=Config.NETWORK_SCAN_INTERVAL)
+                
+            except Exception as e:
+                logger.error(f"❌ Network monitoring error: {e}")
+                time.sleep(5)
+    
+    def get_network_priority_status(self) -> Dict[str, Any]:
+        """Get detailed network priority and status information"""
+        status = {
+            "ethernet_available": self.check_ethernet_connection() if Config.PREFER_ETHERNET else False,
+            "wifi_available": False,
+            "active_interface": self.current_interface,
+            "connection_priority": "Ethernet -> Wi-Fi -> Scan" if Config.PREFER_ETHERNET else "Wi-Fi -> Scan",
+            "monitoring_active": self.monitoring_active,
+            "last_scan": self.last_scan_time
+        }
+        
+        # Check Wi-Fi separately
+        try:
+            result = subprocess.run(["iwgetid", "-r"], capture_output=True, text=True, timeout=5)
+            status["wifi_available"] = result.returncode == 0 and result.stdout.strip()
+        except:
+            pass
+        
+        return status
+    
+    def check_tailscale_status(self) -> Dict[str, Any]:
+        """Check if Tailscale is installed and running"""
+        try:
+            # Check if tailscale is installed
+            result = subprocess.run(["which", "tailscale"], capture_output=True, timeout=5)
+            if result.returncode != 0:
+                return {"installed": False, "running": False, "ip": None}
+            
+            # Check if tailscale is running
+            status_result = subprocess.run(["sudo", "tailscale", "status", "--json"], 
+                                         capture_output=True, text=True, timeout=10)
+            
+            if status_result.returncode != 0:
+                return {"installed": True, "running": False, "ip": None}
+            
+            # Parse tailscale status
+            try:
+                import json
+                status_data = json.loads(status_result.stdout)
+                
+                # Get tailscale IP
+                tailscale_ip = None
+                if "Self" in status_data and "TailscaleIPs" in status_data["Self"]:
+                    tailscale_ips = status_data["Self"]["TailscaleIPs"]
+                    if tailscale_ips:
+                        tailscale_ip = tailscale_ips[0]  # First IP
+                
+                return {
+                    "installed": True,
+                    "running": status_data.get("BackendState") == "Running",
+                    "ip": tailscale_ip,
+                    "hostname": status_data.get("Self", {}).get("HostName", "unknown"),
+                    "online": status_data.get("Self", {}).get("Online", False)
+                }
+                
+            except json.JSONDecodeError:
+                return {"installed": True, "running": False, "ip": None}
+                
+        except Exception as e:
+            logger.debug(f"Tailscale status check error: {e}")
+            return {"installed": False, "running": False, "ip": None}
+    
+    def install_tailscale(self) -> bool:
+        """Install Tailscale automatically"""
+        try:
+            logger.info("🔧 Installing Tailscale for remote access...")
+            
+            # Download and install tailscale
+            install_cmd = "curl -fsSL https://tailscale.com/install.sh | sh"
+            result = subprocess.run(install_cmd, shell=True, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                logger.error(f"❌ Tailscale installation failed: {result.stderr}")
+                return False
+            
+            logger.info("✅ Tailscale installed successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error installing Tailscale: {e}")
+            return False
+    
+    def setup_tailscale(self) -> bool:
+        """Setup and start Tailscale"""
+        try:
+            tailscale_status = self.check_tailscale_status()
+            
+            # Install if not available and auto-install is enabled
+            if not tailscale_status["installed"] and Config.TAILSCALE_AUTO_INSTALL:
+                if not self.install_tailscale():
+                    return False
+                # Recheck status after installation
+                tailscale_status = self.check_tailscale_status()
+            
+            if not tailscale_status["installed"]:
+                logger.warning("⚠️ Tailscale not installed and auto-install disabled")
+                return False
+            
+            # Start tailscale if not running
+            if not tailscale_status["running"]:
+                logger.info("🚀 Starting Tailscale...")
+                up_result = subprocess.run(["sudo", "tailscale", "up", "--accept-routes"], 
+                                         capture_output=True, text=True, timeout=60)
+                
+                if up_result.returncode != 0:
+                    logger.error(f"❌ Failed to start Tailscale: {up_result.stderr}")
+                    # Show helpful instructions
+                    if "Logged out" in up_result.stderr or "authentication" in up_result.stderr.lower():
+                        logger.info("📋 To complete setup, run: sudo tailscale up")
+                        logger.info("📋 Then follow the login URL in the output")
+                    return False
+            
+            # Verify final status
+            final_status = self.check_tailscale_status()
+            if final_status["running"] and final_status["ip"]:
+                logger.info(f"✅ Tailscale running with IP: {final_status['ip']}")
+                return True
+            else:
+                logger.warning("⚠️ Tailscale setup incomplete - may need manual authentication")
+                return False
+                
+        except Exception as e:
+            logger.error(f"❌ Error setting up Tailscale: {e}")
+            return False
+
+
+_wifi_manager: Optional[WiFiManager] = None
+_wifi_manager_lock = threading.Lock()
+
+
+def get_wifi_manager() -> WiFiManager:
+    """Return the shared WiFiManager, creating it on first use"""
+    global _wifi_manager
+    with _wifi_manager_lock:
+        if _wifi_manager is None:
+            _wifi_manager = WiFiManager()
+        return _wifi_manager
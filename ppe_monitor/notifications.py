@@ -0,0 +1,316 @@
+"""🔔 Discord notification system"""
+
+import json
+import time
+import logging
+import traceback
+from datetime import datetime
+from typing import Callable, Dict, Optional, Any
+
+import requests
+
+from .config import Config
+from . import hardware
+
+logger = logging.getLogger('HailoAI')
+
+
+class DiscordNotifier:
+    """Enhanced Discord notification system with comprehensive logging"""
+    
+    def __init__(self, webhook_url: str):
+        self.webhook_url = webhook_url
+        self.last_notification = 0
+        self.last_image_sent = 0  # Track last image send time
+        self.cooldown_period = Config.NOTIFICATION_COOLDOWN
+        self.image_cooldown = 5  # 5-second cooldown for images
+        self.notification_count = 0
+        self.failed_count = 0
+        self.evidence_built = 0  # evidence images drawn + JPEG-encoded
+        self.evidence_skipped = 0  # evidence never built because the alert/image was not admitted
+        self.evidence_wasted = 0  # evidence built but never uploaded
+        
+        logger.info(f"🔔 Discord Notifier initialized with {self.cooldown_period}s cooldown, {self.image_cooldown}s image cooldown")
+        
+    def admits(self, now: Optional[float] = None) -> bool:
+        """Whether a notification sent now would pass the cooldown (check before building evidence)"""
+        now = time.time() if now is None else now
+        return now - self.last_notification >= self.cooldown_period
+    
+    def admits_image(self, now: Optional[float] = None) -> bool:
+        """Whether an image attached now would pass the image cooldown"""
+        now = time.time() if now is None else now
+        return now - self.last_image_sent >= self.image_cooldown
+    
+    def send_notification(self, message: str, detection_count: int, 
+                         additional_info: Optional[Dict] = None, image_bytes: Optional[bytes] = None, image_name: Optional[str] = None,
+                         evidence: Optional[Callable[[], Optional[bytes]]] = None) -> bool:
+        """Send enhanced notification to Discord with detailed logging
+        
+        `evidence` builds the image bytes lazily; it is only called once the
+        notification and the image are admitted by their cooldowns.
+        """
+        current_time = time.time()
+        
+        # Strict cooldown check
+        time_since_last = current_time - self.last_notification
+        if not self.admits(current_time):
+            logger.info(f"🔒 Notification blocked by cooldown ({time_since_last:.1f}s < {self.cooldown_period}s)")
+            if evidence is not None:
+                self.evidence_skipped += 1
+            elif image_bytes:
+                self.evidence_wasted += 1
+            return False
+        
+        # Additional image cooldown check
+        if (image_bytes or evidence is not None) and image_name:
+            if not self.admits_image(current_time):
+                remaining_time = self.image_cooldown - (current_time - self.last_image_sent)
+                logger.info(f"📸 Image sending blocked by cooldown (wait {remaining_time:.1f}s more)")
+                logger.info(f"📢 Sending notification without image due to cooldown")
+                if evidence is not None:
+                    self.evidence_skipped += 1
+                else:
+                    self.evidence_wasted += 1
+                # Send notification without image if image is blocked by cooldown
+                return self.send_notification(message, detection_count, additional_info, None, None)
+        
+        built = False
+        delivered = False
+        files = None
+        try:
+            # Admitted: only now pay for drawing and encoding the evidence
+            if evidence is not None and image_name:
+                try:
+                    image_bytes = evidence()
+                except Exception as evidence_error:
+                    logger.warning(f"⚠️ Failed to build evidence image, sending text only: {evidence_error}")
+                    image_bytes = None
+                built = image_bytes is not None
+                self.evidence_built += built
+            elif image_bytes and image_name:
+                built = True
+                self.evidence_built += 1
+            
+            # Prepare enhanced embed
+            embed = {
+                "title": "🎧 PPE Violation - Headphone Protection Required",
+                "description": message,
+                "color": 0xff0000,  # Red for safety alert
+                "fields": [
+                    {"name": "⚠️ PPE Violations", "value": str(detection_count), "inline": True},
+                    {"name": "⏰ Detection Time", "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "inline": True},
+                    {"name": "📍 Location", "value": "Raspberry Pi 5 + Hailo AI", "inline": True},
+                    {"name": "📊 Total Alerts", "value": str(self.notification_count + 1), "inline": True},
+                    {"name": "🤖 Detection Engine", "value": "Hailo TOP13" if hardware.hailo_available() else "CPU Fallback", "inline": True},
+                    {"name": "📷 Camera Source", "value": "PiCamera2" if hardware.picamera_available() else "USB/Simulation", "inline": True}
+                ],
+                "footer": {"text": "Hailo AI Ear Protection Monitor v2.1"},
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            # Add additional info if provided
+            if additional_info:
+                for key, value in additional_info.items():
+                    embed["fields"].append({
+                        "name": str(key), 
+                        "value": str(value), 
+                        "inline": True
+                    })
+            
+            # Prepare payload with image support
+            payload = {
+                "username": "⚠️ Safety Monitor Bot",
+                "payload_json": json.dumps({"embeds": [embed]})
+            }
+            
+            # Add image if provided as bytes
+            if image_bytes and image_name:
+                try:
+                    from io import BytesIO
+                    files = {'file': (image_name, BytesIO(image_bytes), 'image/jpeg')}
+                    embed["image"] = {"url": f"attachment://{image_name}"}
+                    payload["payload_json"] = json.dumps({"embeds": [embed]})
+                    logger.info(f"📸 Adding evidence image: {image_name}")
+                except Exception as img_error:
+                    logger.warning(f"⚠️ Failed to prepare image bytes: {img_error}")
+                    files = None
+            
+            logger.info(f"📤 Sending Discord safety alert (attempt {self.notification_count + 1})")
+            
+            # Send notification with limited retry to prevent duplicates
+            max_retries = 1  # Reduced from 3 to 1 to prevent duplicate sends
+            for attempt in range(max_retries):
+                try:
+                    if files:
+                        response = requests.post(
+                            self.webhook_url, 
+                            data=payload,
+                            files=files, 
+                            timeout=15
+                        )
+                    else:
+                        response = requests.post(
+                            self.webhook_url, 
+                            json={"username": payload["username"], "embeds": [embed]}, 
+                            timeout=15,
+                            headers={'Content-Type': 'application/json'}
+                        )
+                    
+                    if response.status_code == 204:
+                        self.last_notification = current_time
+                        if files:  # If image was sent, update image timestamp
+                            self.last_image_sent = current_time
+                            logger.info(f"📸 Image sent successfully, next image available in {self.image_cooldown}s")
+                        self.notification_count += 1
+                        logger.info(f"✅ Discord safety alert sent successfully (#{self.notification_count})")
+                        if files:
+                            logger.info(f"📸 Evidence image uploaded: {image_name} (from memory)")
+                        delivered = True
+                        return True
+                    elif response.status_code == 429:  # Rate limited
+                        logger.warning(f"⏰ Discord rate limited, waiting...")
+                        time.sleep(2)
+                        continue
+                    else:
+                        logger.error(f"❌ Discord notification failed: HTTP {response.status_code}")
+                        logger.error(f"Response: {response.text}")
+                        
+                except requests.exceptions.Timeout:
+                    logger.warning(f"⏰ Discord notification timeout (attempt {attempt + 1}/{max_retries})")
+                    if attempt < max_retries - 1:
+                        time.sleep(1)
+                        continue
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"🌐 Network error: {e}")
+                    break
+            
+            self.failed_count += 1
+            logger.error(f"❌ All notification attempts failed (total failures: {self.failed_count})")
+            return False
+                
+        except Exception as e:
+            self.failed_count += 1
+            logger.error(f"💥 Unexpected error in Discord notification: {e}")
+            logger.error(f"📋 Traceback: {traceback.format_exc()}")
+            return False
+        finally:
+            if built and not (delivered and files):
+                self.evidence_wasted += 1
+            # Clean up BytesIO handles
+            if files:
+                try:
+                    if hasattr(files['file'][1], 'close'):
+                        files['file'][1].close()
+                except:
+                    pass
+    
+    def send_startup_notification(self) -> bool:
+        """Send system startup notification"""
+        message = "�️ Safety Monitoring System is now online and monitoring for PPE compliance!"
+        additional_info = {
+            "🔧 System Status": "Active Monitoring",
+            "🎯 Detection Model": Config.HEF_PATH if hardware.hailo_available() else "CPU Fallback",
+            "📏 Resolution": f"{Config.CAMERA_WIDTH}x{Config.CAMERA_HEIGHT}",
+            "⚡ Detection Threshold": f"{Config.CONFIDENCE_THRESHOLD:.1%}",
+            "🛡️ Monitoring": "PPE Headphones Compliance"
+        }
+        
+        return self.send_notification(message, 0, additional_info)
+    
+    def send_network_notification(self, connection_info: Dict[str, Any]) -> bool:
+        """Send network connection notification with IP address"""
+        if not connection_info.get("connected", False):
+            message = "📶 Network Status: Disconnected"
+            additional_info = {
+                "🔧 Status": "Wi-Fi Disconnected",
+                "⚠️ Issue": "Unable to connect to network",
+                "🔄 Action": "Attempting reconnection"
+            }
+        else:
+            ip_address = connection_info.get("ip_address", "Unknown")
+            ssid = connection_info.get("ssid", Config.WIFI_SSID)
+            
+            # Determine connection type
+            freq_info = connection_info.get("frequency", "")
+            is_5ghz = connection_info.get("is_5ghz", False)
+            connection_type = "5GHz Wi-Fi" if is_5ghz else "2.4GHz Wi-Fi"
+            
+            message = f"📶 Network Connected: {ssid} ({connection_type})"
+            additional_info = {
+                "📍 Local IP": ip_address,
+                "📶 Network": ssid,
+                "🔗 Connection Type": connection_type,
+                "📡 Frequency": freq_info if freq_info else "Unknown",
+                "📊 Signal Strength": connection_info.get("signal_strength", "Unknown"),
+                "✅ Status": "Connected",
+                "🏠 Local SSH": f"ssh pi@{ip_address}" if ip_address != "Unknown" else "N/A"
+            }
+            
+            # Add Tailscale information if available
+            tailscale_info = connection_info.get("tailscale", {})
+            if tailscale_info.get("running") and tailscale_info.get("ip"):
+                additional_info["🌐 Tailscale IP"] = tailscale_info["ip"]
+                additional_info["🔑 Remote SSH"] = f"ssh pi@{tailscale_info['ip']}"
+                additional_info["🌍 Remote Access"] = "Available Worldwide"
+            elif tailscale_info.get("installed"):
+                additional_info["🌐 Tailscale"] = "Installed (Not Running)"
+            else:
+                additional_info["🌐 Tailscale"] = "Not Available"
+        
+        embed = {
+            "title": "🌐 Network Status Update",
+            "description": message,
+            "color": 0x00ff00 if connection_info.get("connected") else 0xff0000,
+            "fields": [],
+            "footer": {"text": "Hailo AI Network Monitor"},
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        # Add fields
+        for key, value in additional_info.items():
+            embed["fields"].append({
+                "name": str(key),
+                "value": str(value),
+                "inline": True
+            })
+        
+        try:
+            payload = {
+                "username": "🌐 Network Monitor Bot",
+                "embeds": [embed]
+            }
+            
+            response = requests.post(
+                self.webhook_url,
+                json=payload,
+                timeout=15,
+                headers={'Content-Type': 'application/json'}
+            )
+            
+            if response.status_code == 204:
+                logger.info("✅ Network notification sent to Discord")
+                return True
+            else:
+                logger.warning(f"⚠️ Discord network notification failed: HTTP {response.status_code}")
+                return False
+                
+        except Exception as e:
+            logger.error(f"❌ Failed to send network notification: {e}")
+            return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get notification statistics"""
+        current_time = time.time()
+        return {
+            "total_sent": self.notification_count,
+            "total_failed": self.failed_count,
+            "success_rate": (self.notification_count / (self.notification_count + self.failed_count) * 100) if (self.notification_count + self.failed_count) > 0 else 0,
+            "last_sent": self.last_notification,
+            "last_image_sent": self.last_image_sent,
+            "next_notification_in": max(0, self.cooldown_period - (current_time - self.last_notification)),
+            "next_image_in": max(0, self.image_cooldown - (current_time - self.last_image_sent)),
+            "evidence_built": self.evidence_built,
+            "evidence_skipped": self.evidence_skipped,
+            "evidence_wasted": self.evidence_wasted
+        }
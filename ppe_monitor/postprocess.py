@@ -0,0 +1,347 @@
+"""🔍 Output decoding, IoU and NMS for YOLO-style detection tensors"""
+
+import logging
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import Config
+from .instrumentation import get_instrumentation
+
+logger = logging.getLogger('HailoAI')
+
+
+def postprocess_output(outputs: List[np.ndarray], 
+                       original_shape: Tuple[int, int]) -> List[Dict]:
+    """Post-process Hailo output to get detections"""
+    detections = []
+    
+    try:
+        logger.debug(f"🔍 Processing {len(outputs)} output tensors")
+        
+        # Assuming YOLO-style output
+        for idx, output in enumerate(outputs):
+            logger.debug(f"   Output {idx} shape: {output.shape}")
+            
+            # Handle different output formats
+            if len(output.shape) == 1:
+                # Calculate grid size based on output size
+                num_classes = len(Config.CLASS_NAMES)
+                elements_per_detection = 5 + num_classes  # x, y, w, h, conf + classes
+                
+                if output.shape[0] % elements_per_detection == 0:
+                    num_detections = output.shape[0] // elements_per_detection
+                    grid_size = int(np.sqrt(num_detections))
+                    
+                    if grid_size * grid_size == num_detections:
+                        output = output.reshape((grid_size, grid_size, elements_per_detection))
+                    else:
+                        # Linear arrangement
+                        output = output.reshape((num_detections, elements_per_detection))
+            
+            # Process detections
+            if len(output.shape) == 3:  # Grid format
+                detections.extend(process_grid_output(output, original_shape))
+            elif len(output.shape) == 2:  # Linear format
+                detections.extend(process_linear_output(output, original_shape))
+        
+        # Apply NMS
+        with get_instrumentation().span("nms"):
+            detections = apply_nms(detections)
+        logger.debug(f"✅ Final detections after NMS: {len(detections)}")
+        
+    except Exception as e:
+        logger.error(f"❌ Error in postprocessing: {e}")
+        logger.error(f"📋 Traceback: {traceback.format_exc()}")
+    
+    return detections
+
+
+def process_grid_output(output: np.ndarray, original_shape: Tuple[int, int]) -> List[Dict]:
+    """Process grid-format output"""
+    detections = []
+    h, w = original_shape
+    grid_h, grid_w, channels = output.shape
+    
+    for i in range(grid_h):
+        for j in range(grid_w):
+            detection = output[i, j]
+            
+            # Extract confidence (objectness)
+            confidence = detection[4]
+            
+            if confidence > Config.CONFIDENCE_THRESHOLD:
+                # Extract bounding box
+                x_center = (detection[0] + j) / grid_w
+                y_center = (detection[1] + i) / grid_h
+                box_w = detection[2]
+                box_h = detection[3]
+                
+                # Convert to pixel coordinates
+                x1 = int((x_center - box_w/2) * w)
+                y1 = int((y_center - box_h/2) * h)
+                x2 = int((x_center + box_w/2) * w)
+                y2 = int((y_center + box_h/2) * h)
+                
+                # Extract class probabilities
+                class_scores = detection[5:]
+                class_id = np.argmax(class_scores)
+                class_confidence = class_scores[class_id]
+                
+                final_confidence = confidence * class_confidence
+                
+                if final_confidence > Config.CONFIDENCE_THRESHOLD:
+                    detections.append({
+                        'bbox': [max(0, x1), max(0, y1), min(w, x2), min(h, y2)],
+                        'confidence': final_confidence,
+                        'class_id': class_id,
+                        'class_name': Config.CLASS_NAMES[class_id] if class_id < len(Config.CLASS_NAMES) else 'unknown'
+                    })
+    
+    return detections
+
+
+def process_linear_output(output: np.ndarray, original_shape: Tuple[int, int]) -> List[Dict]:
+    """Process linear-format output"""
+    detections = []
+    h, w = original_shape
+    
+    for detection in output:
+        confidence = detection[4]
+        
+        if confidence > Config.CONFIDENCE_THRESHOLD:
+            # Extract bounding box (assuming normalized coordinates)
+            x_center = detection[0]
+            y_center = detection[1]
+            box_w = detection[2]
+            box_h = detection[3]
+            
+            # Convert to pixel coordinates
+            x1 = int((x_center - box_w/2) * w)
+            y1 = int((y_center - box_h/2) * h)
+            x2 = int((x_center + box_w/2) * w)
+            y2 = int((y_center + box_h/2) * h)
+            
+            # Extract class probabilities
+            class_scores = detection[5:]
+            class_id = np.argmax(class_scores)
+            class_confidence = class_scores[class_id]
+            
+            final_confidence = confidence * class_confidence
+            
+            if final_confidence > Config.CONFIDENCE_THRESHOLD:
+                detections.append({
+                    'bbox': [max(0, x1), max(0, y1), min(w, x2), min(h, y2)],
+                    'confidence': final_confidence,
+                    'class_id': class_id,
+                    'class_name': Config.CLASS_NAMES[class_id] if class_id < len(Config.CLASS_NAMES) else 'unknown'
+                })
+    
+    return detections
+
+
+def quant_info_of(vstream_info: Any) -> Tuple[float, float]:
+    """(scale, zero point) of an output vstream; float = (uint8 - zero point) * scale"""
+    quant = getattr(vstream_info, "quant_info", None)
+    return float(getattr(quant, "qp_scale", 1.0)), float(getattr(quant, "qp_zp", 0.0))
+
+
+def decode_rows(rows: np.ndarray, original_shape: Tuple[int, int]) -> List[Dict]:
+    """Detections from (N, 5 + classes) normalized float rows (vectorized process_linear_output)"""
+    h, w = original_shape
+    if len(rows) == 0:
+        return []
+    class_ids = np.argmax(rows[:, 5:], axis=1)
+    confidences = rows[:, 4] * rows[np.arange(len(rows)), 5 + class_ids]
+    keep = (rows[:, 4] > Config.CONFIDENCE_THRESHOLD) & (confidences > Config.CONFIDENCE_THRESHOLD)
+    rows, class_ids, confidences = rows[keep], class_ids[keep], confidences[keep]
+    
+    half = rows[:, 2:4] / 2
+    boxes = np.hstack([rows[:, 0:2] - half, rows[:, 0:2] + half]) * np.array([w, h, w, h], dtype=np.float32)
+    boxes = boxes.astype(int)
+    boxes[:, :2] = np.maximum(boxes[:, :2], 0)
+    boxes[:, 2:] = np.minimum(boxes[:, 2:], [w, h])
+    
+    return [{
+        'bbox': box,
+        'confidence': confidence,
+        'class_id': class_id,
+        'class_name': Config.CLASS_NAMES[class_id] if class_id < len(Config.CLASS_NAMES) else 'unknown'
+    } for box, confidence, class_id in zip(boxes.tolist(), confidences.tolist(), class_ids.tolist())]
+
+
+def process_quantized_output(output: np.ndarray, original_shape: Tuple[int, int],
+                             quant: Tuple[float, float]) -> List[Dict]:
+    """Decode a UINT8 output tensor, dequantizing only anchors whose quantized objectness clears the threshold"""
+    scale, zero_point = quant
+    elements = 5 + len(Config.CLASS_NAMES)
+    output = np.asarray(output)
+    if output.ndim == 1 and output.size % elements == 0:
+        num_detections = output.size // elements
+        grid_size = int(np.sqrt(num_detections))
+        if grid_size * grid_size == num_detections:
+            output = output.reshape((grid_size, grid_size, elements))
+        else:
+            output = output.reshape((num_detections, elements))
+    
+    # objectness > threshold  <=>  q > threshold / scale + zero point  (no float pass over every anchor)
+    candidates = np.nonzero(output[..., 4] > Config.CONFIDENCE_THRESHOLD / scale + zero_point)
+    rows = (output[candidates].astype(np.float32) - zero_point) * scale
+    if output.ndim == 3:
+        grid_h, grid_w = output.shape[:2]
+        rows[:, 0] = (rows[:, 0] + candidates[1]) / grid_w
+        rows[:, 1] = (rows[:, 1] + candidates[0]) / grid_h
+    return decode_rows(rows, original_shape)
+
+
+def postprocess_quantized_outputs(outputs: List[np.ndarray], original_shape: Tuple[int, int],
+                                  quants: List[Tuple[float, float]]) -> List[Dict]:
+    """Post-process UINT8 Hailo outputs (candidate-only dequantization) and apply NMS"""
+    detections = []
+    try:
+        for output, quant in zip(outputs, quants):
+            detections.extend(process_quantized_output(output, original_shape, quant))
+        
+        with get_instrumentation().span("nms"):
+            detections = apply_nms(detections)
+    except Exception as e:
+        logger.error(f"❌ Error in quantized postprocessing: {e}")
+        logger.error(f"📋 Traceback: {traceback.format_exc()}")
+    
+    return detections
+
+
+def nms_shape_of(vstream_info: Any) -> Optional[Tuple[int, int]]:
+    """(classes, max boxes per class) if the output vstream carries on-chip NMS results, else None"""
+    order = getattr(getattr(vstream_info, "format", None), "order", None)
+    if order is None or "NMS" not in str(getattr(order, "name", order)):
+        return None
+    nms_shape = getattr(vstream_info, "nms_shape", None)
+    return (int(getattr(nms_shape, "number_of_classes", len(Config.CLASS_NAMES))),
+            int(getattr(nms_shape, "max_bboxes_per_class", 0)))
+
+
+def nms_per_class(output: Any, nms_shape: Tuple[int, int]) -> List[np.ndarray]:
+    """On-chip NMS output as one (k, 5) y1, x1, y2, x2, score array per class
+
+    Accepts the per-class list HailoRT returns for FLOAT32 NMS vstreams (optionally
+    wrapped in a batch of one) or the flat buffer of [count, k * 5 values] per class.
+    """
+    if isinstance(output, (list, tuple)):
+        if len(output) == 1 and isinstance(output[0], (list, tuple)):
+            output = output[0]  # batch of one
+        return [np.asarray(boxes, dtype=np.float32).reshape(-1, 5) for boxes in output]
+    
+    num_classes, max_bboxes = nms_shape
+    buffer = np.asarray(output, dtype=np.float32).ravel()
+    stride = 1 + 5 * max_bboxes if max_bboxes else buffer.size // num_classes
+    per_class = []
+    for class_id in range(num_classes):
+        chunk = buffer[class_id * stride:(class_id + 1) * stride]
+        count = min(int(chunk[0]), (chunk.size - 1) // 5) if chunk.size else 0
+        per_class.append(chunk[1:1 + 5 * count].reshape(-1, 5))
+    return per_class
+
+
+def process_nms_output(output: Any, original_shape: Tuple[int, int], nms_shape: Tuple[int, int]) -> List[Dict]:
+    """Detections from on-chip NMS output (already decoded and suppressed per class on the device)"""
+    h, w = original_shape
+    rows = [np.column_stack([np.full(len(boxes), class_id, dtype=np.float32), boxes])
+            for class_id, boxes in enumerate(nms_per_class(output, nms_shape)) if len(boxes)]
+    if not rows:
+        return []
+    rows = np.concatenate(rows)
+    rows = rows[rows[:, 5] > Config.CONFIDENCE_THRESHOLD]
+    
+    # Normalized y1, x1, y2, x2 -> pixel x1, y1, x2, y2
+    boxes = (rows[:, [2, 1, 4, 3]] * np.array([w, h, w, h], dtype=np.float32)).astype(int)
+    boxes = np.clip(boxes, 0, [w, h, w, h])
+    
+    detections = []
+    for class_id, score, box in zip(rows[:, 0].astype(int).tolist(), rows[:, 5].tolist(), boxes.tolist()):
+        detections.append({
+            'bbox': box,
+            'confidence': score,
+            'class_id': class_id,
+            'class_name': Config.CLASS_NAMES[class_id] if class_id < len(Config.CLASS_NAMES) else 'unknown'
+        })
+    return detections
+
+
+def postprocess_nms_outputs(outputs: List[Any], original_shape: Tuple[int, int],
+                            nms_shapes: List[Optional[Tuple[int, int]]]) -> List[Dict]:
+    """Detections from every on-chip NMS output, highest confidence first (no host-side NMS)"""
+    detections = []
+    try:
+        for output, nms_shape in zip(outputs, nms_shapes):
+            if nms_shape is not None:
+                detections.extend(process_nms_output(output, original_shape, nms_shape))
+    except Exception as e:
+        logger.error(f"❌ Error parsing on-chip NMS output: {e}")
+        logger.error(f"📋 Traceback: {traceback.format_exc()}")
+    
+    detections.sort(key=lambda d: d['confidence'], reverse=True)
+    return detections[:Config.MAX_DETECTIONS_PER_FRAME]
+
+
+def apply_nms(detections: List[Dict], iou_threshold: float = None) -> List[Dict]:
+    """Apply Non-Maximum Suppression"""
+    if not detections:
+        return []
+    
+    if iou_threshold is None:
+        iou_threshold = Config.NMS_THRESHOLD
+    
+    # Sort by confidence
+    detections = sorted(detections, key=lambda x: x['confidence'], reverse=True)
+    
+    keep = []
+    while detections:
+        current = detections.pop(0)
+        keep.append(current)
+        
+        # Remove overlapping detections
+        detections = [det for det in detections 
+                     if calculate_iou(current['bbox'], det['bbox']) < iou_threshold]
+    
+    return keep[:Config.MAX_DETECTIONS_PER_FRAME]
+
+
+def calculate_iou(box1: List[int], box2: List[int]) -> float:
+    """Calculate Intersection over Union"""
+    x1_1, y1_1, x2_1, y2_1 = box1
+    x1_2, y1_2, x2_2, y2_2 = box2
+    
+    # Calculate intersection
+    x1_i = max(x1_1, x1_2)
+    y1_i = max(y1_1, y1_2)
+    x2_i = min(x2_1, x2_2)
+    y2_i = min(y2_1, y2_2)
+    
+    if x2_i <= x1_i or y2_i <= y1_i:
+        return 0.0
+    
+    intersection = (x2_i - x1_i) * (y2_i - y1_i)
+    
+    # Calculate union
+    area1 = (x2_1 - x1_1) * (y2_1 - y1_1)
+    area2 = (x2_2 - x1_2) * (y2_2 - y1_2)
+    union = area1 + area2 - intersection
+    
+    return intersection / union if union > 0 else 0.0
+
+
+def box_iou_matrix(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """Pairwise IoU of (N, 4) and (M, 4) x1, y1, x2, y2 boxes -> (N, M)"""
+    boxes1 = np.asarray(boxes1, dtype=np.float32).reshape(-1, 4)
+    boxes2 = np.asarray(boxes2, dtype=np.float32).reshape(-1, 4)
+    
+    top_left = np.maximum(boxes1[:, None, :2], boxes2[None, :, :2])
+    bottom_right = np.minimum(boxes1[:, None, 2:], boxes2[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    
+    area1 = np.prod(boxes1[:, 2:] - boxes1[:, :2], axis=1)
+    area2 = np.prod(boxes2[:, 2:] - boxes2[:, :2], axis=1)
+    union = area1[:, None] + area2[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
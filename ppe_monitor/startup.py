@@ -0,0 +1,219 @@
+"""⏱️ Concurrent startup orchestration"""
+
+import time
+import logging
+import threading
+import traceback
+from typing import Dict, List, Optional, Any
+
+from .config import Config
+from .network import get_wifi_manager
+from .notifications import DiscordNotifier
+
+logger = logging.getLogger('HailoAI')
+
+
+class StartupOrchestrator:
+    """Runs startup phases concurrently following a dependency graph and records phase timings"""
+    
+    def __init__(self):
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+        self.start_time = None
+        self.started = False
+    
+    def add_task(self, name: str, func, depends_on: Optional[List[str]] = None, critical: bool = False):
+        """Register a startup phase; it starts once all of its dependencies have finished"""
+        if self.started:
+            raise RuntimeError("Cannot add startup tasks after start()")
+        self.tasks[name] = {
+            "func": func,
+            "depends_on": list(depends_on or []),
+            "critical": critical,
+            "status": "pending",  # pending -> running -> ok / failed / error
+            "result": None,
+            "started_at": None,
+            "finished_at": None
+        }
+    
+    def start(self):
+        """Validate the graph and launch every phase whose dependencies are met"""
+        for name, task in self.tasks.items():
+            missing = [dep for dep in task["depends_on"] if dep not in self.tasks]
+            if missing:
+                raise ValueError(f"Startup task '{name}' depends on unknown task(s): {missing}")
+        self._check_cycles()
+        
+        self.start_time = time.monotonic()
+        self.started = True
+        logger.info(f"⏱️ Startup orchestrator launching {len(self.tasks)} phases: {', '.join(self.tasks)}")
+        with self.lock:
+            self._launch_ready()
+    
+    def _check_cycles(self):
+        """Raise ValueError if the dependency graph has a cycle"""
+        visiting, done = set(), set()
+        
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup dependency cycle involving '{name}'")
+            visiting.add(name)
+            for dep in self.tasks[name]["depends_on"]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in self.tasks:
+            visit(name)
+    
+    def _launch_ready(self):
+        """Start pending tasks whose dependencies are finished (lock must be held)"""
+        for name, task in self.tasks.items():
+            if task["status"] != "pending":
+                continue
+            if all(self.tasks[dep]["finished_at"] is not None for dep in task["depends_on"]):
+                task["status"] = "running"
+                task["started_at"] = time.monotonic()
+                threading.Thread(target=self._run_task, args=(name,), name=f"startup-{name}", daemon=True).start()
+    
+    def _run_task(self, name: str):
+        """Run a single phase, record its outcome and release dependents"""
+        task = self.tasks[name]
+        logger.info(f"▶️ Startup phase '{name}' started (+{task['started_at'] - self.start_time:.2f}s)")
+        
+        try:
+            result = task["func"]()
+            status = "ok" if result is not False else "failed"
+        except Exception as e:
+            result = None
+            status = "error"
+            logger.error(f"❌ Startup phase '{name}' raised: {e}")
+            logger.error(f"📋 Traceback: {traceback.format_exc()}")
+        
+        with self.condition:
+            task["result"] = result
+            task["status"] = status
+            task["finished_at"] = time.monotonic()
+            duration = task["finished_at"] - task["started_at"]
+            icon = "✅" if status == "ok" else "⚠️"
+            logger.info(f"{icon} Startup phase '{name}' {status} in {duration:.2f}s")
+            self._launch_ready()
+            self.condition.notify_all()
+    
+    def wait_for(self, names: List[str], timeout: Optional[float] = None) -> bool:
+        """Block until the named phases finish; False if any failed or the wait timed out"""
+        with self.condition:
+            finished = self.condition.wait_for(
+                lambda: all(self.tasks[n]["finished_at"] is not None for n in names), timeout)
+            if not finished:
+                return False
+            return all(self.tasks[n]["status"] == "ok" for n in names)
+    
+    def wait_for_critical(self, timeout: Optional[float] = None) -> bool:
+        """Block until every phase registered as critical has finished successfully"""
+        return self.wait_for([name for name, task in self.tasks.items() if task["critical"]], timeout)
+    
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Block until every phase has finished"""
+        return self.wait_for(list(self.tasks), timeout)
+    
+    def result(self, name: str) -> Any:
+        """Return the value a finished phase produced (None while pending)"""
+        with self.lock:
+            return self.tasks[name]["result"]
+    
+    def elapsed(self) -> float:
+        """Seconds since the orchestrator started"""
+        return time.monotonic() - self.start_time if self.start_time else 0.0
+    
+    def get_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per-phase status, start offset and duration in seconds"""
+        with self.lock:
+            timings = {}
+            for name, task in self.tasks.items():
+                started = task["started_at"]
+                finished = task["finished_at"]
+                timings[name] = {
+                    "status": task["status"],
+                    "depends_on": task["depends_on"],
+                    "start_offset": (started - self.start_time) if started else None,
+                    "duration": (finished - started) if started and finished else None
+                }
+            return timings
+    
+    def log_timings_when_complete(self):
+        """Log phase timings from a background thread once every phase has finished"""
+        def wait_and_log():
+            self.wait_all()
+            self.log_timings()
+        threading.Thread(target=wait_and_log, name="startup-timings", daemon=True).start()
+    
+    def log_timings(self):
+        """Log a summary of startup phase timings"""
+        logger.info("⏱️ STARTUP PHASE TIMINGS")
+        for name, timing in self.get_timings().items():
+            if timing["duration"] is not None:
+                logger.info(f"   {name:<22} {timing['status']:<7} start +{timing['start_offset']:.2f}s, took {timing['duration']:.2f}s")
+            else:
+                logger.info(f"   {name:<22} {timing['status']}")
+
+def register_network_startup_tasks(orchestrator: StartupOrchestrator):
+    """Register network bring-up, state cache, Tailscale, monitoring and network notification phases"""
+    wifi_manager = get_wifi_manager()
+    
+    def bring_up_network() -> bool:
+        # Check current connection with priority system (Ethernet -> Wi-Fi)
+        if wifi_manager.check_connection():
+            interface_info = f"{wifi_manager.current_interface} ({wifi_manager.current_ssid})"
+            logger.info(f"✅ Network connected via: {interface_info}")
+            logger.info(f"📍 IP Address: {wifi_manager.current_ip}")
+            return True
+        
+        logger.info("🔗 No network connection detected - attempting to connect...")
+        if Config.PREFER_ETHERNET and wifi_manager.check_ethernet_connection():
+            logger.info("✅ Ethernet connection established")
+            return True
+        
+        logger.info("🔗 Attempting Wi-Fi connection...")
+        return wifi_manager.connect_to_wifi()
+    
+    def setup_tailscale() -> bool:
+        logger.info("🌐 Setting up Tailscale for remote access...")
+        tailscale_success = wifi_manager.setup_tailscale()
+        if tailscale_success:
+            logger.info("✅ Tailscale remote access enabled")
+        else:
+            logger.warning("⚠️ Tailscale setup incomplete - check logs for details")
+        return tailscale_success
+    
+    def start_state_cache() -> bool:
+        # Cached network state for the dashboard/status readers; must not wait for Tailscale
+        wifi_manager.state_cache.start()
+        return True
+    
+    def start_monitoring() -> bool:
+        # Start network monitoring for continuous connectivity
+        wifi_manager.start_network_monitoring()
+        return True
+    
+    def send_network_notification() -> bool:
+        if not orchestrator.result("network"):
+            logger.warning("⚠️  No network connection available")
+            logger.info(f"🔄 Will continue scanning every {Config.NETWORK_SCAN_INTERVAL} seconds")
+            return False
+        connection_info = wifi_manager.get_connection_info()
+        # Create a temporary Discord notifier for network notification
+        temp_notifier = DiscordNotifier(Config.DISCORD_WEBHOOK)
+        return temp_notifier.send_network_notification(connection_info)
+    
+    orchestrator.add_task("network", bring_up_network)
+    orchestrator.add_task("network_state", start_state_cache, depends_on=["network"])
+    network_deps = ["network"]
+    if Config.ENABLE_TAILSCALE:
+        orchestrator.add_task("tailscale", setup_tailscale, depends_on=["network"])
+        network_deps.append("tailscale")
+    orchestrator.add_task("network_monitoring", start_monitoring, depends_on=network_deps)
+    orchestrator.add_task("network_notification", send_network_notification, depends_on=network_deps)
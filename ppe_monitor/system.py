@@ -0,0 +1,785 @@
+"""🛡️ Main safety monitoring (detection) system"""
+
+import time
+import logging
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+
+import cv2
+import numpy as np
+
+from .config import Config
+from .camera import CameraSystem
+from .inference import HailoInference
+from .notifications import DiscordNotifier
+from .network import get_wifi_manager
+from .instrumentation import FrameTimeline, get_instrumentation
+from . import cascade
+from .zones import ZoneMask
+from .tiling import TiledDetector, tile_budget
+from .association import associate
+from .confirmation import ViolationConfirmer
+from .clips import ClipRecorder
+from .events import EventStore
+
+logger = logging.getLogger('HailoAI')
+
+
+class SafetyMonitoringSystem:
+    """Enhanced main detection system with comprehensive features"""
+    
+    def __init__(self):
+        self.camera_system = None
+        self.hailo_inference = None
+        self.networks: Dict[str, HailoInference] = {}  # every model on the device, "ppe" included
+        self.network_detections: Dict[str, List[Dict]] = {}  # latest detections of secondary networks
+        self.cascade_crops = 0
+        self.zone_mask = None
+        self.tiled_detector = TiledDetector() if Config.TILED_MODE else None
+        self.violation_confirmer = ViolationConfirmer() if Config.CONFIRM_VIOLATIONS else None
+        self.clip_recorder = None
+        self.event_store = None
+        self.discord_notifier = None
+        self.running = False
+        self.frame_count = 0
+        self.detection_count = 0
+        self.total_detections = 0
+        self.fps_counter = 0
+        self.fps_start_time = time.time()
+        self.current_fps = 0.0
+        self.start_time = datetime.now()
+        self.last_stats_log = time.time()
+        self.last_notification_frame = -1  # Track last frame that sent notification
+        self.instrumentation = get_instrumentation()
+        
+    def initialize(self) -> bool:
+        """Initialize all system components with comprehensive error handling"""
+        logger.info("🚀 Initializing Safety Monitoring System...")
+        logger.info("=" * 50)
+        
+        # Initialize camera system
+        logger.info("📷 Step 1: Camera System")
+        if not self.initialize_camera():
+            return False
+        
+        # Initialize AI inference
+        logger.info("\n🤖 Step 2: AI Inference Engine")
+        if not self.initialize_inference():
+            return False
+        
+        # Initialize Discord notifier
+        logger.info("\n🔔 Step 3: Discord Notifications")
+        self.initialize_notifier()
+        self.initialize_clip_recorder()
+        self.initialize_event_store()
+        self.send_startup_notification()
+        
+        self.log_initialization_summary()
+        return True
+    
+    def initialize_camera(self) -> bool:
+        """Initialize the camera system"""
+        self.camera_system = CameraSystem()
+        if not self.camera_system.initialize():
+            logger.error("❌ Failed to initialize camera system")
+            return False
+        return True
+    
+    def initialize_inference(self) -> bool:
+        """Initialize the AI inference engine (HEF load / fallback)"""
+        self.hailo_inference = HailoInference(Config.HEF_PATH)
+        if not self.hailo_inference.initialize():
+            logger.error("❌ Failed to initialize AI inference")
+            return False
+        self.networks = {"ppe": self.hailo_inference}
+        if Config.HAILO_SCHEDULER and not self.hailo_inference.use_fallback:
+            self.initialize_secondary_networks()
+        return True
+    
+    def initialize_secondary_networks(self):
+        """Load the enabled extra HEFs onto the shared, scheduled device (failures are not fatal)"""
+        for name, settings in Config.HAILO_NETWORKS.items():
+            if name == "ppe" or not settings.get("enabled", True):
+                continue
+            hef_path = settings.get("hef")
+            if not hef_path or not Path(hef_path).exists():
+                logger.warning(f"⚠️  Network '{name}' skipped: HEF not found ({hef_path})")
+                continue
+            network = HailoInference(hef_path, network_name=name)
+            network.initialize()
+            if network.use_fallback:
+                logger.warning(f"⚠️  Network '{name}' could not be loaded on the Hailo device")
+                network.cleanup()
+                continue
+            self.networks[name] = network
+            logger.info(f"✅ Network '{name}' sharing the device (every {settings.get('interval', 1)} frame(s))")
+    
+    def get_zone_mask(self, frame: np.ndarray):
+        """Zone mask for this frame size (built once, rebuilt if the resolution changes); None without zones"""
+        if not Config.ZONES:
+            return None
+        if self.zone_mask is None or self.zone_mask.frame_shape != frame.shape[:2]:
+            self.zone_mask = ZoneMask(Config.ZONES, frame.shape[:2])
+        return self.zone_mask
+    
+    def detect(self, frame: np.ndarray) -> List[Dict]:
+        """All models for one frame, restricted to the zones of interest when configured"""
+        zone_mask = self.get_zone_mask(frame)
+        view = zone_mask.crop_frame(frame) if zone_mask else frame
+        
+        # Every model sees the same crop so their coordinates agree (e.g. cascade person boxes)
+        if len(self.networks) > 1:
+            self.run_secondary_networks(view)
+        if Config.CASCADE_MODE:
+            detections = self.cascade_inference(view)
+        elif self.tiled_detector:
+            detections = self.tiled_detector.detect(view, self.hailo_inference)
+        else:
+            detections = self.hailo_inference.inference(view)
+        
+        if zone_mask:
+            with self.instrumentation.span("zones"):
+                detections = zone_mask.filter(zone_mask.to_frame(detections))
+        return detections
+    
+    def cascade_inference(self, frame: np.ndarray) -> List[Dict]:
+        """Person boxes first, then ear/headphone detection on head crops only when people are present"""
+        person_network = Config.CASCADE_PERSON_NETWORK
+        if person_network in self.networks:
+            # Latest boxes of the low-rate person detector (refreshed by run_secondary_networks)
+            people = cascade.person_detections(self.network_detections.get(person_network, []))
+        else:
+            people = cascade.person_detections(self.hailo_inference.inference(frame))
+        if not people:
+            return []
+        
+        detections, crops = cascade.detect_on_heads(frame, people, self.hailo_inference)
+        self.cascade_crops += crops
+        return detections
+    
+    def run_secondary_networks(self, frame: np.ndarray):
+        """Run each secondary network at its configured frame interval"""
+        for name, network in self.networks.items():
+            if network is self.hailo_inference:
+                continue
+            interval = max(1, int(network.network_settings.get("interval", 1)))
+            if self.frame_count % interval == 0:
+                self.network_detections[name] = network.inference(frame)
+    
+    def initialize_notifier(self):
+        """Create the Discord notifier"""
+        if self.discord_notifier is None:
+            self.discord_notifier = DiscordNotifier(Config.DISCORD_WEBHOOK)
+    
+    def initialize_clip_recorder(self):
+        """Start the pre/post-event clip recorder threads (CLIP_RECORDING)"""
+        if Config.CLIP_RECORDING and self.clip_recorder is None:
+            recorder = ClipRecorder()
+            if recorder.start():
+                self.clip_recorder = recorder
+    
+    def initialize_event_store(self):
+        """Start the local SQLite event store writer (ENABLE_EVENT_STORE)"""
+        if Config.ENABLE_EVENT_STORE and self.event_store is None:
+            store = EventStore()
+            if store.start():
+                self.event_store = store
+    
+    def send_startup_notification(self) -> bool:
+        """Send the Discord startup notification"""
+        startup_success = self.discord_notifier.send_startup_notification()
+        if startup_success:
+            logger.info("✅ Startup notification sent to Discord")
+        else:
+            logger.warning("⚠️  Startup notification failed (continuing anyway)")
+        return startup_success
+    
+    def register_startup_tasks(self, orchestrator: "StartupOrchestrator"):
+        """Register camera/model/notification startup phases with the orchestrator"""
+        self.initialize_notifier()
+        self.initialize_clip_recorder()
+        self.initialize_event_store()
+        orchestrator.add_task("camera", self.initialize_camera, critical=True)
+        orchestrator.add_task("model", self.initialize_inference, critical=True)
+        orchestrator.add_task("startup_notification", self.send_startup_notification, depends_on=["network"])
+    
+    def log_initialization_summary(self):
+        """Log the initialized component summary"""
+        logger.info("\n" + "=" * 50)
+        logger.info("🎉 System initialized successfully!")
+        logger.info(f"📷 Camera: {self.camera_system.camera_type}")
+        logger.info(f"🤖 AI Engine: {'Hailo AI' if not self.hailo_inference.use_fallback else 'CPU Fallback'}")
+        logger.info(f"🔔 Discord: {'Enabled' if Config.DISCORD_WEBHOOK else 'Disabled'}")
+        logger.info(f"📏 Resolution: {Config.CAMERA_WIDTH}x{Config.CAMERA_HEIGHT}")
+        logger.info(f"⚡ Confidence: {Config.CONFIDENCE_THRESHOLD:.1%}")
+        logger.info("=" * 50)
+    
+    def draw_detections(self, frame: np.ndarray, detections: List[Dict]) -> np.ndarray:
+        """Draw bounding boxes and labels on frame"""
+        for detection in detections:
+            bbox = detection['bbox']
+            confidence = detection['confidence']
+            class_name = detection['class_name']
+            class_id = detection['class_id']
+            
+            x1, y1, x2, y2 = bbox
+            color = Config.COLORS[class_id % len(Config.COLORS)]
+            
+            # Draw bounding box
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+            
+            # Draw label with background
+            label = f"{class_name}: {confidence:.2f}"
+            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+            
+            # Background for text
+            cv2.rectangle(frame, (x1, y1 - label_size[1] - 10), 
+                         (x1 + label_size[0] + 5, y1), color, -1)
+            
+            # Text
+            cv2.putText(frame, label, (x1 + 2, y1 - 5), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            
+            # Draw center point
+            center_x = (x1 + x2) // 2
+            center_y = (y1 + y2) // 2
+            cv2.circle(frame, (center_x, center_y), 3, color, -1)
+        
+        return frame
+
+    def draw_enhanced_info(self, frame: np.ndarray, current_detections: int) -> np.ndarray:
+        """Draw comprehensive system information on frame"""
+        h, w = frame.shape[:2]
+        
+        # Main info panel (top-left)
+        info_text = [
+            f"FPS: {self.current_fps:.1f}",
+            f"Current: {current_detections}",
+            f"Total: {self.total_detections}",
+            f"Frame: {self.frame_count}",
+            f"Time: {datetime.now().strftime('%H:%M:%S')}"
+        ]
+        
+        # Draw background for info panel
+        panel_height = len(info_text) * 25 + 10
+        cv2.rectangle(frame, (5, 5), (250, panel_height), (0, 0, 0), -1)
+        cv2.rectangle(frame, (5, 5), (250, panel_height), (0, 255, 255), 2)
+        
+        y_offset = 25
+        for i, text in enumerate(info_text):
+            y_pos = y_offset + (i * 25)
+            cv2.putText(frame, text, (10, y_pos), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+        
+        # System status panel (top-right)
+        status_info = [
+            f"{self.hailo_inference.get_inference_stats()['engine']}",
+            f"{self.camera_system.camera_type.title()}",
+            f"Discord: {'ON' if Config.DISCORD_WEBHOOK else 'OFF'}"
+        ]
+        
+        status_x = w - 200
+        cv2.rectangle(frame, (status_x, 5), (w - 5, 85), (0, 0, 0), -1)
+        cv2.rectangle(frame, (status_x, 5), (w - 5, 85), (0, 255, 0), 2)
+        
+        for i, text in enumerate(status_info):
+            y_pos = 25 + (i * 25)
+            cv2.putText(frame, text, (status_x + 5, y_pos), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 0), 1)
+        
+        # Runtime info (bottom)
+        runtime = str(datetime.now() - self.start_time).split('.')[0]
+        runtime_text = f"Runtime: {runtime}"
+        
+        text_size = cv2.getTextSize(runtime_text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
+        cv2.rectangle(frame, (5, h - 35), (text_size[0] + 15, h - 5), (0, 0, 0), -1)
+        cv2.putText(frame, runtime_text, (10, h - 15), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        
+        return frame
+    
+    def log_statistics(self):
+        """Log comprehensive system statistics"""
+        runtime = datetime.now() - self.start_time
+        avg_fps = self.frame_count / runtime.total_seconds() if runtime.total_seconds() > 0 else 0
+        
+        inference_stats = self.hailo_inference.get_inference_stats()
+        discord_stats = self.discord_notifier.get_stats()
+        
+        logger.info("📊 SYSTEM STATISTICS")
+        logger.info(f"   Runtime: {str(runtime).split('.')[0]}")
+        logger.info(f"   Frames processed: {self.frame_count}")
+        logger.info(f"   Average FPS: {avg_fps:.1f}")
+        logger.info(f"   Current FPS: {self.current_fps:.1f}")
+        logger.info(f"   Total detections: {self.total_detections}")
+        logger.info(f"   AI Engine: {inference_stats['engine']}")
+        logger.info(f"   AI Success rate: {inference_stats['success_rate']:.1f}%")
+        if self.tiled_detector:
+            tiles = self.tiled_detector.get_stats()
+            logger.info(f"   Tiles: {tiles['tiles_per_frame']:.1f}/frame of {tiles['tiles']} (budget {tile_budget()})")
+        if self.clip_recorder:
+            clips = self.clip_recorder.get_stats()
+            logger.info(f"   Clips: {clips['clips_written']} saved, ring {clips['ring_frames']} frames / {clips['ring_mb']:.1f} MB, "
+                        f"{clips['frames_dropped']} frames dropped{', recording' if clips['recording'] else ''}")
+        if self.violation_confirmer:
+            confirm = self.violation_confirmer.get_stats()
+            logger.info(f"   Confirmed violations: {confirm['confirmed_frames']}/{confirm['candidate_frames']} frames "
+                        f"({confirm['suppressed_frames']} suppressed, {Config.CONFIRM_K}-of-{Config.CONFIRM_N})")
+        if Config.CASCADE_MODE:
+            logger.info(f"   Cascade: {self.cascade_crops} head crops ({self.cascade_crops / max(1, self.frame_count):.2f}/frame)")
+        if len(self.networks) > 1:
+            for name, network in self.networks.items():
+                stats = network.get_inference_stats()
+                logger.info(f"   Model {name}: {stats['throughput_fps']:.1f} inferences/s, "
+                            f"priority {stats['priority']}, {stats['success_rate']:.1f}% success")
+        next_notification = f", next in {discord_stats['next_notification_in']:.1f}s" if discord_stats['next_notification_in'] > 0 else ""
+        next_image = f", next image in {discord_stats['next_image_in']:.1f}s" if discord_stats['next_image_in'] > 0 else ""
+        logger.info(f"   Discord sent: {discord_stats['total_sent']} ({discord_stats['success_rate']:.1f}% success{next_notification}{next_image})")
+        logger.info(f"   Evidence: {discord_stats['evidence_built']} encoded, {discord_stats['evidence_skipped']} skipped by cooldown, "
+                    f"{discord_stats['evidence_wasted']} wasted")
+        logger.info(f"   Camera: {self.camera_system.camera_type}")
+        
+        # Add network status from the shared snapshot (never blocks the detection loop)
+        wifi_manager = get_wifi_manager()
+        network = wifi_manager.state_cache.get_snapshot()
+        staleness = f", updated {network['staleness']:.0f}s ago" if network.get("staleness") is not None else ""
+        if network.get("connected"):
+            interface = network.get("interface")
+            connection_type = "5GHz" if network.get("is_5ghz") else "2.4GHz" if interface == "wlan0" else "Ethernet"
+            logger.info(f"   Network: {network.get('ssid')} ({connection_type}) via {interface} - {network.get('ip_address')}{staleness}")
+            logger.info(f"   Monitoring: {'✅ Active' if wifi_manager.monitoring_active else '❌ Inactive'}")
+        else:
+            logger.info(f"   Network: Disconnected (auto-retry every {Config.NETWORK_SCAN_INTERVAL}s){staleness}")
+            logger.info(f"   Monitoring: {'✅ Active' if wifi_manager.monitoring_active else '❌ Inactive'}")
+        
+        # Capture -> Discord alert latency
+        alerts = self.instrumentation.get_alert_stats()
+        if alerts["alerts"]:
+            logger.info(f"   Glass-to-alert: p50 {alerts['p50']:.2f}s, p95 {alerts['p95']:.2f}s, p99 {alerts['p99']:.2f}s "
+                        f"({alerts['slo_breaches']}/{alerts['alerts']} over {alerts['slo_seconds']}s SLO)")
+        
+        # Per-stage latency percentiles
+        self.instrumentation.log_summary()
+        
+        # Persist a snapshot for later compliance reports (queued; written by the event store thread)
+        if self.event_store:
+            snapshot = {
+                "frames": self.frame_count,
+                "fps": self.current_fps,
+                "average_fps": avg_fps,
+                "total_detections": self.total_detections,
+                "engine": inference_stats["engine"],
+                "success_rate": inference_stats["success_rate"],
+                "discord": discord_stats
+            }
+            if self.violation_confirmer:
+                snapshot["confirmation"] = self.violation_confirmer.get_stats()
+            if self.clip_recorder:
+                snapshot["clips"] = self.clip_recorder.get_stats()
+            self.event_store.record_stats(snapshot)
+            events = self.event_store.get_stats()
+            logger.info(f"   Event store: {events['written']} rows written in {events['batches']} batches, "
+                        f"{events['queued']} queued, {events['dropped']} dropped")
+    
+    def analyze_compliance(self, detections: List[Dict]) -> Dict[str, Any]:
+        """Apply the PPE compliance rules to one frame's detections"""
+        # Analyze detections for PPE compliance
+        people_detections = [d for d in detections if d['class_name'] == 'people']
+        headphones_detections = [d for d in detections if d['class_name'] == 'headphones']
+        exposed_ear_detections = [d for d in detections if d['class_name'] in ['left_ear', 'right_ear']]
+        
+        if Config.PER_PERSON_COMPLIANCE:
+            return self.analyze_person_compliance(people_detections, headphones_detections, exposed_ear_detections)
+        
+        # Enhanced PPE compliance checking
+        violation_detections = []
+        is_compliant = False
+        
+        # PRIMARY RULE: If people detected WITH headphones = COMPLIANT
+        if len(people_detections) > 0 and len(headphones_detections) > 0:
+            is_compliant = True
+            logger.info(f"✅ PPE COMPLIANT: {len(people_detections)} person(s) with {len(headphones_detections)} headphone(s)")
+        
+        # VIOLATION RULES (only if not compliant)
+        elif not is_compliant:
+            # Case 1: People detected but no headphones
+            if len(people_detections) > 0 and len(headphones_detections) == 0:
+                violation_detections.extend(people_detections)
+                logger.warning(f"⚠️ VIOLATION: {len(people_detections)} person(s) without headphones")
+            
+            # Case 2: Exposed ears without headphones (no people detected)
+            elif len(people_detections) == 0 and len(exposed_ear_detections) > 0 and len(headphones_detections) == 0:
+                violation_detections.extend(exposed_ear_detections)
+                logger.warning(f"⚠️ VIOLATION: {len(exposed_ear_detections)} exposed ear(s) without headphone coverage")
+            
+            # Case 3: Mixed detection - exposed ears + people but no headphones
+            elif len(people_detections) > 0 and len(exposed_ear_detections) > 0 and len(headphones_detections) == 0:
+                violation_detections.extend(people_detections)
+                violation_detections.extend(exposed_ear_detections)
+                logger.warning(f"⚠️ VIOLATION: {len(people_detections)} person(s) + {len(exposed_ear_detections)} exposed ear(s) without headphones")
+        
+        # NO DETECTION case
+        if len(people_detections) == 0 and len(headphones_detections) == 0 and len(exposed_ear_detections) == 0:
+            logger.debug("ℹ️ No relevant objects detected in frame")
+        
+        return {
+            "people": people_detections,
+            "headphones": headphones_detections,
+            "exposed_ears": exposed_ear_detections,
+            "violations": violation_detections,
+            "is_compliant": is_compliant
+        }
+    
+    def analyze_person_compliance(self, people_detections: List[Dict], headphones_detections: List[Dict],
+                                  exposed_ear_detections: List[Dict]) -> Dict[str, Any]:
+        """Per-person rules: every person needs their own headphones; exposed ears nobody covers are violations"""
+        association = associate(people_detections, headphones_detections, exposed_ear_detections)
+        persons = association["persons"]
+        unprotected = [entry for entry in persons if not entry["compliant"]]
+        
+        violation_detections = []
+        for entry in unprotected:
+            violation_detections.append(entry["person"])
+            violation_detections.extend(entry["ears"])
+        violation_detections.extend(association["unassigned_ears"])
+        is_compliant = len(persons) > 0 and not violation_detections
+        
+        if is_compliant:
+            logger.info(f"✅ PPE COMPLIANT: all {len(persons)} person(s) wearing headphones")
+        elif violation_detections:
+            parts = []
+            if unprotected:
+                parts.append(f"{len(unprotected)}/{len(persons)} person(s) without headphones")
+            if association["unassigned_ears"]:
+                parts.append(f"{len(association['unassigned_ears'])} exposed ear(s) outside any person")
+            logger.warning(f"⚠️ VIOLATION: {', '.join(parts)}")
+        elif not headphones_detections:
+            logger.debug("ℹ️ No relevant objects detected in frame")
+        
+        return {
+            "people": people_detections,
+            "headphones": headphones_detections,
+            "exposed_ears": exposed_ear_detections,
+            "violations": violation_detections,
+            "is_compliant": is_compliant,
+            "persons": persons
+        }
+    
+    def process_frame(self) -> bool:
+        """Process single frame, timing the whole frame as the "frame" stage"""
+        self.instrumentation.begin_frame(self.frame_count)
+        try:
+            with self.instrumentation.span("frame"):
+                return self._process_frame()
+        finally:
+            self.instrumentation.end_frame()
+    
+    def _process_frame(self) -> bool:
+        """Process single frame with comprehensive error handling and logging"""
+        instrumentation = self.instrumentation
+        try:
+            # Capture frame
+            with instrumentation.span("capture"):
+                frame = self.camera_system.capture_frame()
+            if frame is None:
+                logger.warning("⚠️  Failed to capture frame")
+                return False
+            
+            # Carry the capture timestamp through to the alert
+            timeline = FrameTimeline(self.frame_count, self.camera_system.last_capture_ns)
+            
+            # Raw frame into the clip ring (downscale + enqueue only; compression is off-thread)
+            if self.clip_recorder:
+                with instrumentation.span("clip_enqueue"):
+                    self.clip_recorder.add_frame(frame)
+            
+            # Run inference (preprocess / infer / postprocess spans are recorded inside)
+            detections = self.detect(frame)
+            timeline.mark("inference")
+            
+            # Analyze detections for PPE compliance
+            with instrumentation.span("compliance"):
+                compliance = self.analyze_compliance(detections)
+            people_detections = compliance["people"]
+            headphones_detections = compliance["headphones"]
+            exposed_ear_detections = compliance["exposed_ears"]
+            violation_detections = compliance["violations"]
+            is_compliant = compliance["is_compliant"]
+            if self.violation_confirmer:
+                # Single-frame blips stop here: no evidence copy/encode or Discord upload
+                with instrumentation.span("confirm"):
+                    violation_detections = self.violation_confirmer.update(violation_detections)
+            timeline.mark("decision")
+            
+            # Count violations only if not compliant
+            current_detection_count = 0 if is_compliant else len(violation_detections)
+            
+            # Update statistics only for violations
+            if current_detection_count > 0 and not is_compliant:
+                self.detection_count += current_detection_count
+                self.total_detections += current_detection_count
+                # Every confirmed frame extends the clip, but a violation is stored once:
+                # when its track is first confirmed (or, unconfirmed, when an alert is admitted)
+                clip_path = self.clip_recorder.trigger() if self.clip_recorder else None
+                if self.event_store:
+                    if self.violation_confirmer:
+                        new_violations = self.violation_confirmer.newly_confirmed
+                    else:
+                        new_violations = violation_detections if self.discord_notifier.admits() else []
+                    if new_violations:
+                        self.event_store.record_violations(new_violations, self.frame_count, clip_path)
+                
+                # Prevent duplicate notifications in same frame
+                if self.last_notification_frame == self.frame_count:
+                    logger.info(f"🔒 Notification already sent for frame {self.frame_count}, skipping")
+                    # Still draw detections and continue processing
+                    frame = self.draw_detections(frame, detections)
+                    frame = self.draw_enhanced_info(frame, current_detection_count)
+                    self.frame_count += 1
+                    return True
+                
+                # Evidence image in memory (no disk saving), built only if the notifier admits it
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                evidence_filename = f"safety_violation_{timestamp}_frame_{self.frame_count}.jpg"
+                
+                def build_evidence(frame=frame, violations=violation_detections, count=current_detection_count):
+                    # Draw violation detections on copy of frame
+                    with instrumentation.span("evidence_draw"):
+                        evidence_frame = self.draw_detections(frame.copy(), violations)
+                        evidence_frame = self.draw_enhanced_info(evidence_frame, count)
+                    
+                    # Convert image to bytes for Discord (no file saving)
+                    with instrumentation.span("encode"):
+                        success_encode, img_encoded = cv2.imencode('.jpg', evidence_frame)
+                    timeline.mark("encode")
+                    if not success_encode:
+                        logger.error("❌ Failed to encode evidence image")
+                        return None
+                    logger.warning(f"⚠️ SAFETY VIOLATION DETECTED! Evidence prepared for Discord: {evidence_filename}")
+                    return img_encoded.tobytes()
+                
+                # Send Discord notification with image
+                violation_types = [d['class_name'] for d in violation_detections]
+                violation_summary = ', '.join(set(violation_types))
+                message = f"🚨 PPE VIOLATION: {current_detection_count} person(s)/ear(s) without proper headphone protection! ({violation_summary})"                
+                additional_info = {
+                    "📊 Frame Number": str(self.frame_count + 1),
+                    "🎯 Current FPS": f"{self.current_fps:.1f}",
+                    "⚠️ Total Violations": str(self.total_detections),
+                    "� People Detected": str(len(people_detections)),
+                    "🎧 Headphones Detected": str(len(headphones_detections)),
+                    "👂 Exposed Ears": str(len(exposed_ear_detections)),
+                    "❌ Violations": violation_summary,
+                    "⏱️ Runtime": str(datetime.now() - self.start_time).split('.')[0],
+                    "📸 Evidence": "Image attached if not rate limited (not saved locally)",
+                    "🔧 Action Required": "Ensure all personnel wear proper headphone PPE"
+                }
+                if clip_path:
+                    additional_info["🎞️ Clip"] = clip_path
+                if "persons" in compliance:
+                    protected = sum(entry["compliant"] for entry in compliance["persons"])
+                    additional_info["🧍 Protected People"] = f"{protected}/{len(compliance['persons'])}"
+                
+                with instrumentation.span("discord"):
+                    success = self.discord_notifier.send_notification(
+                        message, current_detection_count, additional_info, None, evidence_filename,
+                        evidence=build_evidence
+                    )
+                
+                if success:
+                    timeline.mark("alert")
+                    instrumentation.record_alert(timeline)
+                    self.last_notification_frame = self.frame_count  # Mark frame as notified
+                    logger.warning(f"🚨 Discord safety alert sent for {current_detection_count} violations")
+                else:
+                    logger.warning(f"❌ Failed to send Discord notification for frame {self.frame_count}")
+                
+                # Log comprehensive safety violation
+                logger.warning(f"⚠️ PPE VIOLATION: {current_detection_count} person(s)/ear(s) without headphones - {violation_summary} (Frame {self.frame_count})")
+                logger.info(f"📊 Detection Summary: {len(people_detections)} people, {len(headphones_detections)} headphones, {len(exposed_ear_detections)} exposed ears")
+            
+            # Draw detections
+            with instrumentation.span("draw"):
+                frame = self.draw_detections(frame, detections)
+                if self.zone_mask:
+                    frame = self.zone_mask.draw(frame)
+            
+            # Calculate FPS
+            self.fps_counter += 1
+            current_time = time.time()
+            if current_time - self.fps_start_time >= 1.0:
+                self.current_fps = self.fps_counter / (current_time - self.fps_start_time)
+                self.fps_counter = 0
+                self.fps_start_time = current_time
+            
+            # Draw enhanced info
+            with instrumentation.span("draw_info"):
+                frame = self.draw_enhanced_info(frame, current_detection_count)
+            
+            # Display frame (no saving in headless mode)
+            if Config.HEADLESS_MODE:
+                # In headless mode, images are only sent to Discord (not saved locally)
+                if current_detection_count > 0:
+                    logger.info(f"📸 Evidence image sent to Discord (not saved locally)")
+            else:
+                # Normal display mode
+                try:
+                    with instrumentation.span("display"):
+                        cv2.imshow("🎧 Hailo AI - Headphones Detection v2.0", frame)
+                except Exception as display_error:
+                    logger.warning(f"⚠️  Display error: {display_error}")
+                    logger.info("🔄 Switching to headless mode")
+                    Config.HEADLESS_MODE = True
+            
+            self.frame_count += 1
+            
+            # Log statistics periodically (more frequent in headless mode)
+            stats_interval = 10 if Config.HEADLESS_MODE else 30  # 10s in headless, 30s in GUI mode
+            if current_time - self.last_stats_log >= stats_interval:
+                self.log_statistics()
+                self.last_stats_log = current_time
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error processing frame {self.frame_count}: {e}")
+            logger.error(f"📋 Traceback: {traceback.format_exc()}")
+            return False
+    
+    def run(self):
+        """Enhanced main detection loop with comprehensive error handling"""
+        logger.info("🚀 Starting detection system...")
+        if Config.HEADLESS_MODE:
+            logger.info("Running in headless mode - use Ctrl+C to stop")
+        else:
+            logger.info("Press 'q' to quit, 's' for statistics, 't' to record a trace, 'h' for help")
+        logger.info("-" * 60)
+        
+        self.running = True
+        consecutive_failures = 0
+        if Config.TRACE_ON_START_FRAMES > 0:
+            self.instrumentation.start_trace(Config.TRACE_ON_START_FRAMES)
+        max_consecutive_failures = 10
+        
+        try:
+            while self.running:
+                success = self.process_frame()
+                
+                if not success:
+                    consecutive_failures += 1
+                    logger.warning(f"⚠️  Frame processing failed ({consecutive_failures}/{max_consecutive_failures})")
+                    
+                    if consecutive_failures >= max_consecutive_failures:
+                        logger.error("❌ Too many consecutive failures, stopping system")
+                        break
+                    
+                    time.sleep(0.1)  # Brief pause before retry
+                    continue
+                else:
+                    consecutive_failures = 0  # Reset failure counter on success
+                
+                # Check for user input (only in GUI mode)
+                if not Config.HEADLESS_MODE:
+                    key = cv2.waitKey(1) & 0xFF
+                    if key == ord('q'):
+                        logger.info("👋 Exit key 'q' pressed")
+                        break
+                    elif key == ord('s'):
+                        logger.info("📊 Statistics requested ('s' pressed)")
+                        self.log_statistics()
+                    elif key == ord('t'):
+                        self.instrumentation.start_trace()
+                    elif key == ord('h'):
+                        self.show_help()
+                    elif key == 27:  # ESC key
+                        logger.info("👋 ESC key pressed")
+                        break
+                else:
+                    # In headless mode, add small delay
+                    time.sleep(0.033)  # ~30 FPS equivalent delay
+                    
+        except KeyboardInterrupt:
+            logger.info("⚡ System interrupted by user (Ctrl+C)")
+        except Exception as e:
+            logger.error(f"💥 Unexpected error in main loop: {e}")
+            logger.error(f"📋 Full traceback: {traceback.format_exc()}")
+        finally:
+            self.cleanup()
+    
+    def show_help(self):
+        """Show help information"""
+        if Config.HEADLESS_MODE:
+            logger.info("🛡️ HELP - Safety Monitoring (Headless):")
+            logger.info("   Monitoring for people without headphone PPE")
+            logger.info("   Evidence images saved when violations detected")
+            logger.info("   Discord alerts sent with photographic evidence")
+            logger.info("   Use Ctrl+C to stop monitoring")
+            logger.info(f"   kill -USR1 <pid> records a {Config.TRACE_WINDOW_FRAMES}-frame latency trace")
+            logger.info("   Check logs for compliance statistics")
+        else:
+            logger.info("🛡️ HELP - Safety Monitor Controls:")
+            logger.info("   'q' - Stop monitoring system")
+            logger.info("   's' - Show compliance statistics")
+            logger.info(f"   't' - Record a {Config.TRACE_WINDOW_FRAMES}-frame latency trace")
+            logger.info("   'h' - Show this help")
+            logger.info("   'ESC' - Emergency stop monitoring")
+    
+    def cleanup(self):
+        """Comprehensive cleanup of all system resources"""
+        logger.info("🧼 Cleaning up system resources...")
+        self.running = False
+        
+        # Log final statistics
+        logger.info("📊 FINAL STATISTICS:")
+        runtime = datetime.now() - self.start_time
+        logger.info(f"   Total runtime: {str(runtime).split('.')[0]}")
+        logger.info(f"   Total frames: {self.frame_count}")
+        logger.info(f"   Total detections: {self.total_detections}")
+        logger.info(f"   Average FPS: {self.frame_count / runtime.total_seconds():.1f}")
+        self.instrumentation.log_summary()
+        
+        # Cleanup camera
+        if self.camera_system:
+            self.camera_system.cleanup()
+        
+        # Flush the clip being recorded and the queued events
+        if self.clip_recorder:
+            self.clip_recorder.stop()
+        if self.event_store:
+            self.event_store.stop()
+        
+        # Cleanup AI inference (secondary networks first, the shared device goes with the last one)
+        for name, network in self.networks.items():
+            if network is not self.hailo_inference:
+                network.cleanup()
+        if self.hailo_inference:
+            self.hailo_inference.cleanup()
+        
+        # Send shutdown notification
+        if self.discord_notifier:
+            try:
+                shutdown_message = "🛑 Hailo AI Detection System is shutting down"
+                final_stats = {
+                    "⏱️ Total Runtime": str(runtime).split('.')[0],
+                    "📊 Total Frames": str(self.frame_count),
+                    "🔍 Total Detections": str(self.total_detections),
+                    "📊 Average FPS": f"{self.frame_count / runtime.total_seconds():.1f}"
+                }
+                self.discord_notifier.send_notification(shutdown_message, 0, final_stats)
+            except:
+                pass  # Don't fail cleanup if Discord fails
+        
+        # Cleanup OpenCV windows (only if not in headless mode)
+        if not Config.HEADLESS_MODE:
+            try:
+                cv2.destroyAllWindows()
+            except:
+                pass  # Ignore cleanup errors in headless mode
+        
+        logger.info("✅ Safety monitoring system cleanup completed successfully")
+        logger.info("=" * 60)
+        logger.info("🛡️ Thank you for using Hailo AI Safety Monitoring System!")
+        logger.info("📊 Final compliance statistics logged above")
+        logger.info("=" * 60)
@@ -0,0 +1,129 @@
+"""🧩 Tiled high-resolution inference: overlapping model-sized tiles under a per-frame budget"""
+
+import logging
+import math
+from typing import Dict, List, Tuple, Any
+
+import cv2
+import numpy as np
+
+from .config import Config
+from . import postprocess
+from .instrumentation import get_instrumentation
+
+logger = logging.getLogger('HailoAI')
+
+MOTION_DOWNSCALE = 8  # motion is measured on a 1/8 size grayscale frame
+
+
+def tile_grid(frame_shape: Tuple[int, int], tile_size: int, overlap: float) -> List[Tuple[int, int, int, int]]:
+    """Overlapping (x1, y1, x2, y2) tiles covering the frame; edge tiles are aligned to the border"""
+    h, w = frame_shape
+    
+    def starts(length: int) -> List[int]:
+        if length <= tile_size:
+            return [0]
+        step = tile_size * (1 - overlap)
+        count = math.ceil((length - tile_size) / step) + 1
+        return sorted({int(round(v)) for v in np.linspace(0, length - tile_size, count)})
+    
+    return [(x, y, min(w, x + tile_size), min(h, y + tile_size)) for y in starts(h) for x in starts(w)]
+
+
+def tile_budget() -> int:
+    """Tiles per frame: TILE_BUDGET minus the overview slot, but always at least one tile"""
+    return max(1, Config.TILE_BUDGET - int(Config.TILE_INCLUDE_OVERVIEW))
+
+
+class TiledDetector:
+    """Schedules tiles (people and motion first, then the stalest) and merges their boxes through NMS"""
+    
+    def __init__(self):
+        self.frame_shape = None
+        self.tiles: List[Tuple[int, int, int, int]] = []
+        self.last_run = np.zeros(0, dtype=np.int64)
+        self.cache: Dict[int, Tuple[int, List[Dict]]] = {}  # tile -> (frame index, frame-space detections)
+        self.previous_small = None
+        self.frame_index = 0
+        self.tiles_run = 0
+    
+    def _build(self, frame_shape: Tuple[int, int]):
+        self.frame_shape = frame_shape
+        self.tiles = tile_grid(frame_shape, Config.TILE_SIZE, Config.TILE_OVERLAP)
+        self.last_run = np.full(len(self.tiles), -1, dtype=np.int64)
+        self.cache = {}
+        self.previous_small = None
+        logger.info(f"🧩 Tiled inference: {len(self.tiles)} tiles of {Config.TILE_SIZE}px over "
+                    f"{frame_shape[1]}x{frame_shape[0]}, budget {tile_budget()} tiles"
+                    f"{' + overview' if Config.TILE_INCLUDE_OVERVIEW else ''}/frame")
+    
+    def motion_scores(self, frame: np.ndarray) -> np.ndarray:
+        """Mean absolute difference per tile against the previous frame (downscaled grayscale)"""
+        small = cv2.cvtColor(cv2.resize(frame, None, fx=1 / MOTION_DOWNSCALE, fy=1 / MOTION_DOWNSCALE,
+                                        interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        previous, self.previous_small = self.previous_small, small
+        if previous is None or previous.shape != small.shape:
+            return np.zeros(len(self.tiles))
+        diff = cv2.absdiff(small, previous)
+        scores = []
+        for x1, y1, x2, y2 in self.tiles:
+            region = diff[y1 // MOTION_DOWNSCALE:max(y1 // MOTION_DOWNSCALE + 1, y2 // MOTION_DOWNSCALE),
+                          x1 // MOTION_DOWNSCALE:max(x1 // MOTION_DOWNSCALE + 1, x2 // MOTION_DOWNSCALE)]
+            scores.append(float(region.mean()) if region.size else 0.0)
+        return np.array(scores)
+    
+    def select(self, frame: np.ndarray) -> List[int]:
+        """Tile indices to infer this frame: people, then motion, then staleness; one slot kept for the stalest"""
+        motion = self.motion_scores(frame) > Config.TILE_MOTION_THRESHOLD
+        people = np.array([any(d['class_name'] in ("people", "person") for d in self.cache.get(i, (0, []))[1])
+                           for i in range(len(self.tiles))])
+        staleness = self.frame_index - self.last_run
+        budget = min(tile_budget(), len(self.tiles))
+        
+        ranked = sorted(range(len(self.tiles)), key=lambda i: (people[i], motion[i], staleness[i]), reverse=True)
+        selected = ranked[:max(1, budget - 1)]
+        if budget > 1:
+            # Guarantee progress over the whole frame even when people/motion fill the budget
+            remaining = [i for i in range(len(self.tiles)) if i not in selected]
+            if remaining:
+                selected.append(max(remaining, key=lambda i: staleness[i]))
+        return selected
+    
+    def detect(self, frame: np.ndarray, inference: Any) -> List[Dict]:
+        """Detections in frame coordinates from the scheduled tiles, recent cached tiles and the overview"""
+        if self.frame_shape != frame.shape[:2]:
+            self._build(frame.shape[:2])
+        
+        with get_instrumentation().span("tile_select"):
+            selected = self.select(frame)
+        images = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in (self.tiles[i] for i in selected)]
+        if Config.TILE_INCLUDE_OVERVIEW:
+            images.append(frame)  # whole frame, resized by preprocessing: large/near people
+        results = inference.inference_batch(images)
+        
+        for i, detections in zip(selected, results):
+            x1, y1 = self.tiles[i][:2]
+            shifted = [{**d, 'bbox': [d['bbox'][0] + x1, d['bbox'][1] + y1, d['bbox'][2] + x1, d['bbox'][3] + y1]}
+                       for d in detections]
+            self.cache[i] = (self.frame_index, shifted)
+            self.last_run[i] = self.frame_index
+        self.tiles_run += len(selected)
+        
+        merged = results[-1] if Config.TILE_INCLUDE_OVERVIEW else []
+        merged = list(merged)
+        for i, (ran_at, detections) in self.cache.items():
+            if self.frame_index - ran_at <= Config.TILE_CACHE_FRAMES:
+                merged.extend(detections)
+        self.frame_index += 1
+        
+        # Boxes of the same object from overlapping tiles / the overview collapse in NMS
+        with get_instrumentation().span("nms"):
+            return postprocess.apply_nms(merged)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Tiling counters"""
+        return {
+            "tiles": len(self.tiles),
+            "tiles_run": self.tiles_run,
+            "tiles_per_frame": self.tiles_run / self.frame_index if self.frame_index else 0.0
+        }
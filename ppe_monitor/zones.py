@@ -0,0 +1,89 @@
+"""🗺️ Zones of interest: crop-before-inference and mask-based detection filtering"""
+
+import logging
+from typing import Dict, List, Optional, Tuple, Any
+
+import cv2
+import numpy as np
+
+from .config import Config
+
+logger = logging.getLogger('HailoAI')
+
+
+class ZoneMask:
+    """Polygonal zones rasterized once for a frame size
+    
+    Inference runs on the tight bounding crop of all zones; detections are mapped
+    back to frame coordinates and kept when enough of the box lies inside a zone
+    (per-zone integral images make that an O(1) lookup per box).
+    """
+    
+    def __init__(self, zones: List[Dict[str, Any]], frame_shape: Tuple[int, int]):
+        h, w = frame_shape
+        # Zone points are given for the configured camera resolution; scale to the actual frame
+        scale = np.array([w / Config.CAMERA_WIDTH, h / Config.CAMERA_HEIGHT], dtype=np.float32)
+        self.frame_shape = frame_shape
+        self.names: List[str] = []
+        self.polygons: List[np.ndarray] = []
+        self.integrals: List[np.ndarray] = []
+        union = np.zeros((h, w), dtype=np.uint8)
+        for i, zone in enumerate(zones):
+            polygon = np.round(np.asarray(zone["points"], dtype=np.float32) * scale).astype(np.int32)
+            mask = np.zeros((h, w), dtype=np.uint8)
+            cv2.fillPoly(mask, [polygon], 1)
+            self.names.append(zone.get("name", f"zone{i + 1}"))
+            self.polygons.append(polygon)
+            self.integrals.append(cv2.integral(mask))
+            union |= mask
+        
+        ys, xs = np.nonzero(union)
+        if len(xs) == 0:
+            self.crop = (0, 0, w, h)
+        else:
+            margin = Config.ZONE_CROP_MARGIN
+            self.crop = (max(0, int(xs.min()) - margin), max(0, int(ys.min()) - margin),
+                         min(w, int(xs.max()) + 1 + margin), min(h, int(ys.max()) + 1 + margin))
+        x1, y1, x2, y2 = self.crop
+        logger.info(f"🗺️ {len(self.names)} zone(s): inference on {x2 - x1}x{y2 - y1} crop "
+                    f"({(x2 - x1) * (y2 - y1) / (w * h):.0%} of the frame)")
+    
+    def crop_frame(self, frame: np.ndarray) -> np.ndarray:
+        """View of the zones' bounding box (no copy)"""
+        x1, y1, x2, y2 = self.crop
+        return frame[y1:y2, x1:x2]
+    
+    def to_frame(self, detections: List[Dict]) -> List[Dict]:
+        """Shift crop-relative boxes back to frame coordinates"""
+        x, y = self.crop[:2]
+        return [{**d, 'bbox': [d['bbox'][0] + x, d['bbox'][1] + y, d['bbox'][2] + x, d['bbox'][3] + y]}
+                for d in detections]
+    
+    def coverage(self, bbox: List[int]) -> Tuple[Optional[str], float]:
+        """(zone, fraction of the box inside it) for the zone covering most of the box"""
+        h, w = self.frame_shape
+        x1, y1 = min(max(int(bbox[0]), 0), w), min(max(int(bbox[1]), 0), h)
+        x2, y2 = min(max(int(bbox[2]), 0), w), min(max(int(bbox[3]), 0), h)
+        area = (x2 - x1) * (y2 - y1)
+        if area <= 0:
+            return None, 0.0
+        best_name, best = None, 0.0
+        for name, integral in zip(self.names, self.integrals):
+            inside = integral[y2, x2] - integral[y1, x2] - integral[y2, x1] + integral[y1, x1]
+            if inside / area > best:
+                best_name, best = name, inside / area
+        return best_name, best
+    
+    def filter(self, detections: List[Dict]) -> List[Dict]:
+        """Detections with at least ZONE_MIN_OVERLAP of their box inside a zone, tagged with the zone name"""
+        kept = []
+        for d in detections:
+            zone, fraction = self.coverage(d['bbox'])
+            if zone is not None and fraction >= Config.ZONE_MIN_OVERLAP:
+                kept.append({**d, 'zone': zone})
+        return kept
+    
+    def draw(self, frame: np.ndarray) -> np.ndarray:
+        """Outline the zones on the display frame"""
+        cv2.polylines(frame, self.polygons, True, (0, 255, 255), 1)
+        return frame
@@ -0,0 +1,55 @@
+"""🧪 Per-person headphone/ear association"""
+
+import pytest
+
+from ppe_monitor.association import associate
+from ppe_monitor.config import Config
+
+
+@pytest.fixture(autouse=True)
+def association_config(monkeypatch):
+    monkeypatch.setattr(Config, "ASSOCIATION_HEAD_FRACTION", 0.4)
+    monkeypatch.setattr(Config, "ASSOCIATION_HEAD_MARGIN", 0.25)
+    monkeypatch.setattr(Config, "ASSOCIATION_MIN_CONTAINMENT", 0.5)
+
+
+def det(class_name, bbox):
+    return {'class_name': class_name, 'bbox': bbox, 'confidence': 0.9}
+
+
+def test_each_person_gets_own_headphones_and_ears():
+    alice = det("people", [100, 100, 200, 400])
+    bob = det("people", [300, 100, 400, 400])
+    headphones = det("headphones", [120, 100, 180, 150])
+    ears = [det("left_ear", [105, 130, 120, 150]), det("right_ear", [385, 130, 400, 150])]
+    
+    result = associate([alice, bob], [headphones], ears)
+    first, second = result["persons"]
+    assert first["person"] is alice and first["headphones"] == [headphones] and first["ears"] == [ears[0]]
+    assert first["compliant"]
+    # Bob is a violation even though someone else in the frame wears headphones
+    assert second["headphones"] == [] and second["ears"] == [ears[1]]
+    assert not second["compliant"]
+    assert result["unassigned_headphones"] == [] and result["unassigned_ears"] == []
+
+
+def test_parts_below_the_head_band_are_not_assigned():
+    person = det("people", [100, 100, 200, 400])
+    low_headphones = det("headphones", [120, 300, 180, 350])  # held in the hand
+    result = associate([person], [low_headphones], [])
+    assert not result["persons"][0]["compliant"]
+    assert result["unassigned_headphones"] == [low_headphones]
+
+
+def test_loose_ears_covered_by_loose_headphones_are_not_reported():
+    covered = det("left_ear", [510, 510, 530, 530])
+    bare = det("right_ear", [700, 700, 720, 720])
+    headphones = det("headphones", [500, 500, 560, 560])
+    result = associate([], [headphones], [covered, bare])
+    assert result["persons"] == []
+    assert result["unassigned_headphones"] == [headphones]
+    assert result["unassigned_ears"] == [bare]
+
+
+def test_no_detections():
+    assert associate([], [], []) == {"persons": [], "unassigned_headphones": [], "unassigned_ears": []}
@@ -0,0 +1,81 @@
+"""🧪 Clip recorder: trigger paths and the clip memory ceiling"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ppe_monitor.clips import ClipRecorder
+from ppe_monitor.config import Config
+
+
+@pytest.fixture(autouse=True)
+def clip_config(monkeypatch):
+    monkeypatch.setattr(Config, "CLIP_PRE_SECONDS", 1)
+    monkeypatch.setattr(Config, "CLIP_POST_SECONDS", 1)
+    monkeypatch.setattr(Config, "CLIP_FPS", 10)
+    monkeypatch.setattr(Config, "CLIP_MEMORY_MB", 64)
+    monkeypatch.setattr(Config, "CLIP_QUEUE_SIZE", 1000)
+
+
+def feed(recorder, start, count, size=100):
+    """Compressed frames at CLIP_FPS straight into the recorder (no threads)"""
+    for i in range(count):
+        recorder.add_encoded(start + i / Config.CLIP_FPS, b"x" * size)
+
+
+def queued_jobs(recorder):
+    return list(recorder.writes.queue)
+
+
+def test_back_to_back_triggers_share_one_clip(tmp_path):
+    recorder = ClipRecorder(str(tmp_path))
+    feed(recorder, 0.0, 5)
+    first = recorder.trigger(now=0.5)
+    second = recorder.trigger(now=0.55)
+    assert first == second
+    feed(recorder, 0.5, 20)
+    jobs = queued_jobs(recorder)
+    assert [str(job.path) for job in jobs] == [first]
+    assert jobs[0].frames[0][0] == 0.0 and jobs[0].frames[-1][0] >= 1.55  # pre-event frames + extended end
+
+
+def test_trigger_after_a_clip_finished_starts_a_new_clip(tmp_path):
+    recorder = ClipRecorder(str(tmp_path))
+    feed(recorder, 0.0, 5)
+    first = recorder.trigger(now=0.5)
+    feed(recorder, 0.5, 11)  # reaches until = 1.5: the job is handed to the writer
+    assert recorder.job is None
+    # Same millisecond as the finished clip still gets its own file
+    second = recorder.trigger(now=0.5)
+    assert second != first
+    feed(recorder, 1.6, 11)
+    assert [str(job.path) for job in queued_jobs(recorder)] == [first, second]
+
+
+def test_queued_clips_count_against_the_memory_ceiling(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "CLIP_MEMORY_MB", 1)
+    recorder = ClipRecorder(str(tmp_path))  # no writer thread: finished clips stay queued
+    frame_size = 50 * 1024
+    for clip in range(5):
+        start = clip * 10.0
+        recorder.trigger(now=start)
+        feed(recorder, start, 11, frame_size)
+    assert recorder.pending_bytes == sum(job.bytes for job in queued_jobs(recorder))
+    assert recorder.pending_bytes <= recorder.memory_limit // 2
+    assert recorder.ring_bytes + recorder.pending_bytes <= recorder.memory_limit
+    assert recorder.get_stats()["clips_truncated"] >= 1
+
+
+def test_triggered_paths_are_written(tmp_path):
+    recorder = ClipRecorder(str(tmp_path))
+    assert recorder.start()
+    frame = np.zeros((64, 64, 3), dtype=np.uint8)
+    paths = set()
+    for i in range(30):
+        recorder.add_frame(frame, now=i / Config.CLIP_FPS)
+        if i in (12, 13, 26):
+            paths.add(recorder.trigger(now=i / Config.CLIP_FPS))
+    recorder.stop()
+    assert paths and all(Path(path).exists() for path in paths)
+    assert recorder.pending_bytes == 0
@@ -0,0 +1,78 @@
+"""🧪 Temporal violation confirmation (K-of-N frames and the sustained-seconds rule)"""
+
+import pytest
+
+from ppe_monitor.config import Config
+from ppe_monitor.confirmation import ViolationConfirmer
+
+EAR = {'class_name': "left_ear", 'bbox': [100, 100, 120, 120], 'confidence': 0.8, 'zone': "line1"}
+OTHER_EAR = {'class_name': "right_ear", 'bbox': [400, 100, 420, 120], 'confidence': 0.8, 'zone': "line2"}
+
+
+@pytest.fixture(autouse=True)
+def confirm_config(monkeypatch):
+    monkeypatch.setattr(Config, "CONFIRM_K", 3)
+    monkeypatch.setattr(Config, "CONFIRM_N", 5)
+    monkeypatch.setattr(Config, "CONFIRM_SECONDS", 0)
+    monkeypatch.setattr(Config, "CONFIRM_SCOPE", "person")
+    monkeypatch.setattr(Config, "CONFIRM_IOU", 0.3)
+
+
+def run(confirmer, pattern, violation=EAR, step=0.1):
+    """Feed a hit (1) / miss (0) pattern; returns how many violations each frame confirmed"""
+    return [len(confirmer.update([violation] if hit else [], now=i * step)) for i, hit in enumerate(pattern)]
+
+
+def test_k_of_n_frames():
+    assert run(ViolationConfirmer(), [1, 1, 1, 1]) == [0, 0, 1, 1]
+
+
+def test_k_of_n_counts_hits_across_gaps():
+    assert run(ViolationConfirmer(), [1, 0, 1, 0, 1]) == [0, 0, 0, 0, 1]
+
+
+def test_hits_outside_the_window_do_not_count():
+    assert run(ViolationConfirmer(), [1, 0, 0, 0, 0, 1, 1]) == [0] * 7
+
+
+def test_newly_confirmed_only_on_first_confirmation():
+    confirmer = ViolationConfirmer()
+    newly = []
+    for i in range(5):
+        confirmer.update([EAR], now=i * 0.1)
+        newly.append(len(confirmer.newly_confirmed))
+    assert newly == [0, 0, 1, 0, 0]
+
+
+def test_seconds_rule_needs_an_unbroken_run(monkeypatch):
+    monkeypatch.setattr(Config, "CONFIRM_K", 99)  # only the seconds rule can fire
+    monkeypatch.setattr(Config, "CONFIRM_SECONDS", 1.5)
+    # Continuous: confirmed once 1.5 s have passed since the first hit
+    assert run(ViolationConfirmer(), [1] * 20) == [0] * 15 + [1] * 5
+    # A miss every few frames restarts the run, so the violation never confirms
+    assert run(ViolationConfirmer(), [1, 1, 1, 0] * 10) == [0] * 40
+
+
+def test_separate_locations_are_tracked_separately():
+    confirmer = ViolationConfirmer()
+    for i in range(2):
+        confirmer.update([EAR], now=i * 0.1)
+    assert confirmer.update([EAR, OTHER_EAR], now=0.2) == [EAR]
+    assert confirmer.get_stats()["tracks"] == 2
+
+
+def test_zone_scope_merges_locations_in_a_zone(monkeypatch):
+    monkeypatch.setattr(Config, "CONFIRM_SCOPE", "zone")
+    moved = {**EAR, 'bbox': [300, 300, 320, 320]}
+    confirmer = ViolationConfirmer()
+    confirmer.update([EAR], now=0.0)
+    confirmer.update([moved], now=0.1)
+    assert confirmer.update([EAR], now=0.2) == [EAR]
+
+
+def test_tracks_expire_and_stats():
+    confirmer = ViolationConfirmer()
+    run(confirmer, [1, 1, 1, 0, 0, 0, 0, 0])
+    stats = confirmer.get_stats()
+    assert stats["tracks"] == 0
+    assert stats["candidate_frames"] == 3 and stats["confirmed_frames"] == 1 and stats["suppressed_frames"] == 2
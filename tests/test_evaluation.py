@@ -0,0 +1,82 @@
+"""🧪 Known-answer tests for prediction matching and (m)AP"""
+
+import numpy as np
+import pytest
+
+from ppe_monitor.config import Config
+from ppe_monitor.evaluation import IOU_THRESHOLDS, ap_per_class, average_precision, evaluate_split, match_predictions
+
+BOX = [10, 10, 110, 110]
+
+
+def boxes(*rows):
+    return np.array(rows, dtype=np.float32).reshape(-1, 4)
+
+
+def classes(*values):
+    return np.array(values, dtype=int)
+
+
+def test_perfect_prediction_has_ap_one():
+    correct = match_predictions(boxes(BOX), classes(0), boxes(BOX), classes(0))
+    assert correct.shape == (1, len(IOU_THRESHOLDS)) and correct.all()
+    stats = ap_per_class(correct, np.array([0.9]), classes(0), classes(0), num_classes=2)
+    np.testing.assert_allclose(stats["ap"][0], 1.0)
+    assert stats["precision"][0] == 1.0 and stats["recall"][0] == 1.0
+
+
+def test_class_mismatch_does_not_match():
+    assert not match_predictions(boxes(BOX), classes(1), boxes(BOX), classes(0)).any()
+
+
+def test_iou_threshold_columns():
+    # IoU 0.81: a hit up to the 0.8 threshold, a miss from 0.85 on
+    shifted = [10, 10, 110, 91]
+    correct = match_predictions(boxes(shifted), classes(0), boxes(BOX), classes(0))
+    np.testing.assert_array_equal(correct[0], IOU_THRESHOLDS <= 0.8 + 1e-9)
+
+
+def test_duplicates_are_one_true_positive_and_false_positives():
+    correct = match_predictions(boxes(BOX, BOX, BOX), classes(0, 0, 0), boxes(BOX), classes(0))
+    assert correct[:, 0].tolist() == [True, False, False]
+    assert (correct.sum(axis=0) == 1).all()
+    stats = ap_per_class(correct, np.array([0.9, 0.8, 0.7]), classes(0, 0, 0), classes(0), num_classes=1)
+    # The true positive ranks first, so AP stays 1.0 while precision over all detections drops
+    assert stats["ap"][0, 0] == pytest.approx(1.0)
+    assert stats["precision"][0] == pytest.approx(1 / 3) and stats["recall"][0] == 1.0
+
+
+def test_each_ground_truth_goes_to_its_best_prediction():
+    gt = boxes([0, 0, 100, 100], [60, 0, 160, 100])
+    pred = boxes([0, 0, 100, 100], [55, 0, 155, 100])
+    correct = match_predictions(pred, classes(0, 0), gt, classes(0, 0))
+    assert correct[:, 0].tolist() == [True, True]
+
+
+def test_101_point_ap_when_recall_stops_partway():
+    # Recall 0.5 at precision 1.0: recall points 0.00..0.50 score 1, the other 50 score 0
+    assert average_precision(np.array([0.5]), np.array([1.0])) == pytest.approx(51 / 101)
+    # Envelope: precision 1.0 up to recall 0.5, then 0.5 up to recall 1.0
+    assert average_precision(np.array([0.5, 1.0]), np.array([1.0, 0.5])) == pytest.approx((51 + 50 * 0.5) / 101)
+    
+    correct = match_predictions(boxes(BOX), classes(0), boxes(BOX, [300, 300, 400, 400]), classes(0, 0))
+    stats = ap_per_class(correct, np.array([0.9]), classes(0), classes(0, 0), num_classes=1)
+    assert stats["ap"][0, 0] == pytest.approx(51 / 101) and stats["recall"][0] == 0.5
+
+
+def test_class_without_ground_truth_is_nan_and_left_out_of_map(monkeypatch):
+    monkeypatch.setattr(Config, "CLASS_NAMES", ["headphones", "left_ear"])
+    
+    class FixedInference:
+        def inference(self, image):
+            return [{'bbox': BOX, 'class_id': 0, 'confidence': 0.9},
+                    {'bbox': [200, 200, 250, 250], 'class_id': 1, 'confidence': 0.8}]  # no left_ear labels
+    
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    results = evaluate_split(FixedInference(), [("a.jpg", image, boxes(BOX), classes(0))])
+    assert results["classes"]["left_ear"]["ap50"] is None and results["classes"]["left_ear"]["instances"] == 0
+    assert results["classes"]["headphones"]["ap50"] == pytest.approx(1.0)
+    assert results["map50"] == pytest.approx(1.0) and results["map50_95"] == pytest.approx(1.0)
+    
+    stats = ap_per_class(np.ones((1, len(IOU_THRESHOLDS)), dtype=bool), np.array([0.9]), classes(0), classes(0), 2)
+    assert np.isnan(stats["ap"][1]).all()
@@ -0,0 +1,86 @@
+"""🧪 Event store: batched writes, queries, retention pruning and summaries"""
+
+import time
+
+import pytest
+
+from ppe_monitor.config import Config
+from ppe_monitor.events import EventStore
+
+HOUR = 3600
+BASE = 1_700_000_000 // HOUR * HOUR  # a whole hour, so by_hour buckets are predictable
+
+
+def violation(class_name="left_ear", bbox=(10, 20, 30, 40), zone=None):
+    return {'class_name': class_name, 'bbox': list(bbox), 'confidence': 0.75, 'zone': zone}
+
+
+@pytest.fixture(autouse=True)
+def event_config(monkeypatch):
+    monkeypatch.setattr(Config, "EVENT_FLUSH_INTERVAL", 0.05)
+    monkeypatch.setattr(Config, "EVENT_RETENTION_DAYS", 90)
+    monkeypatch.setattr(Config, "EVENT_PRUNE_INTERVAL", 3600)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "events.db")
+
+
+def make_store(db, camera="camera1"):
+    store = EventStore(db, camera)
+    store.last_prune = time.time()  # keep the writer from pruning the fixed-time rows
+    assert store.start()
+    return store
+
+
+def test_round_trip(db):
+    store = make_store(db)
+    store.record_violations([violation(zone="line1"), violation("right_ear", (50, 60, 70, 80))],
+                            frame=7, evidence="alert.jpg", timestamp=BASE + 10)
+    store.record_stats({"fps": 29.5, "frames": 100}, timestamp=BASE + 20)
+    store.stop()
+    
+    rows = store.query_violations(BASE, BASE + HOUR)
+    assert [(r['class_name'], r['x1'], r['y1'], r['x2'], r['y2']) for r in rows] == \
+        [("left_ear", 10, 20, 30, 40), ("right_ear", 50, 60, 70, 80)]
+    assert rows[0]['camera'] == "camera1" and rows[0]['frame'] == 7 and rows[0]['zone'] == "line1"
+    assert rows[0]['evidence'] == "alert.jpg" and rows[0]['confidence'] == pytest.approx(0.75)
+    assert store.query_violations(BASE + 11, BASE + HOUR) == []
+    assert store.query_stats(BASE, BASE + HOUR) == [{"ts": BASE + 20, "camera": "camera1", "fps": 29.5, "frames": 100}]
+    assert store.get_stats()["written"] == 3 and store.get_stats()["dropped"] == 0
+
+
+def test_prune_deletes_rows_past_retention(db):
+    now = time.time()
+    store = make_store(db)
+    store.record_violations([violation()], timestamp=now - 91 * 86400)
+    store.record_violations([violation()], timestamp=now - 60)
+    store.record_stats({"fps": 1}, timestamp=now - 91 * 86400)
+    store.stop()
+    assert len(store.query_violations(0, now + 1)) == 2
+    
+    store.prune()
+    assert [r['ts'] for r in store.query_violations(0, now + 1)] == [pytest.approx(now - 60)]
+    assert store.query_stats(0, now + 1) == []
+    assert store.get_stats()["pruned"] == 2
+
+
+def test_summary_by_class_and_hour_with_camera_filter(db):
+    store_a = make_store(db, "a")
+    store_b = make_store(db, "b")
+    store_a.record_violations([violation(), violation()], timestamp=BASE + 5)
+    store_a.record_violations([violation("right_ear")], timestamp=BASE + HOUR + 5)
+    store_b.record_violations([violation()], timestamp=BASE + 5)
+    store_a.stop()
+    store_b.stop()
+    
+    everything = store_a.summary(BASE, BASE + 2 * HOUR)
+    assert {(r['camera'], r['class_name'], r['count']) for r in everything["by_class"]} == \
+        {("a", "left_ear", 2), ("a", "right_ear", 1), ("b", "left_ear", 1)}
+    assert [(r['hour'], r['count']) for r in everything["by_hour"]] == [(BASE, 3), (BASE + HOUR, 1)]
+    
+    only_b = store_a.summary(BASE, BASE + 2 * HOUR, camera="b")
+    assert [(r['camera'], r['class_name'], r['count']) for r in only_b["by_class"]] == [("b", "left_ear", 1)]
+    assert [(r['hour'], r['count']) for r in only_b["by_hour"]] == [(BASE, 1)]
+    assert [r['camera'] for r in store_a.query_violations(BASE, BASE + 2 * HOUR, camera="b")] == ["b"]
@@ -0,0 +1,106 @@
+"""🧪 Latency histograms, Chrome trace export and frame timelines"""
+
+import json
+import threading
+
+import pytest
+
+from ppe_monitor.config import Config
+from ppe_monitor.instrumentation import FrameTimeline, Instrumentation, LatencyHistogram, TraceRecorder
+
+
+def test_histogram_buckets_are_upper_bounds():
+    histogram = LatencyHistogram(buckets=(0.001, 0.01))
+    for seconds in (0.0005, 0.001, 0.002, 0.01, 5.0):
+        histogram.add(seconds)
+    snapshot = histogram.snapshot()
+    # A sample equal to a bound falls in that bucket (Prometheus "le"); the rest go to +Inf
+    assert snapshot["buckets"] == [(0.001, 2), (0.01, 2), (float("inf"), 1)]
+    assert snapshot["count"] == 5 and snapshot["max"] == 5.0
+    assert snapshot["sum"] == pytest.approx(5.0135) and snapshot["mean"] == pytest.approx(5.0135 / 5)
+
+
+def test_histogram_percentiles_nearest_rank():
+    histogram = LatencyHistogram()
+    for value in range(101):
+        histogram.add(value / 1000)
+    assert histogram.percentiles() == {"p50": 0.050, "p95": 0.095, "p99": 0.099}
+    assert LatencyHistogram().percentiles() == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+
+def test_histogram_percentiles_use_the_rolling_window():
+    histogram = LatencyHistogram(window=10)
+    for value in range(100):
+        histogram.add(float(value))
+    assert histogram.count == 100
+    assert histogram.percentiles((0, 100)) == {"p0": 90.0, "p100": 99.0}
+
+
+def test_trace_recorder_writes_chrome_json(tmp_path):
+    recorder = TraceRecorder(str(tmp_path), frames=3)
+    start = recorder.origin_ns + 2_000_000
+    recorder.add_span("infer", start, start + 1_500_000, {"frame": 7})
+    recorder.add_span("nms", start + 1_500_000, start + 1_600_000)
+    path = recorder.dump()
+    
+    assert path.parent == tmp_path and path.name.endswith("_3f.json")
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    events = trace["traceEvents"]
+    metadata = [e for e in events if e["ph"] == "M"]
+    assert {e["name"] for e in metadata} == {"process_name", "thread_name"}
+    infer, nms = [e for e in events if e["ph"] == "X"]
+    # Chrome trace timestamps and durations are microseconds
+    assert (infer["name"], infer["ts"], infer["dur"], infer["args"]) == ("infer", 2000.0, 1500.0, {"frame": 7})
+    assert nms["ts"] == 3500.0 and nms["dur"] == pytest.approx(100.0) and "args" not in nms
+    assert infer["tid"] == metadata[1]["tid"]
+
+
+def test_frame_timeline_marks():
+    timeline = FrameTimeline(42, capture_ns=1_000_000_000)
+    assert timeline.since_capture("alert") is None
+    timeline.mark("inference")
+    assert timeline.since_capture("inference") > 0
+    timeline.marks["alert"] = 1_250_000_000
+    assert timeline.since_capture("alert") == pytest.approx(0.25)
+
+
+def test_record_alert_counts_slo_breaches(monkeypatch):
+    monkeypatch.setattr(Config, "ALERT_LATENCY_SLO", 0.5)
+    instrumentation = Instrumentation(enabled=True)
+    for latency_ms in (250, 750):
+        timeline = FrameTimeline(1, capture_ns=1_000_000_000)
+        timeline.marks["decision"] = 1_100_000_000
+        timeline.marks["alert"] = 1_000_000_000 + latency_ms * 1_000_000
+        assert instrumentation.record_alert(timeline) == pytest.approx(latency_ms / 1000)
+    stats = instrumentation.get_alert_stats()
+    assert stats["alerts"] == 2 and stats["slo_breaches"] == 1 and stats["last_latency"] == pytest.approx(0.75)
+    assert instrumentation.get_stats()["glass_to_decision"]["count"] == 2
+
+
+def test_disabled_spans_record_nothing():
+    instrumentation = Instrumentation(enabled=False)
+    with instrumentation.span("infer"):
+        pass
+    assert instrumentation.get_stats() == {}
+
+
+def test_requested_trace_covers_the_next_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TRACE_OUTPUT_DIR", str(tmp_path))
+    instrumentation = Instrumentation(enabled=True)
+    instrumentation.request_trace(2)
+    assert instrumentation.trace is None  # only started by the frame loop
+    for frame in range(3):
+        instrumentation.begin_frame(frame)
+        with instrumentation.span("infer"):
+            pass
+        instrumentation.end_frame()
+    assert instrumentation.trace is None
+    
+    for thread in threading.enumerate():
+        if thread.name == "trace-writer":
+            thread.join(5)
+    (path,) = tmp_path.glob("trace_*.json")
+    spans = [e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == "X"]
+    assert [e["args"]["frame"] for e in spans] == [0, 1]
+    assert instrumentation.get_stats()["infer"]["count"] == 3
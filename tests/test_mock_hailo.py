@@ -0,0 +1,27 @@
+"""🧪 Recording device outputs for mock replay, with single and batched infer() calls"""
+
+import numpy as np
+import pytest
+
+from ppe_monitor.mock_hailo import MockHEF, MockNetworkGroup, MockProfile, OutputRecorder
+
+
+@pytest.mark.parametrize("output_format", ["grid", "nms"])
+def test_batched_calls_are_recorded_per_image(tmp_path, output_format):
+    profile = MockProfile(latency_ms=0, jitter_ms=0, failure_rate=0, seed=1, output_format=output_format)
+    network_group = MockNetworkGroup(MockHEF("model.hef", profile))
+    path = tmp_path / "outputs.npz"
+    recorder = OutputRecorder(network_group, str(path), 5, profile.input_shape, profile.nms_shapes, profile.quant)
+    
+    image = np.zeros(profile.input_shape, dtype=np.uint8)
+    recorder.infer([image])
+    recorder.infer([np.stack([image] * 3)])
+    assert not path.exists()
+    recorder.infer([np.stack([image] * 3)])  # only the first frame of this batch fits the limit
+    assert path.exists() and len(recorder.frames) == 5
+    
+    replay = MockProfile(recording=str(path))
+    assert len(replay.recorded[0]) == 5
+    assert replay.input_shape == profile.input_shape
+    assert [tuple(shape) for shape in replay.output_shapes] == [tuple(shape) for shape in profile.output_shapes]
+    assert replay.nms_shapes == profile.nms_shapes
@@ -0,0 +1,76 @@
+"""🧪 Postprocess helpers: pairwise box IoU and candidate-only UINT8 decoding"""
+
+import numpy as np
+import pytest
+
+from ppe_monitor.config import Config
+from ppe_monitor.postprocess import box_iou_matrix, calculate_iou, process_quantized_output
+
+SCALE = 1 / 255
+
+
+def test_box_iou_matrix_values():
+    iou = box_iou_matrix([[0, 0, 10, 10], [100, 100, 110, 110]], [[0, 0, 10, 10], [5, 0, 15, 10], [50, 50, 60, 60]])
+    assert iou.shape == (2, 3)
+    np.testing.assert_allclose(iou[0], [1.0, 1 / 3, 0.0], rtol=1e-6)
+    np.testing.assert_allclose(iou[1], [0.0, 0.0, 0.0])
+
+
+def test_box_iou_matrix_matches_calculate_iou():
+    rng = np.random.default_rng(0)
+    corners = rng.integers(0, 200, size=(12, 2, 2))
+    boxes = np.concatenate([corners.min(axis=1), corners.max(axis=1) + 1], axis=1)
+    iou = box_iou_matrix(boxes[:6], boxes[6:])
+    for i in range(6):
+        for j in range(6):
+            assert iou[i, j] == pytest.approx(calculate_iou(boxes[i].tolist(), boxes[6 + j].tolist()), abs=1e-5)
+
+
+def test_box_iou_matrix_empty_and_degenerate():
+    assert box_iou_matrix([], [[0, 0, 10, 10]]).shape == (0, 1)
+    assert box_iou_matrix([[0, 0, 10, 10]], []).shape == (1, 0)
+    # Zero-area boxes give 0, not NaN
+    assert box_iou_matrix([[5, 5, 5, 5]], [[5, 5, 5, 5]])[0, 0] == 0.0
+
+
+def quantized_grid() -> np.ndarray:
+    """2x2 grid with one confident "people" anchor in row 1, column 0 and one weak anchor"""
+    grid = np.zeros((2, 2, 5 + len(Config.CLASS_NAMES)), dtype=np.uint8)
+    grid[1, 0, :5] = [128, 128, 128, 128, 255]  # cell-relative centre 0.5, size ~0.5, objectness 1.0
+    grid[1, 0, 5 + Config.CLASS_NAMES.index("people")] = 255
+    grid[0, 1, :5] = [128, 128, 64, 64, 100]  # objectness ~0.39, below CONFIDENCE_THRESHOLD
+    grid[0, 1, 5] = 255
+    return grid
+
+
+def test_process_quantized_output_grid():
+    detections = process_quantized_output(quantized_grid(), (200, 400), (SCALE, 0.0))
+    assert len(detections) == 1
+    detection = detections[0]
+    assert detection['class_name'] == "people"
+    assert detection['confidence'] == pytest.approx(1.0)
+    # centre (0.25, 0.75), size 128/255 of a 400x200 frame, clipped to the frame
+    np.testing.assert_allclose(detection['bbox'], [0, 99, 200, 200], atol=1)
+
+
+def test_process_quantized_output_flat_grid_matches_3d():
+    grid = quantized_grid()
+    assert process_quantized_output(grid.reshape(-1), (200, 400), (SCALE, 0.0)) == \
+        process_quantized_output(grid, (200, 400), (SCALE, 0.0))
+
+
+def test_process_quantized_output_zero_point():
+    grid = quantized_grid().astype(np.int16) + 10
+    detections = process_quantized_output(np.clip(grid, 0, 255).astype(np.uint8), (200, 400), (SCALE, 10.0))
+    assert [d['class_name'] for d in detections] == ["people"]
+
+
+def test_process_quantized_output_linear_rows():
+    # 3 anchors are not a square grid: rows are already frame-normalized
+    rows = np.zeros((3, 5 + len(Config.CLASS_NAMES)), dtype=np.uint8)
+    rows[2, :5] = [128, 128, 51, 51, 255]
+    rows[2, 5] = 255
+    detections = process_quantized_output(rows.reshape(-1), (100, 100), (SCALE, 0.0))
+    assert len(detections) == 1
+    assert detections[0]['class_name'] == "headphones"
+    np.testing.assert_allclose(detections[0]['bbox'], [40, 40, 60, 60], atol=1)